@@ -5,56 +5,103 @@ Generate token consumption visualization for Agent League System development.
 This script creates a bar chart showing estimated token usage across development phases.
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
+import hashlib
 from pathlib import Path
 
+RESULTS_DIR = Path(__file__).parent.parent / 'results'
+CONSUMPTION_PATH = RESULTS_DIR / 'token_consumption.png'
+TIMELINE_PATH = RESULTS_DIR / 'token_timeline.png'
+HASH_PATH = RESULTS_DIR / '.token_visualization.sha256'
+
+# Output resolution; bar/wedge artists are rasterized so vector exports stay small
+SAVE_DPI = 150
+
 # Development phase token estimates (from docs/COSTS.md)
-phases = {
-    'PreProject': {
-        'input': 50000,
-        'output': 30000,
-        'agents': ['repo-scaffolder', 'prd-author', 'architecture-author',
-                   'readme-author', 'config-security-baseline', 'prompt-log-initializer', 'git-workflow']
-    },
-    'TaskLoop': {
-        'input': 400000,
-        'output': 250000,
-        'agents': ['implementer', 'quality-commenter', 'unit-test-writer',
-                   'edge-case-defender', 'expected-results-recorder', 'readme-updater', 'prompt-log-updater']
-    },
-    'ResearchLoop': {
-        'input': 0,
-        'output': 0,
-        'agents': []  # Not applicable for this project
-    },
-    'ReleaseGate': {
-        'input': 100000,
-        'output': 60000,
-        'agents': ['python-packager', 'building-block-reviewer', 'extensibility-planner',
-                   'quality-standard-mapper', 'final-checklist-gate', 'cost-analyzer']
-    }
-}
-
-def create_token_consumption_chart():
-    """Create and save token consumption visualization."""
-
-    # Prepare data
-    phase_names = list(phases.keys())
-    input_tokens = [phases[p]['input'] for p in phase_names]
-    output_tokens = [phases[p]['output'] for p in phase_names]
-    total_tokens = [phases[p]['input'] + phases[p]['output'] for p in phase_names]
+# Each entry: (phase name, input tokens, output tokens, agents)
+PHASES = (
+    ('PreProject', 50000, 30000,
+     ('repo-scaffolder', 'prd-author', 'architecture-author',
+      'readme-author', 'config-security-baseline', 'prompt-log-initializer', 'git-workflow')),
+    ('TaskLoop', 400000, 250000,
+     ('implementer', 'quality-commenter', 'unit-test-writer',
+      'edge-case-defender', 'expected-results-recorder', 'readme-updater', 'prompt-log-updater')),
+    ('ResearchLoop', 0, 0,
+     ()),  # Not applicable for this project
+    ('ReleaseGate', 100000, 60000,
+     ('python-packager', 'building-block-reviewer', 'extensibility-planner',
+      'quality-standard-mapper', 'final-checklist-gate', 'cost-analyzer')),
+)
+
+# Timeline data: (phase name, total tokens, agent invocations, color)
+TIMELINE = (
+    ('PreProject', 80000, 7, '#3498db'),
+    ('TaskLoop', 650000, 120, '#2ecc71'),
+    ('ResearchLoop', 0, 0, '#f39c12'),
+    ('ReleaseGate', 160000, 9, '#e74c3c'),
+)
+
+
+def _data_hash():
+    """Return a digest of the chart input data and render settings."""
+    return hashlib.sha256(repr((PHASES, TIMELINE, SAVE_DPI)).encode('utf-8')).hexdigest()
+
+
+def _pyplot():
+    """Import pyplot on the headless Agg backend (deferred: matplotlib is slow to import)."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _is_up_to_date(digest):
+    """Check whether both charts exist and were rendered from the same data."""
+    if not (CONSUMPTION_PATH.exists() and TIMELINE_PATH.exists() and HASH_PATH.exists()):
+        return False
+    return HASH_PATH.read_text(encoding='utf-8').strip() == digest
+
+
+def create_token_consumption_chart(force=False):
+    """Create and save token consumption visualization.
+
+    Rendering is skipped when both PNGs already exist and the phase data is
+    unchanged since the last run (tracked via a sidecar hash file).
+
+    Args:
+        force: Re-render even if the outputs are up to date
+    """
+    output_path = CONSUMPTION_PATH
+    digest = _data_hash()
+    if not force and _is_up_to_date(digest):
+        print(f"✓ Visualizations up to date: {output_path}")
+        return output_path
+
+    plt = _pyplot()
+    import numpy as np
+
+    # Prepare data as columns
+    data = np.array([(name, input_val, output_val) for name, input_val, output_val, _ in PHASES],
+                    dtype=[('name', 'U16'), ('input', 'i8'), ('output', 'i8')])
+    phase_names = data['name']
+    input_tokens = data['input']
+    output_tokens = data['output']
+    total_tokens = input_tokens + output_tokens
+    total_input = int(input_tokens.sum())
+    total_output = int(output_tokens.sum())
+    grand_total = total_input + total_output
 
     # Create figure with larger size for readability
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
     fig.suptitle('Agent League System - Development Token Consumption Analysis',
                  fontsize=16, fontweight='bold')
 
     # Chart 1: Stacked bar chart by phase
-    x_pos = range(len(phase_names))
+    x_pos = np.arange(len(phase_names))
     bars1 = ax1.bar(x_pos, input_tokens, label='Input Tokens', color='#3498db', alpha=0.8)
     bars2 = ax1.bar(x_pos, output_tokens, bottom=input_tokens, label='Output Tokens',
                     color='#e74c3c', alpha=0.8)
+    for bar in (*bars1, *bars2):
+        bar.set_rasterized(True)
 
     ax1.set_xlabel('Development Phase', fontsize=12, fontweight='bold')
     ax1.set_ylabel('Tokens', fontsize=12, fontweight='bold')
@@ -65,24 +112,26 @@ def create_token_consumption_chart():
     ax1.grid(axis='y', alpha=0.3, linestyle='--')
 
     # Add value labels on bars
-    for i, (p, input_val, output_val, total) in enumerate(zip(phase_names, input_tokens, output_tokens, total_tokens)):
-        if total > 0:  # Only label non-zero phases
-            ax1.text(i, total + 10000, f'{total:,}', ha='center', va='bottom',
-                    fontweight='bold', fontsize=10)
+    non_zero = total_tokens > 0
+    for i in np.flatnonzero(non_zero):  # Only label non-zero phases
+        total = int(total_tokens[i])
+        ax1.text(i, total + 10000, f'{total:,}', ha='center', va='bottom',
+                 fontweight='bold', fontsize=10)
 
     # Chart 2: Pie chart of total distribution
     # Filter out zero-value phases
-    non_zero_phases = [(name, total) for name, total in zip(phase_names, total_tokens) if total > 0]
-    if non_zero_phases:
-        pie_labels = [name for name, _ in non_zero_phases]
-        pie_values = [total for _, total in non_zero_phases]
+    if non_zero.any():
+        pie_labels = phase_names[non_zero].tolist()
+        pie_values = total_tokens[non_zero]
 
         colors = ['#3498db', '#2ecc71', '#f39c12', '#e74c3c']
-        explode = [0.05 if val == max(pie_values) else 0 for val in pie_values]
+        explode = np.where(pie_values == pie_values.max(), 0.05, 0)
 
         wedges, texts, autotexts = ax2.pie(pie_values, labels=pie_labels, autopct='%1.1f%%',
                                             startangle=90, colors=colors[:len(pie_labels)],
                                             explode=explode, shadow=True)
+        for wedge in wedges:
+            wedge.set_rasterized(True)
 
         # Enhance text
         for text in texts:
@@ -96,9 +145,8 @@ def create_token_consumption_chart():
         ax2.set_title('Token Distribution Across Phases', fontsize=14, fontweight='bold')
 
     # Add summary text
-    total_input = sum(input_tokens)
-    total_output = sum(output_tokens)
-    grand_total = sum(total_tokens)
+    input_cost = total_input / 1_000_000 * 3
+    output_cost = total_output / 1_000_000 * 15
 
     summary_text = f"""
     Total Development Tokens: {grand_total:,}
@@ -106,50 +154,65 @@ def create_token_consumption_chart():
     Output Tokens: {total_output:,} ({total_output/grand_total*100:.1f}%)
 
     Estimated Cost (Claude Sonnet 4.5):
-    Input: ${total_input/1_000_000 * 3:.2f}
-    Output: ${total_output/1_000_000 * 15:.2f}
-    Total: ${(total_input/1_000_000 * 3) + (total_output/1_000_000 * 15):.2f}
+    Input: ${input_cost:.2f}
+    Output: ${output_cost:.2f}
+    Total: ${input_cost + output_cost:.2f}
     """
 
     fig.text(0.5, 0.02, summary_text, ha='center', fontsize=10,
              bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.3))
 
-    plt.tight_layout(rect=[0, 0.1, 1, 0.96])
+    # Fixed margins instead of bbox_inches='tight' so the PNG is rendered once;
+    # the bottom margin reserves room for the summary text.
+    fig.subplots_adjust(left=0.06, right=0.98, top=0.88, bottom=0.32, wspace=0.15)
 
     # Save figure
-    output_path = Path(__file__).parent.parent / 'results' / 'token_consumption.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+    fig.savefig(output_path, dpi=SAVE_DPI, facecolor='white')
     print(f"✓ Visualization saved to: {output_path}")
 
-    # Also create a timeline view
-    create_timeline_chart()
+    # Also create a timeline view, reusing this figure and its canvas
+    fig.clf()
+    create_timeline_chart(fig)
+
+    HASH_PATH.write_text(digest + '\n', encoding='utf-8')
 
     return output_path
 
 
-def create_timeline_chart():
-    """Create a timeline view of development phases."""
+def create_timeline_chart(fig=None):
+    """Create a timeline view of development phases.
 
-    fig, ax = plt.subplots(figsize=(14, 6))
+    Args:
+        fig: Optional cleared figure to draw into (closed afterwards);
+            a new figure is created when omitted
+    """
+    plt = _pyplot()
+    from matplotlib.collections import PatchCollection
+    from matplotlib.patches import Rectangle
 
-    # Phase data with approximate time allocation
-    phase_data = [
-        ('PreProject', 80000, 7, '#3498db'),
-        ('TaskLoop', 650000, 120, '#2ecc71'),
-        ('ResearchLoop', 0, 0, '#f39c12'),
-        ('ReleaseGate', 160000, 9, '#e74c3c'),
-    ]
+    if fig is None:
+        fig = plt.figure()
+    fig.set_size_inches(14, 6)
+    ax = fig.add_subplot()
 
     # Filter out zero phases
-    phase_data = [(name, tokens, count, color) for name, tokens, count, color in phase_data if tokens > 0]
+    phase_data = [entry for entry in TIMELINE if entry[1] > 0]
 
     y_positions = range(len(phase_data))
 
+    # Draw all phase bars as one collection (a single draw call)
+    bars = PatchCollection(
+        [Rectangle((0, i - 0.25), tokens, 0.5) for i, (_, tokens, _, _) in enumerate(phase_data)],
+        facecolors=[color for _, _, _, color in phase_data],
+        edgecolors='black', linewidths=1.5, alpha=0.7,
+    )
+    bars.set_rasterized(True)
+    ax.add_collection(bars)
+    ax.autoscale_view()
+    ax.set_xlim(left=0)
+
+    # Add labels
     for i, (phase, tokens, agent_count, color) in enumerate(phase_data):
-        # Draw phase bar
-        ax.barh(i, tokens, height=0.5, color=color, alpha=0.7, edgecolor='black', linewidth=1.5)
-
-        # Add labels
         ax.text(tokens/2, i, f'{phase}\n{tokens:,} tokens\n{agent_count} invocations',
                 ha='center', va='center', fontweight='bold', fontsize=10, color='white',
                 bbox=dict(boxstyle='round,pad=0.3', facecolor=color, alpha=0.8, edgecolor='black'))
@@ -161,25 +224,33 @@ def create_timeline_chart():
                  fontsize=14, fontweight='bold')
     ax.grid(axis='x', alpha=0.3, linestyle='--')
 
-    # Add total
+    # Add total (anchored in axes coordinates so it stays on the fixed canvas)
     total = sum(p[1] for p in phase_data)
-    ax.text(total * 0.95, len(phase_data) - 0.5, f'Total: {total:,} tokens',
+    ax.text(0.98, 0.97, f'Total: {total:,} tokens', transform=ax.transAxes,
             ha='right', va='top', fontsize=12, fontweight='bold',
             bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.5))
 
-    plt.tight_layout()
+    fig.subplots_adjust(left=0.1, right=0.98, top=0.92, bottom=0.1)
 
-    output_path = Path(__file__).parent.parent / 'results' / 'token_timeline.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+    output_path = TIMELINE_PATH
+    fig.savefig(output_path, dpi=SAVE_DPI, facecolor='white')
+    plt.close(fig)
     print(f"✓ Timeline visualization saved to: {output_path}")
 
 
 if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate token consumption charts in results/.")
+    parser.add_argument('--force', action='store_true',
+                        help="re-render even if the charts are up to date")
+    args = parser.parse_args()
+
     print("Generating token consumption visualizations...")
     print()
 
     try:
-        output = create_token_consumption_chart()
+        create_token_consumption_chart(force=args.force)
         print()
         print("✓ Visualization generation complete!")
         print(f"  - Token consumption chart: results/token_consumption.png")
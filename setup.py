@@ -2,10 +2,24 @@
 
 Modern Python packaging uses pyproject.toml, but this setup.py
 provides backward compatibility with older tools that expect it.
+
+Set LEAGUE_USE_MYPYC=1 to compile the modules in MYPYC_MODULES with
+mypyc. This requires mypy in the build environment, e.g.
+``pip install mypy && LEAGUE_USE_MYPYC=1 pip install --no-build-isolation .``
 """
 
+import os
+
 from setuptools import setup
 
-# All configuration is in pyproject.toml
-# This file exists only for compatibility
-setup()
+# Pure-Python modules that compile cleanly with mypyc
+MYPYC_MODULES = ["src/common/config.py"]
+
+ext_modules = []
+if os.environ.get("LEAGUE_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(MYPYC_MODULES)
+
+# All other configuration is in pyproject.toml
+setup(ext_modules=ext_modules)
@@ -9,6 +9,7 @@ from typing import Any, Dict
 
 from .errors import LeagueError
 from .protocol import (
+    PROTOCOL_VERSION,
     Envelope,
     MessageType,
     generate_conversation_id,
@@ -41,6 +42,9 @@ class AgentServerBase:
         self.league_manager_url = league_manager_url
         self.auth_token = None
         self.league_id = None
+        # Sender identity and log label are fixed for the agent's lifetime
+        self._sender = f"{agent_type}:{agent_id}"
+        self._label = agent_type.capitalize()
 
         # HTTP client
         self.http_client = LeagueHTTPClient()
@@ -79,9 +83,9 @@ class AgentServerBase:
             True if registration successful
         """
         envelope = Envelope(
-            protocol="league.v2",
+            protocol=PROTOCOL_VERSION,
             message_type=message_type.value,
-            sender=f"{self.agent_type}:{self.agent_id}",
+            sender=self._sender,
             timestamp=utc_now(),
             conversation_id=generate_conversation_id(),
         )
@@ -96,11 +100,10 @@ class AgentServerBase:
             response_payload = result.get("payload", {})
             self.auth_token = response_payload.get("auth_token")
             self.league_id = response_payload.get("league_id")
-            logger.info(
-                "%s registered successfully. League ID: %s",
-                self.agent_type.capitalize(),
-                self.league_id,
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "%s registered successfully. League ID: %s", self._label, self.league_id
+                )
             return True
         except LeagueError as e:
             logger.error("Registration failed: %s", e)
@@ -123,9 +126,9 @@ class AgentServerBase:
             return False
 
         envelope = Envelope(
-            protocol="league.v2",
+            protocol=PROTOCOL_VERSION,
             message_type=MessageType.AGENT_READY_REQUEST.value,
-            sender=f"{self.agent_type}:{self.agent_id}",
+            sender=self._sender,
             timestamp=utc_now(),
             conversation_id=generate_conversation_id(),
             auth_token=self.auth_token,
@@ -137,11 +140,8 @@ class AgentServerBase:
             result = self.http_client.send_request(self.league_manager_url, envelope, payload)
             response_payload = result.get("payload", {})
             agent_state = response_payload.get("agent_state")
-            logger.info(
-                "%s ready signal acknowledged. Status: %s",
-                self.agent_type.capitalize(),
-                agent_state,
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("%s ready signal acknowledged. Status: %s", self._label, agent_state)
             return True
         except LeagueError as e:
             logger.error("Failed to send ready signal: %s", e)
@@ -151,7 +151,13 @@ class AgentServerBase:
             return False
 
     def _create_response_envelope(
-        self, message_type: str, conversation_id: str, match_id: str = None
+        self,
+        message_type: str,
+        conversation_id: str,
+        match_id: str = None,
+        *,
+        auth_token: str = None,
+        league_id: str = None,
     ) -> Envelope:
         """Create a response envelope with standard fields.
 
@@ -159,16 +165,20 @@ class AgentServerBase:
             message_type: Response message type
             conversation_id: Conversation ID from request
             match_id: Optional match ID
+            auth_token: Optional auth token
+            league_id: Optional league ID
 
         Returns:
             Configured Envelope
         """
         return Envelope(
-            protocol="league.v2",
+            protocol=PROTOCOL_VERSION,
             message_type=message_type,
-            sender=f"{self.agent_type}:{self.agent_id}",
+            sender=self._sender,
             timestamp=utc_now(),
             conversation_id=conversation_id,
+            auth_token=auth_token,
+            league_id=league_id,
             match_id=match_id,
         )
 
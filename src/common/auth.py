@@ -3,10 +3,11 @@
 This module handles token issuance, validation, and authorization checks.
 """
 
+import base64
+import os
 import threading
-import uuid
 from enum import Enum
-from typing import Dict
+from typing import Dict, NamedTuple
 
 from .errors import AuthenticationError, AuthorizationError
 
@@ -19,14 +20,40 @@ class AgentType(str, Enum):
     PLAYER = "player"
 
 
+class TokenInfo(NamedTuple):
+    """Immutable identity bound to an authentication token."""
+
+    agent_id: str
+    agent_type: str
+
+
+class _TokenRecord:
+    """Identity bound to an issued token."""
+
+    __slots__ = ("info", "expected_sender")
+
+    def __init__(self, agent_id: str, agent_type: str):
+        self.info = TokenInfo(agent_id, agent_type)
+        # Sender string envelopes from this agent must carry
+        if agent_type == AgentType.LEAGUE_MANAGER:
+            self.expected_sender = "league_manager"
+        else:
+            self.expected_sender = f"{agent_type}:{agent_id}"
+
+
 class AuthManager:
-    """Manages authentication tokens and authorization."""
+    """Manages authentication tokens and authorization.
+
+    Token maps are copy-on-write: writers build a new dict under the lock and
+    rebind the attribute, so readers can look tokens up without locking.
+    Published dicts must never be mutated in place.
+    """
 
     def __init__(self):
         """Initialize the authentication manager."""
-        self._tokens: Dict[str, Dict[str, str]] = {}  # token -> {agent_id, agent_type}
-        self._agent_tokens: Dict[str, str] = {}  # agent_id -> token
-        self._lock = threading.Lock()
+        self._tokens: Dict[str, _TokenRecord] = {}  # token -> record
+        self._agent_tokens: Dict[str, str] = {}  # agent_id -> token (idempotent issue)
+        self._lock = threading.Lock()  # serializes writers only
 
     def issue_token(self, agent_id: str, agent_type: AgentType) -> str:
         """Issue a new authentication token.
@@ -36,7 +63,7 @@ class AuthManager:
             agent_type: Type of agent
 
         Returns:
-            Opaque authentication token (UUID)
+            Opaque authentication token (22 URL-safe chars, 128 random bits)
         """
         with self._lock:
             # Check if agent already has a token
@@ -44,30 +71,42 @@ class AuthManager:
                 return self._agent_tokens[agent_id]
 
             # Generate new token
-            token = str(uuid.uuid4())
+            token = base64.urlsafe_b64encode(os.urandom(16)).rstrip(b"=").decode("ascii")
 
-            # Store mappings
-            self._tokens[token] = {"agent_id": agent_id, "agent_type": agent_type.value}
-            self._agent_tokens[agent_id] = token
+            # Publish new mappings
+            tokens = dict(self._tokens)
+            tokens[token] = _TokenRecord(agent_id, agent_type.value)
+            agent_tokens = dict(self._agent_tokens)
+            agent_tokens[agent_id] = token
+            self._tokens = tokens
+            self._agent_tokens = agent_tokens
 
             return token
 
-    def validate_token(self, token: str) -> Dict[str, str]:
+    def validate_token(self, token: str) -> TokenInfo:
         """Validate an authentication token.
 
         Args:
             token: Token to validate
 
         Returns:
-            Dictionary with agent_id and agent_type
+            TokenInfo with agent_id and agent_type (shared, immutable)
 
         Raises:
             AuthenticationError: If token is invalid
         """
-        with self._lock:
-            if token not in self._tokens:
-                raise AuthenticationError("Invalid or expired token")
-            return self._tokens[token].copy()
+        return self._get_record(token).info
+
+    def _get_record(self, token: str) -> _TokenRecord:
+        """Look up the record for a token.
+
+        Raises:
+            AuthenticationError: If token is invalid
+        """
+        record = self._tokens.get(token)
+        if record is None:
+            raise AuthenticationError("Invalid or expired token")
+        return record
 
     def verify_sender(self, token: str, sender: str) -> None:
         """Verify that sender matches the authenticated agent.
@@ -80,16 +119,7 @@ class AuthManager:
             AuthenticationError: If token is invalid
             AuthorizationError: If sender doesn't match token
         """
-        agent_info = self.validate_token(token)
-        agent_id = agent_info["agent_id"]
-        agent_type = agent_info["agent_type"]
-
-        # Construct expected sender
-        if agent_type == AgentType.LEAGUE_MANAGER:
-            expected_sender = "league_manager"
-        else:
-            expected_sender = f"{agent_type}:{agent_id}"
-
+        expected_sender = self._get_record(token).expected_sender
         if sender != expected_sender:
             raise AuthorizationError(
                 f"Sender mismatch: expected {expected_sender}, got {sender}",
@@ -104,11 +134,14 @@ class AuthManager:
             token: Token to invalidate
         """
         with self._lock:
-            if token in self._tokens:
-                agent_id = self._tokens[token]["agent_id"]
-                del self._tokens[token]
-                if agent_id in self._agent_tokens:
-                    del self._agent_tokens[agent_id]
+            if token not in self._tokens:
+                return
+            tokens = dict(self._tokens)
+            record = tokens.pop(token)
+            agent_tokens = dict(self._agent_tokens)
+            agent_tokens.pop(record.info.agent_id, None)
+            self._tokens = tokens
+            self._agent_tokens = agent_tokens
 
     def invalidate_agent(self, agent_id: str) -> None:
         """Invalidate all tokens for an agent.
@@ -117,11 +150,14 @@ class AuthManager:
             agent_id: Agent identifier
         """
         with self._lock:
-            if agent_id in self._agent_tokens:
-                token = self._agent_tokens[agent_id]
-                if token in self._tokens:
-                    del self._tokens[token]
-                del self._agent_tokens[agent_id]
+            if agent_id not in self._agent_tokens:
+                return
+            agent_tokens = dict(self._agent_tokens)
+            token = agent_tokens.pop(agent_id)
+            tokens = dict(self._tokens)
+            tokens.pop(token, None)
+            self._tokens = tokens
+            self._agent_tokens = agent_tokens
 
     def get_agent_id(self, token: str) -> str:
         """Get agent ID for a token.
@@ -135,7 +171,7 @@ class AuthManager:
         Raises:
             AuthenticationError: If token is invalid
         """
-        return self.validate_token(token)["agent_id"]
+        return self._get_record(token).info.agent_id
 
     def get_agent_type(self, token: str) -> str:
         """Get agent type for a token.
@@ -149,7 +185,7 @@ class AuthManager:
         Raises:
             AuthenticationError: If token is invalid
         """
-        return self.validate_token(token)["agent_type"]
+        return self._get_record(token).info.agent_type
 
     def has_token(self, agent_id: str) -> bool:
         """Check if an agent has a token.
@@ -160,5 +196,4 @@ class AuthManager:
         Returns:
             True if agent has a token
         """
-        with self._lock:
-            return agent_id in self._agent_tokens
+        return agent_id in self._agent_tokens
@@ -5,8 +5,15 @@ Player, Referee, and League Manager entry points.
 """
 
 import argparse
+import signal
 import sys
-import time
+import threading
+
+# Windows does not interrupt a blocking wait for signal handlers, so poll there
+_WAIT_POLL_INTERVAL = 1.0 if sys.platform == "win32" else None
+
+# Signals that trigger a clean shutdown of run_server_loop
+_STOP_SIGNALS = (signal.SIGINT, signal.SIGTERM)
 
 
 def add_host_port_args(parser: argparse.ArgumentParser, default_port: int):
@@ -67,21 +74,30 @@ def create_agent_parser(description: str, agent_type: str) -> argparse.ArgumentP
 def run_server_loop(logger, message: str, cleanup_callback=None):
     """Run server main loop with standard shutdown logic.
 
+    Blocks until SIGINT or SIGTERM, then runs the cleanup callback.
+
     Args:
         logger: Logger instance
         message: Message to log when running
         cleanup_callback: Optional callback function to run on shutdown
     """
+    stop_event = threading.Event()
+    previous_handlers = {
+        signum: signal.signal(signum, lambda *_: stop_event.set()) for signum in _STOP_SIGNALS
+    }
     try:
         logger.info("%s. Press Ctrl+C to stop.", message)
 
-        # Keep running
-        while True:
-            time.sleep(1)
+        # Block until Ctrl+C or SIGTERM instead of polling
+        while not stop_event.wait(_WAIT_POLL_INTERVAL):
+            pass
 
+        logger.info("Shutting down...")
     except KeyboardInterrupt:
         logger.info("Shutting down...")
     finally:
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
         if cleanup_callback:
             cleanup_callback()
 
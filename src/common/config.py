@@ -3,16 +3,27 @@
 This module handles loading and providing access to league configuration.
 """
 
-from dataclasses import dataclass
+import json
+import sys
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import yaml
 
 from .errors import ConfigurationError
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
 
-@dataclass
+# dataclass(slots=True) is only available on Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class LeagueConfig:
     """League configuration settings."""
 
@@ -24,7 +35,7 @@ class LeagueConfig:
     min_referees: int
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SchedulingConfig:
     """Scheduling configuration settings."""
 
@@ -32,7 +43,7 @@ class SchedulingConfig:
     concurrent_matches_per_round: bool
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TimeoutConfig:
     """Timeout configuration settings."""
 
@@ -42,7 +53,7 @@ class TimeoutConfig:
     result_report_ms: int
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RetryConfig:
     """Retry configuration settings."""
 
@@ -50,7 +61,7 @@ class RetryConfig:
     backoff_ms: int
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LoggingConfig:
     """Logging configuration settings."""
 
@@ -59,14 +70,34 @@ class LoggingConfig:
     log_level: str
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DatabaseConfig:
     """Database configuration settings."""
 
     path: str
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
+class Scoring:
+    """Points awarded per match outcome."""
+
+    win: int
+    draw: int
+    loss: int
+
+    def as_dict(self) -> Dict[str, int]:
+        """Convert to the win/draw/loss dictionary form.
+
+        Returns:
+            Dictionary mapping outcome to points
+        """
+        return asdict(self)
+
+
+DEFAULT_SCORING = Scoring(win=3, draw=1, loss=0)
+
+
+@dataclass(**_SLOTS)
 class GameConfig:
     """Game type configuration."""
 
@@ -74,19 +105,164 @@ class GameConfig:
     name: str
     description: str
     referee_implementation: str
-    scoring: Dict[str, int]
+    scoring: Scoring
+
+
+# Defaults for every league.yaml setting, by section
+_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "league": {"league_id": "default-league", "name": "Agent League"},
+    "registration": {
+        "window_seconds": 60,
+        "min_players": 2,
+        "max_players": 100,
+        "min_referees": 1,
+    },
+    "scheduling": {"algorithm": "round_robin", "concurrent_matches_per_round": True},
+    "timeouts": {
+        "registration_response_ms": 5000,
+        "match_join_ack_ms": 10000,
+        "move_response_ms": 30000,
+        "result_report_ms": 60000,
+    },
+    "retries": {"max_attempts": 3, "backoff_ms": 1000},
+    "logging": {
+        "audit_log_path": "./logs/audit.jsonl",
+        "application_log_path": "./logs/league_manager.log",
+        "log_level": "INFO",
+    },
+    "database": {"path": "./data/league.db"},
+}
+
+
+def _merge_section(data: Optional[Dict[str, Any]], section: str) -> Dict[str, Any]:
+    """Overlay a YAML section on its defaults, keeping only known keys.
+
+    Args:
+        data: Parsed YAML document (may be None for an empty file)
+        section: Section name in _DEFAULTS
+
+    Returns:
+        Settings dictionary with every default key present
+    """
+    defaults = _DEFAULTS[section]
+    values = (data or {}).get(section) or {}
+    return {key: values.get(key, default) for key, default in defaults.items()}
+
+
+# Sentinel for a missing or stale parse cache (None is a valid YAML document)
+_MISS = object()
+
+
+def _cache_path(config_path: Path) -> Path:
+    """Return the parse-cache sidecar path for a YAML file."""
+    return config_path.with_name(f".{config_path.name}.cache.json")
+
+
+def _cache_key(config_path: Path) -> List[int]:
+    """Return the sidecar validation key (mtime and size) for a YAML file."""
+    stat = config_path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _load_cache(config_path: Path, key: List[int]) -> Any:
+    """Return the cached document for a YAML file, or _MISS if stale or absent."""
+    try:
+        cached = json.loads(_cache_path(config_path).read_bytes())
+        if cached["key"] == key:
+            return cached["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return _MISS
+
+
+def _store_cache(config_path: Path, key: List[int], data: Any) -> None:
+    """Write the parse-cache sidecar, ignoring documents JSON cannot represent."""
+    try:
+        text = json.dumps({"key": key, "data": data})
+        # Only cache documents that survive a JSON round trip unchanged
+        if json.loads(text)["data"] == data:
+            _cache_path(config_path).write_text(text, encoding="utf-8")
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _read_yaml(config_path: Path, use_cache: bool = False) -> Any:
+    """Parse a YAML file, reusing a JSON sidecar while the file is unchanged.
+
+    The sidecar is keyed by the file's mtime and size. JSON rather than pickle
+    keeps the cache as inert as the safely-loaded YAML it mirrors. Cache
+    failures are ignored and fall back to a full parse.
+
+    Args:
+        config_path: Path to the YAML file
+        use_cache: Whether to read and write the sidecar
+
+    Returns:
+        Parsed YAML document
+    """
+    if not use_cache:
+        return yaml.load(config_path.read_bytes(), Loader=_SafeLoader)  # nosec B506
+
+    key = _cache_key(config_path)
+    data = _load_cache(config_path, key)
+    if data is _MISS:
+        # Single read; libyaml detects the encoding from the raw bytes
+        data = yaml.load(config_path.read_bytes(), Loader=_SafeLoader)  # nosec B506
+        _store_cache(config_path, key, data)
+    return data
+
+
+def _read_yaml_files(paths: List[Path], use_cache: bool = False) -> Optional[List[Any]]:
+    """Parse several single-document YAML files with one parser pass.
+
+    Files with a valid sidecar are served from it; the rest are joined into
+    one multi-document stream for a single yaml.load_all call.
+
+    Args:
+        paths: YAML files to parse
+        use_cache: Whether to read and write the sidecars
+
+    Returns:
+        One parsed document per path, or None if the files cannot be parsed
+        as a joined stream (so callers can parse them one by one and report
+        errors against the right file)
+    """
+    keys = [_cache_key(path) for path in paths] if use_cache else [None] * len(paths)
+    docs = [_load_cache(path, key) if use_cache else _MISS for path, key in zip(paths, keys)]
+    missing = [i for i, doc in enumerate(docs) if doc is _MISS]
+    if not missing:
+        return docs
+
+    stream = b"\n---\n".join(paths[i].read_bytes() for i in missing)
+    try:
+        parsed = list(yaml.load_all(stream, Loader=_SafeLoader))  # nosec B506
+    except yaml.YAMLError:
+        return None
+    # Empty files or explicit document markers break the one-file-one-document mapping
+    if len(parsed) != len(missing):
+        return None
+
+    for i, data in zip(missing, parsed):
+        docs[i] = data
+        if use_cache:
+            _store_cache(paths[i], keys[i], data)
+    return docs
 
 
 class ConfigManager:
     """Manages configuration loading and access."""
 
-    def __init__(self, config_dir: str = "./config"):
+    def __init__(self, config_dir: str = "./config", use_cache: bool = False):
         """Initialize configuration manager.
 
         Args:
             config_dir: Directory containing configuration files
+            use_cache: Reuse parsed YAML from on-disk sidecars when files are
+                unchanged; sidecars are written into config_dir, so leave this
+                off when the directory is read-only or under version control
         """
         self.config_dir = Path(config_dir)
+        self.use_cache = use_cache
         self.league: Optional[LeagueConfig] = None
         self.scheduling: Optional[SchedulingConfig] = None
         self.timeouts: Optional[TimeoutConfig] = None
@@ -94,9 +270,28 @@ class ConfigManager:
         self.logging: Optional[LoggingConfig] = None
         self.database: Optional[DatabaseConfig] = None
         self.games: Dict[str, GameConfig] = {}
+        self._scoring_cache: Dict[str, Scoring] = {}
 
     def load_all(self):
-        """Load all configuration files."""
+        """Load all configuration files.
+
+        When both files are present they are parsed in a single YAML pass.
+        """
+        league_path = self.config_dir / "league.yaml"
+        registry_path = self.config_dir / "game_registry.yaml"
+        if league_path.exists() and registry_path.exists():
+            try:
+                docs = _read_yaml_files([league_path, registry_path], self.use_cache)
+            except OSError as e:
+                raise ConfigurationError(
+                    f"Error loading configuration: {str(e)}",
+                    path=str(e.filename or self.config_dir),
+                ) from e
+            if docs is not None:
+                self._apply_league_config(docs[0], league_path)
+                self._apply_game_registry(docs[1], registry_path)
+                return
+
         self.load_league_config()
         self.load_game_registry()
 
@@ -116,59 +311,7 @@ class ConfigManager:
             )
 
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-
-            # Parse league settings
-            league_data = data.get("league", {})
-            self.league = LeagueConfig(
-                league_id=league_data.get("league_id", "default-league"),
-                name=league_data.get("name", "Agent League"),
-                registration_window_seconds=data.get("registration", {}).get("window_seconds", 60),
-                min_players=data.get("registration", {}).get("min_players", 2),
-                max_players=data.get("registration", {}).get("max_players", 100),
-                min_referees=data.get("registration", {}).get("min_referees", 1),
-            )
-
-            # Parse scheduling settings
-            scheduling_data = data.get("scheduling", {})
-            self.scheduling = SchedulingConfig(
-                algorithm=scheduling_data.get("algorithm", "round_robin"),
-                concurrent_matches_per_round=scheduling_data.get(
-                    "concurrent_matches_per_round", True
-                ),
-            )
-
-            # Parse timeout settings
-            timeout_data = data.get("timeouts", {})
-            self.timeouts = TimeoutConfig(
-                registration_response_ms=timeout_data.get("registration_response_ms", 5000),
-                match_join_ack_ms=timeout_data.get("match_join_ack_ms", 10000),
-                move_response_ms=timeout_data.get("move_response_ms", 30000),
-                result_report_ms=timeout_data.get("result_report_ms", 60000),
-            )
-
-            # Parse retry settings
-            retry_data = data.get("retries", {})
-            self.retries = RetryConfig(
-                max_attempts=retry_data.get("max_attempts", 3),
-                backoff_ms=retry_data.get("backoff_ms", 1000),
-            )
-
-            # Parse logging settings
-            logging_data = data.get("logging", {})
-            self.logging = LoggingConfig(
-                audit_log_path=logging_data.get("audit_log_path", "./logs/audit.jsonl"),
-                application_log_path=logging_data.get(
-                    "application_log_path", "./logs/league_manager.log"
-                ),
-                log_level=logging_data.get("log_level", "INFO"),
-            )
-
-            # Parse database settings
-            db_data = data.get("database", {})
-            self.database = DatabaseConfig(path=db_data.get("path", "./data/league.db"))
-
+            data = _read_yaml(config_path, self.use_cache)
         except yaml.YAMLError as e:
             raise ConfigurationError(
                 f"Invalid YAML in configuration: {str(e)}", path=str(config_path)
@@ -177,6 +320,38 @@ class ConfigManager:
             raise ConfigurationError(
                 f"Error loading configuration: {str(e)}", path=str(config_path)
             ) from e
+        self._apply_league_config(data, config_path)
+
+    def _apply_league_config(self, data: Any, config_path: Path):
+        """Build league settings from a parsed league.yaml document.
+
+        Args:
+            data: Parsed YAML document
+            config_path: Source file, for error reporting
+
+        Raises:
+            ConfigurationError: If configuration is invalid
+        """
+        try:
+            league = _merge_section(data, "league")
+            registration = _merge_section(data, "registration")
+            self.league = LeagueConfig(
+                league_id=league["league_id"],
+                name=league["name"],
+                registration_window_seconds=registration["window_seconds"],
+                min_players=registration["min_players"],
+                max_players=registration["max_players"],
+                min_referees=registration["min_referees"],
+            )
+            self.scheduling = SchedulingConfig(**_merge_section(data, "scheduling"))
+            self.timeouts = TimeoutConfig(**_merge_section(data, "timeouts"))
+            self.retries = RetryConfig(**_merge_section(data, "retries"))
+            self.logging = LoggingConfig(**_merge_section(data, "logging"))
+            self.database = DatabaseConfig(**_merge_section(data, "database"))
+        except Exception as e:
+            raise ConfigurationError(
+                f"Error loading configuration: {str(e)}", path=str(config_path)
+            ) from e
 
     def load_game_registry(self, filename: str = "game_registry.yaml"):
         """Load game registry configuration.
@@ -187,6 +362,7 @@ class ConfigManager:
         Raises:
             ConfigurationError: If configuration is invalid
         """
+        self._scoring_cache.clear()
         config_path = self.config_dir / filename
         if not config_path.exists():
             # Game registry is optional, create default
@@ -196,15 +372,31 @@ class ConfigManager:
                     name="Tic Tac Toe",
                     description="Classic 3x3 grid game",
                     referee_implementation="src.referee.games.tic_tac_toe.TicTacToeReferee",
-                    scoring={"win": 3, "draw": 1, "loss": 0},
+                    scoring=DEFAULT_SCORING,
                 )
             }
             return
 
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            data = _read_yaml(config_path, self.use_cache)
+        except Exception as e:
+            raise ConfigurationError(
+                f"Error loading game registry: {str(e)}", path=str(config_path)
+            ) from e
+        self._apply_game_registry(data, config_path)
+
+    def _apply_game_registry(self, data: Any, config_path: Path):
+        """Register games from a parsed game_registry.yaml document.
+
+        Args:
+            data: Parsed YAML document
+            config_path: Source file, for error reporting
 
+        Raises:
+            ConfigurationError: If configuration is invalid
+        """
+        self._scoring_cache.clear()
+        try:
             games_data = data.get("games", [])
             for game_data in games_data:
                 game = GameConfig(
@@ -212,10 +404,13 @@ class ConfigManager:
                     name=game_data["name"],
                     description=game_data.get("description", ""),
                     referee_implementation=game_data["referee_implementation"],
-                    scoring=game_data.get("scoring", {"win": 3, "draw": 1, "loss": 0}),
+                    scoring=(
+                        Scoring(**game_data["scoring"])
+                        if "scoring" in game_data
+                        else DEFAULT_SCORING
+                    ),
                 )
                 self.games[game.game_type] = game
-
         except Exception as e:
             raise ConfigurationError(
                 f"Error loading game registry: {str(e)}", path=str(config_path)
@@ -232,19 +427,22 @@ class ConfigManager:
         """
         return self.games.get(game_type)
 
-    def get_scoring(self, game_type: str) -> Dict[str, int]:
+    def get_scoring(self, game_type: str) -> Scoring:
         """Get scoring rules for a game type.
 
         Args:
             game_type: Game type identifier
 
         Returns:
-            Scoring dictionary (win/draw/loss -> points)
+            Scoring rules (use as_dict() for the win/draw/loss mapping)
         """
-        game = self.get_game_config(game_type)
-        if game:
-            return game.scoring
-        return {"win": 3, "draw": 1, "loss": 0}  # Default
+        cached = self._scoring_cache.get(game_type)
+        if cached is not None:
+            return cached
+        game = self.games.get(game_type)
+        scoring = game.scoring if game else DEFAULT_SCORING
+        self._scoring_cache[game_type] = scoring
+        return scoring
 
 
 def load_config(config_dir: str = "./config") -> ConfigManager:
@@ -5,7 +5,9 @@ the league system, ensuring consistent error handling and reporting.
 """
 
 from enum import IntEnum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+from .serialization import dumps_bytes
 
 
 class ErrorCode(IntEnum):
@@ -48,9 +50,21 @@ class ErrorCode(IntEnum):
     COMMUNICATION_ERROR = 5009
 
 
+# Plain lookup table so error construction avoids enum attribute access
+_CODE_NAMES: Dict[int, str] = {int(code): code.name for code in ErrorCode}
+_CODES_BY_VALUE: Dict[int, ErrorCode] = {int(code): code for code in ErrorCode}
+
+# Serialized detail-free errors keyed by (code, message); bounded because
+# some messages embed caller-supplied text
+_JSON_CACHE: Dict[Tuple[int, str], bytes] = {}
+_JSON_CACHE_MAX = 256
+
+
 class LeagueError(Exception):
     """Base exception for all league-related errors."""
 
+    __slots__ = ("code", "message", "details", "int_code", "_name")
+
     def __init__(self, code: ErrorCode, message: str, details: Optional[Dict[str, Any]] = None):
         """Initialize a league error.
 
@@ -62,20 +76,50 @@ class LeagueError(Exception):
         self.code = code
         self.message = message
         self.details = details or {}
-        super().__init__(f"[{code.name}] {message}")
+        # Plain int form of code, for JSON-RPC error objects
+        self.int_code = int(code)
+        self._name = _CODE_NAMES[self.int_code]
+        # The "[CODE] message" text is only built if the error is printed
+        super().__init__(message)
+
+    def __str__(self) -> str:
+        """Return the error message prefixed with its code name."""
+        return f"[{self._name}] {self.message}"
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert error to dictionary format for JSON-RPC responses.
 
+        ``data.details`` is always present, as ``{}`` when there are no details,
+        since clients parse it as part of the wire format.
+
         Returns:
             Dictionary with code, message, and data fields
         """
         return {
-            "code": int(self.code),
+            "code": self.int_code,
             "message": self.message,
-            "data": {"error_code": self.code.name, "details": self.details},
+            "data": {"error_code": self._name, "details": self.details},
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize to_dict() as compact JSON bytes.
+
+        Errors without details are cached by (code, message), so repeated
+        errors such as a closed registration window skip re-serialization.
+
+        Returns:
+            UTF-8 encoded JSON of the error dictionary
+        """
+        if self.details:
+            return dumps_bytes(self.to_dict())
+        key = (self.int_code, self.message)
+        cached = _JSON_CACHE.get(key)
+        if cached is None:
+            cached = dumps_bytes(self.to_dict())
+            if len(_JSON_CACHE) < _JSON_CACHE_MAX:
+                _JSON_CACHE[key] = cached
+        return cached
+
 
 class ProtocolError(LeagueError):
     """Raised when protocol validation fails (4xx errors)."""
@@ -162,3 +206,19 @@ class ConfigurationError(OperationalError):
 
     def __init__(self, message: str, **details):
         super().__init__(ErrorCode.CONFIGURATION_ERROR, message, details)
+
+
+def lookup_error_code(value: Any, default: ErrorCode = ErrorCode.INTERNAL_ERROR) -> ErrorCode:
+    """Return the ErrorCode for an integer code received on the wire.
+
+    Args:
+        value: Code from a JSON-RPC error object
+        default: Code to use when value is not a known ErrorCode
+
+    Returns:
+        Matching ErrorCode member, or default
+    """
+    try:
+        return _CODES_BY_VALUE.get(value, default)
+    except TypeError:
+        return default
@@ -4,67 +4,184 @@ This module provides audit logging functionality for recording all
 protocol messages in an append-only format.
 """
 
-import json
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import threading
-import uuid
-from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict, Optional
+import time
+import weakref
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Set
 
-from .protocol import JSONRPCRequest, JSONRPCResponse
+from .protocol import JSONRPCRequest, JSONRPCResponse, generate_message_id
+from .serialization import dumps_bytes
+
+# Append-only flags for the raw audit log descriptor; O_BINARY exists only on Windows
+_AUDIT_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
+# Log directories already created by this process
+_ensured_dirs: Set[str] = set()
+
+# Audit loggers with an open file; closed at interpreter exit so buffered
+# entries are written even when nothing calls close()
+_open_audit_loggers: "weakref.WeakSet[AuditLogger]" = weakref.WeakSet()
+
+# Maximum seconds an application log record stays buffered before hitting the file
+_APP_LOG_FLUSH_INTERVAL = 1.0
+
+
+def _ensure_parent_dir(path: str) -> None:
+    """Create the parent directory of a log file once per process.
+
+    Args:
+        path: Log file path
+    """
+    parent = os.path.dirname(path)
+    if parent and parent not in _ensured_dirs:
+        os.makedirs(parent, exist_ok=True)
+        _ensured_dirs.add(parent)
+
+
+def _conversation_id(container: Optional[Dict[str, Any]]) -> str:
+    """Read the envelope conversation_id from request params or a response result.
+
+    Args:
+        container: Params or result dictionary that may hold an envelope
+
+    Returns:
+        The conversation ID, or "unknown" if absent
+    """
+    if container:
+        envelope = container.get("envelope")
+        if envelope is not None:
+            return envelope.get("conversation_id") or "unknown"
+    return "unknown"
 
 
 class AuditLogger:
     """Append-only audit logger for protocol messages.
 
     Logs all JSON-RPC messages in JSON Lines format for replay and verification.
+    Entries are buffered and written in batches: when ``batch_size`` entries are
+    pending, when ``flush_interval`` seconds have passed (checked on write and by
+    a background thread), on ``sync=True`` writes, and on close.
     """
 
-    def __init__(self, log_path: str):
+    def __init__(self, log_path: str, batch_size: int = 64, flush_interval: float = 0.1):
         """Initialize the audit logger.
 
         Args:
             log_path: Path to audit log file
+            batch_size: Number of pending entries that triggers a write
+            flush_interval: Maximum seconds an entry may stay buffered
         """
-        self.log_path = Path(log_path)
-        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self.log_path = os.fspath(log_path)
+        _ensure_parent_dir(self.log_path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
         self._lock = threading.Lock()
-        self._file = None
+        self._fd: Optional[int] = None
+        self._pending = []
+        self._last_flush = time.monotonic()
+        self._stop_event = threading.Event()
+        self._flusher = None
+        # (epoch milliseconds, formatted timestamp), swapped as one tuple so
+        # concurrent loggers never see a mismatched pair
+        self._timestamp_cache = (-1, "")
 
     def open(self):
         """Open the audit log file for appending."""
         with self._lock:
-            if self._file is None:
-                # pylint: disable=consider-using-with
-                self._file = open(self.log_path, "a", encoding="utf-8")
+            self._open_locked()
+
+    def _open_locked(self):
+        """Open the file and start the background flusher (lock must be held)."""
+        if self._fd is None:
+            self._fd = os.open(self.log_path, _AUDIT_OPEN_FLAGS, 0o644)
+            self._stop_event.clear()
+            self._flusher = threading.Thread(
+                target=self._flush_periodically, name="audit-log-flusher", daemon=True
+            )
+            self._flusher.start()
+            _open_audit_loggers.add(self)
 
     def close(self):
-        """Close the audit log file."""
+        """Flush pending entries and close the audit log file."""
         with self._lock:
-            if self._file is not None:
-                self._file.close()
-                self._file = None
+            if self._fd is None:
+                return
+            self._flush_locked()
+            os.close(self._fd)
+            self._fd = None
+            flusher = self._flusher
+            self._flusher = None
+            self._stop_event.set()
+        _open_audit_loggers.discard(self)
+        flusher.join()
+
+    def flush(self) -> None:
+        """Write all pending entries to the audit log."""
+        with self._lock:
+            if self._fd is not None:
+                self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        """Write pending entries (lock must be held and file open).
+
+        The batch goes straight to the O_APPEND descriptor with no user-space
+        buffer in between, so it reaches the OS in a single write.
+        """
+        if self._pending:
+            data = memoryview(b"".join(self._pending))
+            while data:
+                data = data[os.write(self._fd, data) :]
+            self._pending.clear()
+        self._last_flush = time.monotonic()
+
+    def _flush_periodically(self) -> None:
+        """Background loop bounding how long entries stay buffered."""
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
 
-    def log_request(self, request: JSONRPCRequest, source: str, destination: str) -> None:
+    def _now_iso(self) -> str:
+        """Return the current UTC time as ISO-8601 with millisecond precision.
+
+        The formatted string is reused for all entries within the same millisecond.
+        """
+        now_ms = time.time_ns() // 1_000_000
+        cached_ms, cached = self._timestamp_cache
+        if now_ms != cached_ms:
+            seconds, millis = divmod(now_ms, 1000)
+            cached = (
+                datetime.fromtimestamp(seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+                + f".{millis:03d}Z"
+            )
+            self._timestamp_cache = (now_ms, cached)
+        return cached
+
+    def log_request(
+        self, request: JSONRPCRequest, source: str, destination: str, sync: bool = False
+    ) -> None:
         """Log a JSON-RPC request.
 
         Args:
             request: The JSON-RPC request
             source: Source agent identity
             destination: Destination agent identity
+            sync: Write the entry to the file before returning
         """
-        envelope = request.params.get("envelope", {})
         log_entry = {
-            "log_id": str(uuid.uuid4()),
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "log_id": generate_message_id(),
+            "timestamp": self._now_iso(),
             "direction": "request",
             "source": source,
             "destination": destination,
-            "conversation_id": envelope.get("conversation_id", "unknown"),
+            "conversation_id": _conversation_id(request.params),
             "message": request.to_dict(),
         }
-        self._write_entry(log_entry)
+        self._write_entry(log_entry, sync)
 
     def log_response(
         self,
@@ -72,6 +189,7 @@ class AuditLogger:
         source: str,
         destination: str,
         conversation_id: Optional[str] = None,
+        sync: bool = False,
     ) -> None:
         """Log a JSON-RPC response.
 
@@ -80,35 +198,40 @@ class AuditLogger:
             source: Source agent identity
             destination: Destination agent identity
             conversation_id: Optional conversation ID
+            sync: Write the entry to the file before returning
         """
-        # Try to extract conversation_id from response
-        if conversation_id is None and response.result:
-            envelope = response.result.get("envelope", {})
-            conversation_id = envelope.get("conversation_id", "unknown")
+        if conversation_id is None:
+            conversation_id = _conversation_id(response.result)
 
         log_entry = {
-            "log_id": str(uuid.uuid4()),
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "log_id": generate_message_id(),
+            "timestamp": self._now_iso(),
             "direction": "response",
             "source": source,
             "destination": destination,
             "conversation_id": conversation_id or "unknown",
             "message": response.to_dict(),
         }
-        self._write_entry(log_entry)
+        self._write_entry(log_entry, sync)
 
-    def _write_entry(self, entry: Dict[str, Any]) -> None:
-        """Write a log entry to the audit log.
+    def _write_entry(self, entry: Dict[str, Any], sync: bool = False) -> None:
+        """Buffer a log entry, writing the batch when a flush condition is met.
 
         Args:
             entry: Log entry dictionary
+            sync: Write immediately instead of waiting for the batch
         """
+        line = dumps_bytes(entry) + b"\n"
         with self._lock:
-            if self._file is None:
-                self.open()
-            line = json.dumps(entry, separators=(",", ":"))
-            self._file.write(line + "\n")
-            self._file.flush()
+            if self._fd is None:
+                self._open_locked()
+            self._pending.append(line)
+            if (
+                sync
+                or len(self._pending) >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self._flush_locked()
 
     def __enter__(self):
         """Context manager entry."""
@@ -120,11 +243,73 @@ class AuditLogger:
         self.close()
 
 
+class _TimedMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes records older than ``flush_interval``.
+
+    Age is checked on each record and by a background thread, so records
+    from a quiet process still reach the target within about one interval.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        flush_interval: float,
+        flushLevel: int = logging.ERROR,  # pylint: disable=invalid-name
+        target: Optional[logging.Handler] = None,
+    ):
+        """Initialize the handler.
+
+        Args:
+            capacity: Number of buffered records that triggers a flush
+            flush_interval: Maximum seconds a record may stay buffered
+            flushLevel: Level at or above which a record flushes immediately
+            target: Handler receiving flushed records
+        """
+        super().__init__(capacity, flushLevel=flushLevel, target=target)
+        self.flush_interval = flush_interval
+        self._stop_event = threading.Event()
+        self._flush_thread = threading.Thread(
+            target=self._flush_periodically, name="app-log-flush", daemon=True
+        )
+        self._flush_thread.start()
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        """Flush when full, on a high-level record, or once the oldest record is stale."""
+        return (
+            super().shouldFlush(record)
+            or record.created - self.buffer[0].created >= self.flush_interval
+        )
+
+    def _flush_periodically(self) -> None:
+        """Background loop bounding how long records stay buffered."""
+        while not self._stop_event.wait(self.flush_interval):
+            if self.buffer:
+                self.flush()
+
+    def close(self) -> None:
+        """Stop the flush thread, then flush and close as MemoryHandler does."""
+        self._stop_event.set()
+        self._flush_thread.join()
+        super().close()
+
+
+# Background listeners draining each configured logger's queue, by logger name
+_listeners: Dict[Optional[str], logging.handlers.QueueListener] = {}
+_listeners_lock = threading.Lock()
+
+
 def setup_application_logging(
     log_path: str, log_level: str = "INFO", logger_name: Optional[str] = None
 ) -> logging.Logger:
     """Set up application logging.
 
+    Records are enqueued by a QueueHandler on the calling thread and written
+    to the file and console by a background QueueListener, so logging calls
+    do not block on I/O. File writes are buffered up to 512 records and
+    flushed early on ERROR or once the oldest record is about a second old.
+    Listeners are stopped (and drained) at interpreter
+    exit or by stop_application_logging.
+
     Args:
         log_path: Path to application log file
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -134,13 +319,14 @@ def setup_application_logging(
         Configured logger instance
     """
     # Create log directory
-    Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+    _ensure_parent_dir(os.fspath(log_path))
 
     # Get logger
     logger = logging.getLogger(logger_name)
     logger.setLevel(getattr(logging, log_level.upper()))
 
-    # Clear existing handlers
+    # Clear existing handlers (and the listener feeding them)
+    stop_application_logging(logger_name)
     logger.handlers.clear()
 
     # File handler with structured format
@@ -149,12 +335,63 @@ def setup_application_logging(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%dT%H:%M:%SZ"
     )
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+
+    # Batch file writes; ERROR and above flush immediately for crash visibility,
+    # and nothing waits longer than the flush interval
+    buffered_file_handler = _TimedMemoryHandler(
+        capacity=512,
+        flush_interval=_APP_LOG_FLUSH_INTERVAL,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+    )
 
     # Console handler
     console_handler = logging.StreamHandler()
     console_formatter = logging.Formatter("%(levelname)s: %(message)s")
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+
+    # Producers only enqueue; the listener thread performs the writes
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, buffered_file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    with _listeners_lock:
+        _listeners[logger_name] = listener
 
     return logger
+
+
+def stop_application_logging(logger_name: Optional[str] = None) -> None:
+    """Stop the background listener for a logger, flushing queued records.
+
+    Args:
+        logger_name: Logger name passed to setup_application_logging
+    """
+    with _listeners_lock:
+        listener = _listeners.pop(logger_name, None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            # MemoryHandler.close flushes but leaves its target open
+            target = getattr(handler, "target", None)
+            handler.close()
+            if target is not None:
+                target.close()
+
+
+@atexit.register
+def _stop_all_listeners() -> None:
+    """Drain every application log listener at interpreter exit."""
+    with _listeners_lock:
+        names = list(_listeners)
+    for name in names:
+        stop_application_logging(name)
+
+
+@atexit.register
+def _close_all_audit_loggers() -> None:
+    """Write buffered audit entries and close every audit log at interpreter exit."""
+    for audit_logger in list(_open_audit_loggers):
+        audit_logger.close()
@@ -4,15 +4,58 @@ This module provides SQLite database access and abstracts all
 database operations for the league system.
 """
 
-import json
+import queue
 import sqlite3
 import threading
+from collections import OrderedDict
+from concurrent.futures import Future
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from .errors import DatabaseError
+from .serialization import dumps, loads
+
+# Per-connection tuning: WAL-friendly durability, in-memory temp tables,
+# a ~20 MB page cache and a 256 MB memory map
+_CONNECTION_PRAGMAS = """
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-20000;
+PRAGMA mmap_size=268435456;
+"""
+
+# Prepared statements kept per connection; comfortably above the number of
+# distinct SQL strings in this module so hot queries are never re-parsed
+_CACHED_STATEMENTS = 256
+
+# Non-unique secondary indexes by name; bulk_load() drops and rebuilds these
+_SECONDARY_INDEXES = {
+    "idx_rounds_league": "CREATE INDEX IF NOT EXISTS idx_rounds_league ON rounds(league_id)",
+    "idx_matches_round_status": (
+        "CREATE INDEX IF NOT EXISTS idx_matches_round_status ON matches(round_id, status)"
+    ),
+    "idx_players_league": "CREATE INDEX IF NOT EXISTS idx_players_league ON players(league_id)",
+    "idx_referees_league": "CREATE INDEX IF NOT EXISTS idx_referees_league ON referees(league_id)",
+}
+
+# Read connections per database; SQLite serves concurrent WAL readers
+# alongside the single writer
+_DEFAULT_READERS = 4
+
+# Most queued status updates the background writer commits at once
+_WRITE_BATCH = 64
+
+# Entries kept by the league/referee/player row cache
+_ROW_CACHE_SIZE = 2048
+
+# Fewest rows for which bulk_load() drops and rebuilds the secondary indexes;
+# rebuilding covers every league's rows, so smaller loads maintain them inline
+_BULK_LOAD_MIN_ROWS = 50_000
+
+# Ids bound per "IN (...)" query; stays under SQLite's historic 999 variable limit
+_IN_CHUNK = 500
 
 
 @dataclass
@@ -27,41 +70,368 @@ class PlayerRanking:
     matches_played: int
 
 
+_QueuedWrite = Tuple[str, Tuple[Any, ...], Optional[Tuple[str, str]], "Future[None]"]
+
+
+class _RowCache:
+    """Thread-safe LRU of row dicts keyed by (table, primary key).
+
+    Misses are not cached. A fill that raced with an invalidation is dropped,
+    so a reader can never re-insert a row that a writer just changed.
+
+    The cache assumes its LeagueDatabase is the only writer of the file.
+    Status updates drop their own row and a commit through transaction()
+    clears everything; writes from another connection to the same file, or
+    through conn outside transaction(), are not seen.
+    """
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._rows: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped on every invalidation."""
+        return self._generation
+
+    def get(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached row, or None on a miss."""
+        with self._lock:
+            row = self._rows.get(key)
+            if row is None:
+                return None
+            self._rows.move_to_end(key)
+            return dict(row)
+
+    def put(self, key: Tuple[str, str], row: Dict[str, Any], generation: int):
+        """Cache a row read while the cache was at the given generation."""
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._rows[key] = dict(row)
+            self._rows.move_to_end(key)
+            if len(self._rows) > self._maxsize:
+                self._rows.popitem(last=False)
+
+    def invalidate(self, key: Tuple[str, str]):
+        """Drop a single row."""
+        with self._lock:
+            self._generation += 1
+            self._rows.pop(key, None)
+
+    def clear(self):
+        """Drop every row."""
+        with self._lock:
+            self._generation += 1
+            self._rows.clear()
+
+
+# Conditional assignment; RETURNING (SQLite 3.35+) saves the follow-up SELECT
+_ASSIGN_MATCH_SQL = """UPDATE matches SET referee_id = ?, status = 'ASSIGNED', assigned_at = ?
+    WHERE match_id = ? AND status = 'PENDING'"""
+_ASSIGN_MATCH_RETURNING = " RETURNING match_id, round_id, status"
+
+# Undo an assignment only while it is still the one we made
+_UNASSIGN_MATCH_SQL = """UPDATE matches SET referee_id = NULL, status = 'PENDING', assigned_at = NULL
+    WHERE match_id = ? AND status = 'ASSIGNED' AND referee_id = ?"""
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+_INSERT_SNAPSHOT_SQL = (
+    "INSERT INTO standings_snapshots (snapshot_id, league_id, round_id, computed_at) "
+    "VALUES (?, ?, ?, ?)"
+)
+
+_INSERT_RANKING_SQL = """INSERT INTO player_rankings
+    (snapshot_id, player_id, rank, points, wins, draws, losses, matches_played)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+def _ranking_rows(
+    snapshot_id: str, rankings: Sequence[Tuple[str, PlayerRanking]]
+) -> List[Tuple[Any, ...]]:
+    """Flatten (player_id, ranking) pairs into player_rankings rows."""
+    return [
+        (
+            snapshot_id,
+            player_id,
+            ranking.rank,
+            ranking.points,
+            ranking.wins,
+            ranking.draws,
+            ranking.losses,
+            ranking.matches_played,
+        )
+        for player_id, ranking in rankings
+    ]
+
+
 class LeagueDatabase:
     """SQLite database wrapper for league persistence."""
 
-    def __init__(self, db_path: str):
-        """Initialize the database connection.
+    def __init__(self, db_path: str, readers: int = _DEFAULT_READERS):
+        """Initialize the database connections.
+
+        Opens one writer connection and a fixed pool of read connections.
 
         Args:
             db_path: Path to SQLite database file
+            readers: Number of pooled read connections
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._local = threading.local()
+        self._writer = self._connect()
+        # WAL persists in the file; set it before any reader connects
+        self._writer.execute("PRAGMA journal_mode=WAL")
+        self._write_lock = threading.RLock()
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        for _ in range(readers):
+            reader = self._connect()
+            reader.execute("PRAGMA query_only=ON")
+            self._readers.put(reader)
+        self._reader_count = readers
+        self._row_cache = _RowCache(_ROW_CACHE_SIZE)
+        self._write_owner: Optional[int] = None
+        # Only touched while holding _write_lock
+        self._in_transaction = False
+        self._pending_invalidations: List[Tuple[str, str]] = []
+        self._write_q: "queue.Queue[Optional[_QueuedWrite]]" = queue.Queue()
+        self._write_thread = threading.Thread(
+            target=self._drain_writes, name="league-db-writer", daemon=True
+        )
+        self._write_thread.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a tuned connection to the database file."""
+        conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.executescript(_CONNECTION_PRAGMAS)
+        return conn
 
     @property
     def conn(self) -> sqlite3.Connection:
-        """Get thread-local database connection."""
-        if not hasattr(self._local, "conn"):
-            self._local.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
-            self._local.conn.row_factory = sqlite3.Row
-        return self._local.conn
+        """Get the writer connection (use transaction() to serialize writes)."""
+        return self._writer
 
     @contextmanager
-    def transaction(self):
-        """Context manager for database transactions."""
-        conn = self.conn
+    def read_conn(self):
+        """Borrow a pooled read connection for the duration of the block."""
+        conn = self._readers.get()
         try:
             yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            raise DatabaseError(f"Transaction failed: {str(e)}", error=str(e)) from e
+        finally:
+            self._readers.put(conn)
+
+    def _fetchone(self, sql: str, params: Sequence[Any] = ()) -> Optional[sqlite3.Row]:
+        """Run a query on a pooled reader and return the first row."""
+        with self.read_conn() as conn:
+            return conn.execute(sql, params).fetchone()
+
+    def _fetch_cached(self, table: str, key: str, sql: str) -> Optional[Dict[str, Any]]:
+        """Fetch a row by primary key through the row cache."""
+        cache_key = (table, key)
+        row = self._row_cache.get(cache_key)
+        if row is not None:
+            return row
+        generation = self._row_cache.generation
+        fetched = self._fetchone(sql, (key,))
+        if fetched is None:
+            return None
+        row = dict(fetched)
+        self._row_cache.put(cache_key, row, generation)
+        return row
+
+    def _fetchall(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        """Run a query on a pooled reader and return all rows."""
+        with self.read_conn() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    @contextmanager
+    def transaction(self):
+        """Context manager for database transactions on the writer connection.
+
+        The block may write any table, so the row cache is cleared once it ends.
+        """
+        try:
+            with self._write_transaction() as conn:
+                yield conn
+        finally:
+            self._row_cache.clear()
+
+    @contextmanager
+    def _write_transaction(self):
+        """Transaction for writes whose row cache entries are handled by the caller.
+
+        Inside another transaction on the same thread the block joins it and
+        commits or rolls back with the outer transaction.
+        """
+        with self._write_lock:
+            if self._in_transaction:
+                yield self._writer
+                return
+            owner = self._write_owner
+            self._write_owner = threading.get_ident()
+            self._in_transaction = True
+            conn = self._writer
+            try:
+                yield conn
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                raise DatabaseError(f"Transaction failed: {str(e)}", error=str(e)) from e
+            finally:
+                self._in_transaction = False
+                self._write_owner = owner
+                self._flush_invalidations()
+
+    def _flush_invalidations(self):
+        """Drop the cache entries of inline writes once their transaction has ended."""
+        for cache_key in self._pending_invalidations:
+            self._row_cache.invalidate(cache_key)
+        self._pending_invalidations.clear()
+
+    def _queue_write(
+        self,
+        sql: str,
+        params: Tuple[Any, ...],
+        cache_key: Optional[Tuple[str, str]] = None,
+        wait: bool = True,
+    ) -> "Future[None]":
+        """Hand a single-statement write to the background writer.
+
+        Statements are committed in submission order, several per transaction
+        when they queue up together. A caller that already holds the writer
+        runs the statement inline, since the writer thread would wait on its
+        lock; inside transaction() the statement joins the caller's
+        transaction and commits or rolls back with it.
+
+        Args:
+            sql: Statement to execute
+            params: Statement parameters
+            cache_key: Row cache entry to drop once the write commits
+            wait: Block until the write is committed
+
+        Returns:
+            Future resolved once the write is committed
+
+        Raises:
+            DatabaseError: If wait is set and the write fails
+        """
+        future: "Future[None]" = Future()
+        if self._write_owner == threading.get_ident():
+            self._write_inline(sql, params, cache_key, future)
+        elif not self._write_thread.is_alive():
+            future.set_exception(DatabaseError("Database is closed"))
+        else:
+            self._write_q.put((sql, params, cache_key, future))
+        if wait:
+            future.result()
+        return future
+
+    def _write_inline(
+        self,
+        sql: str,
+        params: Tuple[Any, ...],
+        cache_key: Optional[Tuple[str, str]],
+        future: "Future[None]",
+    ):
+        """Run a write on the writer connection the calling thread already holds."""
+        if not self._in_transaction:
+            # Writer owned outside a transaction (bulk_load): commit on our own
+            self._commit_writes([(sql, params, cache_key, future)])
+            return
+        try:
+            self._writer.execute(sql, params)
+        except sqlite3.Error as e:
+            # SQLite undoes only the failed statement; the caller's transaction stays open
+            future.set_exception(DatabaseError(f"Write failed: {str(e)}", error=str(e)))
+            return
+        if cache_key is not None:
+            self._pending_invalidations.append(cache_key)
+        future.set_result(None)
+
+    def _drain_writes(self):
+        """Background writer loop; a None item stops it."""
+        while True:
+            item = self._write_q.get()
+            if item is None:
+                return
+            batch = [item]
+            while len(batch) < _WRITE_BATCH:
+                try:
+                    item = self._write_q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._commit_writes(batch)
+                    return
+                batch.append(item)
+            self._commit_writes(batch)
+
+    def _commit_writes(self, batch: List["_QueuedWrite"]):
+        """Commit queued writes in one transaction and resolve their futures."""
+        try:
+            with self._write_transaction() as conn:
+                for sql, params, _, _ in batch:
+                    conn.execute(sql, params)
+        except DatabaseError as e:
+            if len(batch) == 1:
+                batch[0][3].set_exception(e)
+                return
+            # Retry one by one so a single bad statement fails only its caller
+            for item in batch:
+                self._commit_writes([item])
+            return
+        for _, _, cache_key, future in batch:
+            if cache_key is not None:
+                self._row_cache.invalidate(cache_key)
+            future.set_result(None)
+
+    @contextmanager
+    def bulk_load(self, expected_rows: Optional[int] = None):
+        """Drop secondary indexes for a bulk insert and rebuild them afterwards.
+
+        Writes from other threads, including the background writer, wait
+        until the indexes are back; writes from the calling thread, queued
+        status updates included, run inline. UNIQUE and primary key indexes
+        are untouched, so integrity checks still apply during the load.
+        Statistics are re-gathered with ANALYZE once the indexes exist.
+
+        Args:
+            expected_rows: Rows the load will insert; below _BULK_LOAD_MIN_ROWS
+                the indexes are kept and maintained on insert. None always drops.
+        """
+        if expected_rows is not None and expected_rows < _BULK_LOAD_MIN_ROWS:
+            yield
+            return
+        with self._write_lock:
+            # Own the writer for the whole load so same-thread queued writes
+            # run inline instead of waiting on the writer thread we block
+            owner = self._write_owner
+            self._write_owner = threading.get_ident()
+            try:
+                with self._write_transaction() as conn:
+                    for name in _SECONDARY_INDEXES:
+                        conn.execute(f"DROP INDEX IF EXISTS {name}")
+                try:
+                    yield
+                finally:
+                    with self._write_transaction() as conn:
+                        for index_sql in _SECONDARY_INDEXES.values():
+                            conn.execute(index_sql)
+                        # The load changed row counts, so refresh all planner statistics
+                        conn.execute("ANALYZE")
+            finally:
+                self._write_owner = owner
 
     def initialize_schema(self):
         """Create all database tables if they don't exist."""
-        with self.transaction() as conn:
+        with self._write_transaction() as conn:
             cursor = conn.cursor()
 
             # Leagues table
@@ -137,6 +507,9 @@ class LeagueDatabase:
             """
             )
 
+            # Retired per-seat copy of matches.players; nothing read it
+            cursor.execute("DROP TABLE IF EXISTS match_players")
+
             # Match results table
             cursor.execute(
                 """
@@ -185,27 +558,40 @@ class LeagueDatabase:
             """
             )
 
+            # Secondary indexes for lookups by league, round and status
+            for index_sql in _SECONDARY_INDEXES.values():
+                cursor.execute(index_sql)
+
+            # Refresh planner statistics where they are missing or stale
+            cursor.execute("PRAGMA optimize")
+
     # League operations
     def create_league(self, league_id: str, status: str, created_at: str, config: Dict[str, Any]):
         """Create a new league record."""
-        with self.transaction() as conn:
+        with self._write_transaction() as conn:
             conn.execute(
                 "INSERT INTO leagues (league_id, status, created_at, config) VALUES (?, ?, ?, ?)",
-                (league_id, status, created_at, json.dumps(config)),
+                (league_id, status, created_at, dumps(config)),
             )
 
-    def update_league_status(self, league_id: str, status: str):
-        """Update league status."""
-        with self.transaction() as conn:
-            conn.execute("UPDATE leagues SET status = ? WHERE league_id = ?", (status, league_id))
+    def update_league_status(
+        self, league_id: str, status: str, *, wait: bool = True
+    ) -> "Future[None]":
+        """Update league status through the background writer."""
+        return self._queue_write(
+            "UPDATE leagues SET status = ? WHERE league_id = ?",
+            (status, league_id),
+            cache_key=("league", league_id),
+            wait=wait,
+        )
 
     def get_league(self, league_id: str) -> Optional[Dict[str, Any]]:
         """Get league information."""
-        cursor = self.conn.execute("SELECT * FROM leagues WHERE league_id = ?", (league_id,))
-        row = cursor.fetchone()
-        if row:
-            return dict(row)
-        return None
+        return self._fetch_cached(
+            "league",
+            league_id,
+            "SELECT league_id, status, created_at, config FROM leagues WHERE league_id = ?",
+        )
 
     # Referee operations
     def register_referee(
@@ -218,7 +604,7 @@ class LeagueDatabase:
         endpoint_url: str = None,
     ):
         """Register a new referee."""
-        with self.transaction() as conn:
+        with self._write_transaction() as conn:
             conn.execute(
                 """INSERT INTO referees
                    (referee_id, league_id, auth_token, endpoint_url, status, registered_at)
@@ -228,21 +614,30 @@ class LeagueDatabase:
 
     def get_referee(self, referee_id: str) -> Optional[Dict[str, Any]]:
         """Get referee information."""
-        cursor = self.conn.execute("SELECT * FROM referees WHERE referee_id = ?", (referee_id,))
-        row = cursor.fetchone()
-        return dict(row) if row else None
+        return self._fetch_cached(
+            "referee",
+            referee_id,
+            """SELECT referee_id, league_id, auth_token, endpoint_url, status, registered_at
+               FROM referees WHERE referee_id = ?""",
+        )
 
     def get_all_referees(self, league_id: str) -> List[Dict[str, Any]]:
         """Get all referees for a league."""
-        cursor = self.conn.execute("SELECT * FROM referees WHERE league_id = ?", (league_id,))
-        return [dict(row) for row in cursor.fetchall()]
+        return [
+            dict(row)
+            for row in self._fetchall("SELECT * FROM referees WHERE league_id = ?", (league_id,))
+        ]
 
-    def update_referee_status(self, referee_id: str, status: str):
-        """Update referee status."""
-        with self.transaction() as conn:
-            conn.execute(
-                "UPDATE referees SET status = ? WHERE referee_id = ?", (status, referee_id)
-            )
+    def update_referee_status(
+        self, referee_id: str, status: str, *, wait: bool = True
+    ) -> "Future[None]":
+        """Update referee status through the background writer."""
+        return self._queue_write(
+            "UPDATE referees SET status = ? WHERE referee_id = ?",
+            (status, referee_id),
+            cache_key=("referee", referee_id),
+            wait=wait,
+        )
 
     # Player operations
     def register_player(
@@ -255,45 +650,102 @@ class LeagueDatabase:
         endpoint_url: str = None,
     ):
         """Register a new player."""
-        with self.transaction() as conn:
-            conn.execute(
+        self.register_players([(player_id, league_id, auth_token, registered_at, endpoint_url)])
+
+    def register_players(self, players: Sequence[Tuple[str, str, str, str, Optional[str]]]):
+        """Register several players in one transaction.
+
+        Args:
+            players: (player_id, league_id, auth_token, registered_at, endpoint_url) rows
+        """
+        with self._write_transaction() as conn:
+            conn.executemany(
                 """INSERT INTO players
                    (player_id, league_id, auth_token, endpoint_url, status, registered_at)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (player_id, league_id, auth_token, endpoint_url, "REGISTERED", registered_at),
+                   VALUES (?, ?, ?, ?, 'REGISTERED', ?)""",
+                [
+                    (player_id, league_id, auth_token, endpoint_url, registered_at)
+                    for player_id, league_id, auth_token, registered_at, endpoint_url in players
+                ],
             )
 
     def get_player(self, player_id: str) -> Optional[Dict[str, Any]]:
         """Get player information."""
-        cursor = self.conn.execute("SELECT * FROM players WHERE player_id = ?", (player_id,))
-        row = cursor.fetchone()
-        return dict(row) if row else None
+        return self._fetch_cached(
+            "player",
+            player_id,
+            """SELECT player_id, league_id, auth_token, endpoint_url, status, registered_at
+               FROM players WHERE player_id = ?""",
+        )
+
+    def get_players(self, player_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several players with one query per 500 ids.
+
+        Args:
+            player_ids: Player identifiers; duplicates are fetched once
+
+        Returns:
+            Player information keyed by player_id; unknown ids are absent
+        """
+        ids = list(dict.fromkeys(player_ids))
+        players = {}
+        for start in range(0, len(ids), _IN_CHUNK):
+            chunk = ids[start : start + _IN_CHUNK]
+            placeholders = ", ".join("?" * len(chunk))
+            for row in self._fetchall(
+                f"""SELECT player_id, league_id, auth_token, endpoint_url, status, registered_at
+                    FROM players WHERE player_id IN ({placeholders})""",
+                chunk,
+            ):
+                players[row["player_id"]] = dict(row)
+        return players
 
     def get_all_players(self, league_id: str) -> List[Dict[str, Any]]:
         """Get all players for a league."""
-        cursor = self.conn.execute("SELECT * FROM players WHERE league_id = ?", (league_id,))
-        return [dict(row) for row in cursor.fetchall()]
+        return [
+            dict(row)
+            for row in self._fetchall("SELECT * FROM players WHERE league_id = ?", (league_id,))
+        ]
 
-    def update_player_status(self, player_id: str, status: str):
-        """Update player status."""
-        with self.transaction() as conn:
-            conn.execute("UPDATE players SET status = ? WHERE player_id = ?", (status, player_id))
+    def update_player_status(
+        self, player_id: str, status: str, *, wait: bool = True
+    ) -> "Future[None]":
+        """Update player status through the background writer."""
+        return self._queue_write(
+            "UPDATE players SET status = ? WHERE player_id = ?",
+            (status, player_id),
+            cache_key=("player", player_id),
+            wait=wait,
+        )
 
     # Round operations
     def create_round(
         self, round_id: str, league_id: str, round_number: int, status: str = "PENDING"
     ):
         """Create a new round."""
-        with self.transaction() as conn:
-            conn.execute(
+        self.create_rounds([(round_id, league_id, round_number, status)])
+
+    def create_rounds(self, rounds: Sequence[Tuple[str, str, int, str]]):
+        """Create several rounds in one transaction.
+
+        Args:
+            rounds: (round_id, league_id, round_number, status) rows
+        """
+        with self._write_transaction() as conn:
+            conn.executemany(
                 "INSERT INTO rounds (round_id, league_id, round_number, status) VALUES (?, ?, ?, ?)",
-                (round_id, league_id, round_number, status),
+                rounds,
             )
 
-    def update_round_status(self, round_id: str, status: str):
-        """Update round status."""
-        with self.transaction() as conn:
-            conn.execute("UPDATE rounds SET status = ? WHERE round_id = ?", (status, round_id))
+    def update_round_status(
+        self, round_id: str, status: str, *, wait: bool = True
+    ) -> "Future[None]":
+        """Update round status through the background writer."""
+        return self._queue_write(
+            "UPDATE rounds SET status = ? WHERE round_id = ?",
+            (status, round_id),
+            wait=wait,
+        )
 
     # Match operations
     def create_match(
@@ -306,52 +758,149 @@ class LeagueDatabase:
         status: str = "PENDING",
     ):
         """Create a new match."""
-        with self.transaction() as conn:
-            conn.execute(
+        self.create_matches([(match_id, round_id, game_type, players, status)])
+
+    def create_matches(self, matches: Sequence[Tuple[str, str, str, List[str], str]]):
+        """Create several matches in one transaction.
+
+        Args:
+            matches: (match_id, round_id, game_type, players, status) rows
+        """
+        with self._write_transaction() as conn:
+            conn.executemany(
                 "INSERT INTO matches (match_id, round_id, game_type, players, status) VALUES (?, ?, ?, ?, ?)",
-                (match_id, round_id, game_type, json.dumps(players), status),
+                [
+                    (match_id, round_id, game_type, dumps(players), status)
+                    for match_id, round_id, game_type, players, status in matches
+                ],
             )
 
-    def assign_match(self, match_id: str, referee_id: str, assigned_at: str):
-        """Assign a match to a referee."""
-        with self.transaction() as conn:
-            conn.execute(
-                "UPDATE matches SET referee_id = ?, status = ?, assigned_at = ? WHERE match_id = ?",
-                (referee_id, "ASSIGNED", assigned_at, match_id),
-            )
+    def assign_match(
+        self, match_id: str, referee_id: str, assigned_at: str
+    ) -> Optional[Dict[str, Any]]:
+        """Assign a pending match to a referee.
+
+        The status check happens in the UPDATE itself, so of two racing
+        assignments only the first takes effect.
+
+        Args:
+            match_id: Match identifier
+            referee_id: Referee identifier
+            assigned_at: Assignment timestamp
+
+        Returns:
+            The assigned match's match_id, round_id and status, or None if the
+            match does not exist or is no longer PENDING
+        """
+        params = (referee_id, assigned_at, match_id)
+        with self._write_transaction() as conn:
+            if _HAS_RETURNING:
+                # Drain the cursor so the statement is finished before commit
+                rows = conn.execute(_ASSIGN_MATCH_SQL + _ASSIGN_MATCH_RETURNING, params).fetchall()
+                row = rows[0] if rows else None
+            else:
+                cursor = conn.execute(_ASSIGN_MATCH_SQL, params)
+                row = None
+                if cursor.rowcount:
+                    row = conn.execute(
+                        "SELECT match_id, round_id, status FROM matches WHERE match_id = ?",
+                        (match_id,),
+                    ).fetchone()
+        return dict(row) if row else None
 
-    def update_match_status(self, match_id: str, status: str):
-        """Update match status."""
-        with self.transaction() as conn:
-            conn.execute("UPDATE matches SET status = ? WHERE match_id = ?", (status, match_id))
+    def unassign_matches(self, matches: Sequence[Tuple[str, str]]) -> int:
+        """Return assigned matches to PENDING in one transaction.
+
+        A match is only reset while it is still ASSIGNED to the given
+        referee, so a match the referee already started is left alone.
+
+        Args:
+            matches: (match_id, referee_id) pairs
+
+        Returns:
+            Number of matches reset
+        """
+        with self._write_transaction() as conn:
+            cursor = conn.executemany(_UNASSIGN_MATCH_SQL, matches)
+            return cursor.rowcount
+
+    def update_match_status(
+        self, match_id: str, status: str, *, wait: bool = True
+    ) -> "Future[None]":
+        """Update match status through the background writer."""
+        return self._queue_write(
+            "UPDATE matches SET status = ? WHERE match_id = ?",
+            (status, match_id),
+            wait=wait,
+        )
 
     def get_match(self, match_id: str) -> Optional[Dict[str, Any]]:
         """Get match information."""
-        cursor = self.conn.execute("SELECT * FROM matches WHERE match_id = ?", (match_id,))
-        row = cursor.fetchone()
+        row = self._fetchone(
+            """SELECT match_id, round_id, referee_id, game_type, players, status, assigned_at
+               FROM matches WHERE match_id = ?""",
+            (match_id,),
+        )
         if row:
             result = dict(row)
-            result["players"] = json.loads(result["players"])
+            result["players"] = loads(result["players"])
             return result
         return None
 
     def get_pending_matches(self, league_id: str) -> List[Dict[str, Any]]:
         """Get all pending matches for a league."""
-        cursor = self.conn.execute(
+        results = []
+        for row in self._fetchall(
             """
             SELECT m.* FROM matches m
             JOIN rounds r ON m.round_id = r.round_id
             WHERE r.league_id = ? AND m.status = 'PENDING'
         """,
             (league_id,),
-        )
-        results = []
-        for row in cursor.fetchall():
+        ):
             match = dict(row)
-            match["players"] = json.loads(match["players"])
+            match["players"] = loads(match["players"])
             results.append(match)
         return results
 
+    def iter_pending_matches(
+        self, league_id: str, batch_size: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the pending matches of a league in batches, in creation order.
+
+        Each batch is read with its own query, keyed on the last row seen, so
+        matches claimed between batches are neither skipped nor repeated.
+
+        Args:
+            league_id: League identifier
+            batch_size: Maximum number of matches per batch
+
+        Yields:
+            Lists of pending match information
+        """
+        last_rowid = 0
+        while True:
+            rows = self._fetchall(
+                """
+                SELECT m.rowid AS row_order, m.* FROM matches m
+                JOIN rounds r ON m.round_id = r.round_id
+                WHERE r.league_id = ? AND m.status = 'PENDING' AND m.rowid > ?
+                ORDER BY m.rowid
+                LIMIT ?
+            """,
+                (league_id, last_rowid, batch_size),
+            )
+            if not rows:
+                return
+            last_rowid = rows[-1]["row_order"]
+            batch = []
+            for row in rows:
+                match = dict(row)
+                del match["row_order"]
+                match["players"] = loads(match["players"])
+                batch.append(match)
+            yield batch
+
     # Result operations
     def store_result(
         self,
@@ -364,7 +913,7 @@ class LeagueDatabase:
         reported_at: str,
     ):
         """Store a match result."""
-        with self.transaction() as conn:
+        with self._write_transaction() as conn:
             conn.execute(
                 """INSERT INTO match_results
                    (result_id, match_id, outcome, points, game_metadata, reported_at)
@@ -372,29 +921,29 @@ class LeagueDatabase:
                 (
                     result_id,
                     match_id,
-                    json.dumps(outcome),
-                    json.dumps(points),
-                    json.dumps(game_metadata) if game_metadata else None,
+                    dumps(outcome),
+                    dumps(points),
+                    dumps(game_metadata) if game_metadata else None,
                     reported_at,
                 ),
             )
 
     def get_result(self, match_id: str) -> Optional[Dict[str, Any]]:
         """Get result for a match."""
-        cursor = self.conn.execute("SELECT * FROM match_results WHERE match_id = ?", (match_id,))
-        row = cursor.fetchone()
+        row = self._fetchone("SELECT * FROM match_results WHERE match_id = ?", (match_id,))
         if row:
             result = dict(row)
-            result["outcome"] = json.loads(result["outcome"])
-            result["points"] = json.loads(result["points"])
+            result["outcome"] = loads(result["outcome"])
+            result["points"] = loads(result["points"])
             if result["game_metadata"]:
-                result["game_metadata"] = json.loads(result["game_metadata"])
+                result["game_metadata"] = loads(result["game_metadata"])
             return result
         return None
 
     def get_all_results(self, league_id: str) -> List[Dict[str, Any]]:
         """Get all results for a league."""
-        cursor = self.conn.execute(
+        results = []
+        for row in self._fetchall(
             """
             SELECT mr.* FROM match_results mr
             JOIN matches m ON mr.match_id = m.match_id
@@ -402,14 +951,12 @@ class LeagueDatabase:
             WHERE r.league_id = ?
         """,
             (league_id,),
-        )
-        results = []
-        for row in cursor.fetchall():
+        ):
             result = dict(row)
-            result["outcome"] = json.loads(result["outcome"])
-            result["points"] = json.loads(result["points"])
+            result["outcome"] = loads(result["outcome"])
+            result["points"] = loads(result["points"])
             if result["game_metadata"]:
-                result["game_metadata"] = json.loads(result["game_metadata"])
+                result["game_metadata"] = loads(result["game_metadata"])
             results.append(result)
         return results
 
@@ -418,76 +965,129 @@ class LeagueDatabase:
         self, snapshot_id: str, league_id: str, round_id: Optional[str], computed_at: str
     ):
         """Create a standings snapshot."""
-        with self.transaction() as conn:
-            conn.execute(
-                "INSERT INTO standings_snapshots (snapshot_id, league_id, round_id, computed_at) VALUES (?, ?, ?, ?)",
-                (snapshot_id, league_id, round_id, computed_at),
-            )
+        with self._write_transaction() as conn:
+            conn.execute(_INSERT_SNAPSHOT_SQL, (snapshot_id, league_id, round_id, computed_at))
 
     def store_player_ranking(self, snapshot_id: str, player_id: str, ranking: PlayerRanking):
         """Store a player ranking in a snapshot.
 
+        Deprecated: use write_snapshot to store a snapshot with all its rankings.
+
         Args:
             snapshot_id: Snapshot identifier
             player_id: Player identifier
             ranking: Player ranking statistics
         """
-        with self.transaction() as conn:
-            conn.execute(
-                """INSERT INTO player_rankings
-                   (snapshot_id, player_id, rank, points, wins, draws, losses, matches_played)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    snapshot_id,
-                    player_id,
-                    ranking.rank,
-                    ranking.points,
-                    ranking.wins,
-                    ranking.draws,
-                    ranking.losses,
-                    ranking.matches_played,
-                ),
-            )
+        self.store_player_rankings(snapshot_id, [(player_id, ranking)])
+
+    def store_player_rankings(
+        self, snapshot_id: str, rankings: Sequence[Tuple[str, PlayerRanking]]
+    ):
+        """Store all player rankings of a snapshot in one transaction.
+
+        Args:
+            snapshot_id: Snapshot identifier
+            rankings: (player_id, ranking) pairs
+        """
+        with self._write_transaction() as conn:
+            conn.executemany(_INSERT_RANKING_SQL, _ranking_rows(snapshot_id, rankings))
+
+    def write_snapshot(
+        self,
+        snapshot_id: str,
+        league_id: str,
+        round_id: Optional[str],
+        computed_at: str,
+        rankings: Sequence[Tuple[str, PlayerRanking]],
+    ):
+        """Store a standings snapshot and all of its rankings in one transaction.
+
+        Args:
+            snapshot_id: Snapshot identifier
+            league_id: League identifier
+            round_id: Optional round identifier
+            computed_at: Computation timestamp
+            rankings: (player_id, ranking) pairs
+        """
+        with self._write_transaction() as conn:
+            conn.execute(_INSERT_SNAPSHOT_SQL, (snapshot_id, league_id, round_id, computed_at))
+            conn.executemany(_INSERT_RANKING_SQL, _ranking_rows(snapshot_id, rankings))
 
     def get_standings(
         self, league_id: str, round_id: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         """Get standings for a league or specific round."""
-        # Find the most recent snapshot
-        if round_id:
-            cursor = self.conn.execute(
-                """SELECT * FROM standings_snapshots
-                   WHERE league_id = ? AND round_id = ?
-                   ORDER BY computed_at DESC LIMIT 1""",
-                (league_id, round_id),
-            )
-        else:
-            cursor = self.conn.execute(
-                "SELECT * FROM standings_snapshots WHERE league_id = ? ORDER BY computed_at DESC LIMIT 1",
-                (league_id,),
-            )
-
-        snapshot = cursor.fetchone()
-        if not snapshot:
+        # Most recent snapshot and its rankings in one query; the LEFT JOIN
+        # keeps a snapshot that has no rankings yet
+        round_filter = " AND round_id = ?" if round_id else ""
+        params = (league_id, round_id) if round_id else (league_id,)
+        rows = self._fetchall(
+            f"""WITH latest AS (
+                   SELECT snapshot_id, league_id, round_id, computed_at
+                   FROM standings_snapshots
+                   WHERE league_id = ?{round_filter}
+                   ORDER BY computed_at DESC LIMIT 1
+               )
+               SELECT l.snapshot_id, l.league_id, l.round_id, l.computed_at,
+                      pr.player_id, pr.rank, pr.points, pr.wins, pr.draws,
+                      pr.losses, pr.matches_played
+               FROM latest l
+               LEFT JOIN player_rankings pr ON pr.snapshot_id = l.snapshot_id
+               ORDER BY pr.rank""",  # nosec B608 - filter is a fixed literal
+            params,
+        )
+        if not rows:
             return None
 
-        snapshot_id = snapshot["snapshot_id"]
-
-        # Get rankings
-        cursor = self.conn.execute(
-            "SELECT * FROM player_rankings WHERE snapshot_id = ? ORDER BY rank", (snapshot_id,)
-        )
-        rankings = [dict(row) for row in cursor.fetchall()]
+        first = rows[0]
+        snapshot_id = first["snapshot_id"]
+        rankings = [
+            {
+                "snapshot_id": snapshot_id,
+                "player_id": row["player_id"],
+                "rank": row["rank"],
+                "points": row["points"],
+                "wins": row["wins"],
+                "draws": row["draws"],
+                "losses": row["losses"],
+                "matches_played": row["matches_played"],
+            }
+            for row in rows
+            if row["player_id"] is not None
+        ]
 
         return {
             "snapshot_id": snapshot_id,
-            "league_id": snapshot["league_id"],
-            "round_id": snapshot["round_id"],
-            "computed_at": snapshot["computed_at"],
+            "league_id": first["league_id"],
+            "round_id": first["round_id"],
+            "computed_at": first["computed_at"],
             "rankings": rankings,
         }
 
+    def count_unfinished_matches(self, league_id: str) -> int:
+        """Count matches in a league that are not yet completed."""
+        row = self._fetchone(
+            """SELECT COUNT(*) FROM matches m
+               JOIN rounds r ON m.round_id = r.round_id
+               WHERE r.league_id = ? AND m.status != 'COMPLETED'""",
+            (league_id,),
+        )
+        return row[0]
+
     def close(self):
-        """Close database connection."""
-        if hasattr(self._local, "conn"):
-            self._local.conn.close()
+        """Flush queued writes, then close the writer and all pooled read connections."""
+        self._write_q.put(None)
+        self._write_thread.join()
+        with self._write_lock:
+            try:
+                # Let SQLite refresh statistics the session's queries would benefit from
+                self._writer.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
+            self._writer.close()
+        self._row_cache.clear()
+        # Closed readers go back in the pool so later use fails loudly instead of blocking
+        readers = [self._readers.get() for _ in range(self._reader_count)]
+        for reader in readers:
+            reader.close()
+            self._readers.put(reader)
@@ -4,14 +4,19 @@ This module implements the league.v2 protocol envelope structure,
 message type definitions, and validation rules as specified in the PRD.
 """
 
+import os
 import re
+import sys
+import threading
+import time
 import uuid
-from dataclasses import asdict, dataclass, fields
+from dataclasses import dataclass, fields
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from .errors import ErrorCode, ProtocolError, ValidationError
+from .serialization import dumps_bytes
 
 
 class MessageType(str, Enum):
@@ -53,13 +58,45 @@ PROTOCOL_VERSION = "league.v2"
 JSONRPC_VERSION = "2.0"
 MCP_METHOD = "league.handle"
 
+# Dict lookup instead of constructing a MessageType (and catching ValueError) per message
+_MESSAGE_TYPES: Dict[str, MessageType] = {member.value: member for member in MessageType}
 
-@dataclass
+
+def lookup_message_type(value: str) -> MessageType:
+    """Return the MessageType member for a validated envelope's message_type.
+
+    Args:
+        value: Message type string from an envelope
+
+    Returns:
+        Matching MessageType member
+
+    Raises:
+        ProtocolError: If the value is not a known message type
+    """
+    try:
+        return _MESSAGE_TYPES[value]
+    except (KeyError, TypeError) as exc:
+        raise ProtocolError(
+            ErrorCode.INVALID_MESSAGE_TYPE,
+            f"Unknown message type: {value}",
+            {"message_type": value},
+        ) from exc
+
+
+_REQUIRED_ENVELOPE_FIELDS = ("protocol", "message_type", "sender", "timestamp", "conversation_id")
+
+# dataclass(slots=True) is only available on Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Envelope:
     """Protocol envelope wrapping all league messages.
 
     The envelope contains metadata required for routing, authentication,
     and audit logging. All fields are validated according to PRD Section 2.
+    Envelopes are immutable; use ``dataclasses.replace`` to derive variants.
     """
 
     # Required fields (always present)
@@ -77,12 +114,29 @@ class Envelope:
     game_type: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert envelope to dictionary, excluding None values.
+        """Convert envelope to dictionary, excluding unset contextual fields.
 
         Returns:
             Dictionary representation of envelope
         """
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        result = {
+            "protocol": self.protocol,
+            "message_type": self.message_type,
+            "sender": self.sender,
+            "timestamp": self.timestamp,
+            "conversation_id": self.conversation_id,
+        }
+        if self.auth_token is not None:
+            result["auth_token"] = self.auth_token
+        if self.league_id is not None:
+            result["league_id"] = self.league_id
+        if self.round_id is not None:
+            result["round_id"] = self.round_id
+        if self.match_id is not None:
+            result["match_id"] = self.match_id
+        if self.game_type is not None:
+            result["game_type"] = self.game_type
+        return result
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Envelope":
@@ -98,8 +152,7 @@ class Envelope:
             ValidationError: If required fields are missing or invalid
         """
         # Validate required fields
-        required = ["protocol", "message_type", "sender", "timestamp", "conversation_id"]
-        for field_name in required:
+        for field_name in _REQUIRED_ENVELOPE_FIELDS:
             if field_name not in data:
                 raise ValidationError(
                     f"Missing required envelope field: {field_name}", field=field_name
@@ -114,14 +167,7 @@ class Envelope:
             )
 
         # Validate message type
-        try:
-            MessageType(data["message_type"])
-        except ValueError as exc:
-            raise ProtocolError(
-                ErrorCode.INVALID_MESSAGE_TYPE,
-                f"Unknown message type: {data['message_type']}",
-                {"message_type": data["message_type"]},
-            ) from exc
+        lookup_message_type(data["message_type"])
 
         # Validate sender format
         validate_sender_format(data["sender"])
@@ -132,8 +178,22 @@ class Envelope:
         # Validate conversation_id format
         validate_uuid(data["conversation_id"], "conversation_id")
 
-        field_names = {field.name for field in fields(cls)}
-        return cls(**{k: v for k, v in data.items() if k in field_names})
+        return cls(**{k: v for k, v in data.items() if k in _ENVELOPE_FIELDS})
+
+
+_ENVELOPE_FIELDS = frozenset(field.name for field in fields(Envelope))
+
+
+# Fixed senders and the pattern for agent senders, e.g. "player:P01"
+_SPECIAL_SENDERS = frozenset({"league_manager", "admin"})
+_SENDER_RE = re.compile(r"^(?:referee|player):[a-zA-Z0-9_-]+$")
+
+# Canonical "YYYY-MM-DDTHH:MM:SS[.ffffff]Z" with in-range fields. Days stop at
+# 28 so every match is a real date; days 29-31 take the full parse.
+_UTC_TIMESTAMP_RE = re.compile(
+    r"^\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|1\d|2[0-8])"
+    r"T(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d(?:\.\d{1,6})?Z$"
+)
 
 
 def validate_sender_format(sender: str) -> None:
@@ -151,11 +211,10 @@ def validate_sender_format(sender: str) -> None:
     Raises:
         ValidationError: If format is invalid
     """
-    if sender in ["league_manager", "admin"]:
+    if sender in _SPECIAL_SENDERS:
         return
 
-    pattern = r"^(referee|player):[a-zA-Z0-9_-]+$"
-    if not re.match(pattern, sender):
+    if not _SENDER_RE.match(sender):
         raise ValidationError(
             f"Invalid sender format: {sender}",
             field="sender",
@@ -173,6 +232,9 @@ def validate_timestamp(timestamp: str) -> None:
         ValidationError: If timestamp is invalid or not UTC
     """
     try:
+        # Allocation-free fast path for the canonical form utc_now() produces
+        if _UTC_TIMESTAMP_RE.match(timestamp):
+            return
         dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
         # Ensure it's UTC
         if dt.utcoffset().total_seconds() != 0:
@@ -201,7 +263,7 @@ def validate_uuid(value: str, field_name: str) -> None:
         ) from exc
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class JSONRPCRequest:
     """JSON-RPC 2.0 request structure."""
 
@@ -211,8 +273,24 @@ class JSONRPCRequest:
     id: str
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        """Convert to dictionary for JSON serialization.
+
+        Params are shared, not deep-copied as dataclasses.asdict would.
+        """
+        return {
+            "jsonrpc": self.jsonrpc,
+            "method": self.method,
+            "params": self.params,
+            "id": self.id,
+        }
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize straight from the dataclass, without building to_dict() first.
+
+        Returns:
+            UTF-8 encoded JSON of the request
+        """
+        return dumps_bytes(self)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "JSONRPCRequest":
@@ -261,7 +339,7 @@ class JSONRPCRequest:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class JSONRPCResponse:
     """JSON-RPC 2.0 response structure."""
 
@@ -281,6 +359,23 @@ class JSONRPCResponse:
         response["id"] = self.id
         return response
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact JSON bytes.
+
+        Plain success and plain error responses skip to_dict(); anything else
+        goes through it so an unset result or error is omitted rather than
+        sent as null.
+
+        Returns:
+            UTF-8 encoded JSON of the response
+        """
+        if self.error is None:
+            if self.result is not None:
+                return dumps_bytes({"jsonrpc": self.jsonrpc, "result": self.result, "id": self.id})
+        elif self.result is None:
+            return dumps_bytes({"jsonrpc": self.jsonrpc, "error": self.error, "id": self.id})
+        return dumps_bytes(self.to_dict())
+
 
 def create_success_response(
     envelope: Envelope, payload: Dict[str, Any], request_id: str
@@ -326,13 +421,68 @@ def create_error_response(
     )
 
 
+_UUID_POOL_SIZE = 64  # UUIDs drawn per os.urandom call
+_uuid_pool = b""
+_uuid_pool_offset = 0
+_uuid_pool_lock = threading.Lock()
+
+
+def _pooled_uuid4() -> str:
+    """Format a UUID v4 string from a shared pool of random bytes.
+
+    Refilling the pool with one os.urandom call per 64 IDs avoids the
+    per-call syscall and UUID object construction of uuid.uuid4().
+
+    Returns:
+        UUID string
+    """
+    global _uuid_pool, _uuid_pool_offset  # pylint: disable=global-statement
+    with _uuid_pool_lock:
+        if _uuid_pool_offset >= len(_uuid_pool):
+            _uuid_pool = os.urandom(16 * _UUID_POOL_SIZE)
+            _uuid_pool_offset = 0
+        raw = bytearray(_uuid_pool[_uuid_pool_offset : _uuid_pool_offset + 16])
+        _uuid_pool_offset += 16
+
+    return _format_uuid4(raw)
+
+
+def _format_uuid4(raw: bytearray) -> str:
+    """Format 16 random bytes as a UUID v4 string.
+
+    Args:
+        raw: 16 random bytes; the version and variant bits are set in place
+
+    Returns:
+        UUID string
+    """
+    # Set version (4) and RFC 4122 variant bits
+    raw[6] = (raw[6] & 0x0F) | 0x40
+    raw[8] = (raw[8] & 0x3F) | 0x80
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def generate_uuid4_batch(count: int) -> List[str]:
+    """Generate several UUID v4 strings from a single os.urandom call.
+
+    Args:
+        count: Number of UUIDs
+
+    Returns:
+        List of UUID strings
+    """
+    raw = os.urandom(16 * count)
+    return [_format_uuid4(bytearray(raw[i : i + 16])) for i in range(0, len(raw), 16)]
+
+
 def generate_conversation_id() -> str:
     """Generate a new UUID v4 conversation ID.
 
     Returns:
         UUID string
     """
-    return str(uuid.uuid4())
+    return _pooled_uuid4()
 
 
 def generate_message_id() -> str:
@@ -341,13 +491,27 @@ def generate_message_id() -> str:
     Returns:
         UUID string
     """
-    return str(uuid.uuid4())
+    return _pooled_uuid4()
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS" prefix), swapped as one tuple so
+# concurrent callers never pair a second with another second's prefix
+_utc_second_cache = (-1, "")
 
 
 def utc_now() -> str:
     """Get current UTC timestamp in ISO-8601 format.
 
+    The date/time prefix is formatted once per second; only the microseconds
+    are formatted on each call.
+
     Returns:
-        ISO-8601 timestamp string with Z suffix
+        ISO-8601 timestamp string with microseconds and Z suffix
     """
-    return datetime.utcnow().isoformat() + "Z"
+    global _utc_second_cache  # pylint: disable=global-statement
+    second, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_second, prefix = _utc_second_cache
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _utc_second_cache = (second, prefix)
+    return f"{prefix}.{micros:06d}Z"
@@ -5,7 +5,9 @@ strategies and games at runtime, enabling true pluggability.
 """
 
 import logging
-from typing import Dict, Optional, Type
+import sys
+from types import MappingProxyType
+from typing import Callable, Dict, Optional, Type
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,7 @@ class Registry:
         """
         self.name = name
         self._registry: Dict[str, Type] = {}
+        self._sealed = False
 
     def register(self, key: str, cls: Type) -> None:
         """Register a class with the registry.
@@ -30,13 +33,49 @@ class Registry:
             cls: Class to register
 
         Raises:
-            ValueError: If key is already registered
+            RuntimeError: If the registry has been sealed
         """
+        if self._sealed:
+            raise RuntimeError(f"{self.name}: Cannot register '{key}', registry is sealed")
+        # Interned keys let lookups with interned names match by identity
+        key = sys.intern(key)
         if key in self._registry:
             logger.warning("%s: Overwriting existing registration for '%s'", self.name, key)
 
         self._registry[key] = cls
-        logger.debug("%s: Registered '%s' -> %s", self.name, key, cls.__name__)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s: Registered '%s' -> %s", self.name, key, cls.__name__)
+
+    def register_as(self, key: str) -> Callable[[Type], Type]:
+        """Class decorator that registers the decorated class under key.
+
+        Args:
+            key: Unique identifier for the decorated class
+
+        Returns:
+            Decorator returning the class unchanged
+        """
+
+        def decorator(cls: Type) -> Type:
+            self.register(key, cls)
+            return cls
+
+        return decorator
+
+    def seal(self) -> None:
+        """Freeze the registry once startup registration is done.
+
+        Lookups keep working against a read-only view of the same entries;
+        register() and clear() raise afterwards.
+        """
+        if not self._sealed:
+            self._registry = MappingProxyType(dict(self._registry))  # type: ignore[assignment]
+            self._sealed = True
+
+    @property
+    def sealed(self) -> bool:
+        """Whether seal() has been called."""
+        return self._sealed
 
     def get(self, key: str) -> Optional[Type]:
         """Get a registered class.
@@ -47,7 +86,7 @@ class Registry:
         Returns:
             Registered class or None if not found
         """
-        return self._registry.get(key)
+        return self._registry.get(sys.intern(key))
 
     def get_or_raise(self, key: str) -> Type:
         """Get a registered class or raise an error.
@@ -61,12 +100,28 @@ class Registry:
         Raises:
             ValueError: If key not found
         """
-        cls = self._registry.get(key)
-        if cls is None:
-            raise ValueError(
-                f"{self.name}: No registration found for '{key}'. Available: {list(self._registry.keys())}"
-            )
-        return cls
+        try:
+            return self._lookup(key)
+        except KeyError:
+            raise self._not_found(key) from None
+
+    def _lookup(self, key: str) -> Type:
+        """Get a registered class by its interned key, raising KeyError if not found."""
+        return self._registry[sys.intern(key)]
+
+    def _not_found(self, key: str) -> ValueError:
+        """Build the error raised for an unregistered key."""
+        return ValueError(
+            f"{self.name}: No registration found for '{key}'. Available: {list(self._registry.keys())}"
+        )
+
+    def __getitem__(self, key: str) -> Type:
+        """Get a registered class, raising KeyError if not found."""
+        return self._lookup(key)
+
+    def __contains__(self, key: object) -> bool:
+        """Check if a key is registered."""
+        return isinstance(key, str) and sys.intern(key) in self._registry
 
     def list_keys(self) -> list:
         """List all registered keys.
@@ -85,12 +140,19 @@ class Registry:
         Returns:
             True if key is registered
         """
-        return key in self._registry
+        return key in self
 
     def clear(self) -> None:
-        """Clear all registrations."""
+        """Clear all registrations.
+
+        Raises:
+            RuntimeError: If the registry has been sealed
+        """
+        if self._sealed:
+            raise RuntimeError(f"{self.name}: Cannot clear, registry is sealed")
         self._registry.clear()
-        logger.debug("%s: Cleared all registrations", self.name)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s: Cleared all registrations", self.name)
 
 
 class StrategyRegistry(Registry):
@@ -136,7 +198,10 @@ class StrategyRegistry(Registry):
         Raises:
             ValueError: If strategy not found
         """
-        strategy_class = self.get_strategy(name)
+        try:
+            strategy_class = self._lookup(name)
+        except KeyError:
+            raise self._not_found(name) from None
         return strategy_class(player_id)
 
 
@@ -183,7 +248,10 @@ class GameRegistry(Registry):
         Raises:
             ValueError: If game type not found
         """
-        game_class = self.get_game(game_type)
+        try:
+            game_class = self._lookup(game_type)
+        except KeyError:
+            raise self._not_found(game_type) from None
         game = game_class(players)
         game.initialize()
         return game
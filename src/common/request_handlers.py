@@ -28,7 +28,7 @@ def create_league_error_response(error: LeagueError, request_id: str) -> JSONRPC
         JSON-RPC error response
     """
     logger.warning("League error: %s", error)
-    return create_error_response(int(error.code), error.message, error.details, request_id)
+    return create_error_response(error.int_code, error.message, error.details, request_id)
 
 
 def create_validation_error_response(error: Exception, request_id: str) -> JSONRPCResponse:
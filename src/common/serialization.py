@@ -0,0 +1,94 @@
+"""JSON serialization helpers for the Agent League System.
+
+This module uses orjson when it is installed and falls back to the
+standard library otherwise. Both paths produce compact JSON and encode
+dataclass instances as objects of their fields.
+"""
+
+import json
+from dataclasses import fields, is_dataclass
+from typing import Any, Dict, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on optional dependency
+    orjson = None
+
+
+if orjson is not None:
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize an object to compact JSON bytes.
+
+        Args:
+            obj: JSON-serializable object
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        return orjson.dumps(obj)
+
+    def dumps(obj: Any) -> str:
+        """Serialize an object to a compact JSON string.
+
+        Args:
+            obj: JSON-serializable object
+
+        Returns:
+            JSON text
+        """
+        return orjson.dumps(obj).decode("utf-8")
+
+    def loads(data: Union[str, bytes]) -> Any:
+        """Parse JSON text or bytes.
+
+        Args:
+            data: JSON document
+
+        Returns:
+            Parsed object
+        """
+        return orjson.loads(data)
+
+else:
+
+    def _default(obj: Any) -> Dict[str, Any]:
+        """Encode dataclass instances the way orjson does natively."""
+        if is_dataclass(obj) and not isinstance(obj, type):
+            return {f.name: getattr(obj, f.name) for f in fields(obj)}
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize an object to compact JSON bytes.
+
+        Args:
+            obj: JSON-serializable object
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default).encode(
+            "utf-8"
+        )
+
+    def dumps(obj: Any) -> str:
+        """Serialize an object to a compact JSON string.
+
+        Args:
+            obj: JSON-serializable object
+
+        Returns:
+            JSON text
+        """
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default)
+
+    def loads(data: Union[str, bytes]) -> Any:
+        """Parse JSON text or bytes.
+
+        Args:
+            data: JSON document
+
+        Returns:
+            Parsed object
+        """
+        return json.loads(data)
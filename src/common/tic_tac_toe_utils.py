@@ -4,29 +4,89 @@ This module provides common utility functions for working with
 tic-tac-toe boards.
 """
 
+from itertools import chain
 from typing import List, Tuple
 
+# Winning lines as 9-bit masks; cell (row, col) is bit row * 3 + col
+WIN_MASKS = (
+    0b000000111,
+    0b000111000,
+    0b111000000,
+    0b001001001,
+    0b010010010,
+    0b100100100,
+    0b100010001,
+    0b001010100,
+)
 
-def get_available_moves(board: List[List[str]]) -> List[Tuple[int, int]]:
-    """Get list of available moves on the board.
+# Winning lines through each cell; a move can only complete one of these
+_MASKS_BY_CELL = tuple(tuple(m for m in WIN_MASKS if m >> idx & 1) for idx in range(9))
+
+# Empty cells for every occupancy mask; only 512 boards differ in which cells are free
+_MOVES_BY_OCCUPIED = tuple(
+    tuple(divmod(idx, 3) for idx in range(9) if not occupied >> idx & 1) for occupied in range(512)
+)
+
+
+def get_available_moves(board: List[List[str]]) -> Tuple[Tuple[int, int], ...]:
+    """Get available moves on the board.
+
+    Args:
+        board: 3x3 tic-tac-toe board
+
+    Returns:
+        Shared, immutable tuple of (row, col) pairs for empty positions
+    """
+    occupied = 0
+    bit = 1
+    for line in (board[0], board[1], board[2]):
+        for cell in (line[0], line[1], line[2]):
+            if cell != "":
+                occupied |= bit
+            bit <<= 1
+    return _MOVES_BY_OCCUPIED[occupied]
+
+
+def board_to_bits(board: List[List[str]], mark: str) -> int:
+    """Encode the cells holding mark as a 9-bit mask.
 
     Args:
         board: 3x3 tic-tac-toe board
+        mark: Mark to encode (X or O)
 
     Returns:
-        List of (row, col) tuples for empty positions
+        Mask with bit row * 3 + col set for each cell holding mark
     """
-    available_moves = []
-    for row in range(3):
-        for col in range(3):
-            if board[row][col] == "":
-                available_moves.append((row, col))
-    return available_moves
+    bits = 0
+    for idx, cell in enumerate(chain.from_iterable(board)):
+        if cell == mark:
+            bits |= 1 << idx
+    return bits
+
+
+def would_win_bits(mask: int, idx: int) -> bool:
+    """Check if adding cell idx to a mark's bitboard completes a line.
+
+    Args:
+        mask: Bitboard of the mark, as returned by board_to_bits
+        idx: Cell index (row * 3 + col)
+
+    Returns:
+        True if this move would result in a win
+    """
+    placed = mask | (1 << idx)
+    for line in _MASKS_BY_CELL[idx]:
+        if placed & line == line:
+            return True
+    return False
 
 
 def would_win(board: List[List[str]], row: int, col: int, mark: str) -> bool:
     """Check if placing mark at (row, col) would win the game.
 
+    The mark is placed on the board itself and the cell restored before
+    returning, so the board must not be shared with another thread.
+
     Args:
         board: Current board state
         row: Row index
@@ -36,24 +96,26 @@ def would_win(board: List[List[str]], row: int, col: int, mark: str) -> bool:
     Returns:
         True if this move would result in a win
     """
-    # Create temporary board
-    temp_board = [row_list[:] for row_list in board]
-    temp_board[row][col] = mark
+    previous = board[row][col]
+    board[row][col] = mark
+    try:
+        # Check row
+        line = board[row]
+        if line[0] == mark and line[1] == mark and line[2] == mark:
+            return True
 
-    # Check row
-    if all(temp_board[row][c] == mark for c in range(3)):
-        return True
+        # Check column
+        if board[0][col] == mark and board[1][col] == mark and board[2][col] == mark:
+            return True
 
-    # Check column
-    if all(temp_board[r][col] == mark for r in range(3)):
-        return True
+        # Check diagonal
+        if row == col and board[0][0] == mark and board[1][1] == mark and board[2][2] == mark:
+            return True
 
-    # Check diagonal
-    if row == col and all(temp_board[i][i] == mark for i in range(3)):
-        return True
+        # Check anti-diagonal
+        if row + col == 2 and board[0][2] == mark and board[1][1] == mark and board[2][0] == mark:
+            return True
 
-    # Check anti-diagonal
-    if row + col == 2 and all(temp_board[i][2 - i] == mark for i in range(3)):
-        return True
-
-    return False
+        return False
+    finally:
+        board[row][col] = previous
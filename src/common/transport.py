@@ -7,12 +7,16 @@ JSON-RPC communication between league agents.
 import http.client
 import json
 import logging
+import selectors
+import socket
 import threading
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from typing import Any, Callable, Dict, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
 from urllib.parse import urlparse
 
-from .errors import ErrorCode, LeagueError, ProtocolError
+from .errors import ErrorCode, LeagueError, ProtocolError, lookup_error_code
 from .protocol import (
     JSONRPC_VERSION,
     Envelope,
@@ -21,90 +25,108 @@ from .protocol import (
     create_error_response,
     generate_message_id,
 )
+from .serialization import dumps_bytes, loads
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on requests handled concurrently by one LeagueHTTPServer
+DEFAULT_MAX_WORKERS = 16
+
+# Seconds the server keeps an idle keep-alive connection open
+KEEPALIVE_TIMEOUT = 5
+
+# Seconds the server waits on a request body that is slow to arrive
+REQUEST_BODY_TIMEOUT = 30
+
+# Seconds between checks for idle connections past KEEPALIVE_TIMEOUT
+_IDLE_SWEEP_INTERVAL = 0.5
+
+# Idle connections LeagueHTTPClient keeps per (host, port)
+_MAX_IDLE_PER_HOST = 4
+
+# Marks a key absent from a decoded response
+_MISSING = object()
+
+# /health never changes, so it is encoded once
+_HEALTH_BODY = dumps_bytes({"status": "ok"})
+
 
 class LeagueHTTPHandler(BaseHTTPRequestHandler):
     """HTTP request handler for league protocol endpoints.
 
     This handler processes POST requests to /mcp and delegates
-    message handling to a registered handler function.
+    message handling to a registered handler function. LeagueHTTPServer
+    binds the function on a per-server subclass (see bind()).
     """
 
-    def __init__(self, *args, message_handler: Optional[Callable] = None, **kwargs):
-        """Initialize the handler.
+    # Keep connections open between requests; idle ones time out
+    protocol_version = "HTTP/1.1"
+    timeout = KEEPALIVE_TIMEOUT
+
+    # Function to handle validated requests
+    message_handler: Optional[Callable[[JSONRPCRequest], JSONRPCResponse]] = None
+
+    def handle(self):
+        """Serve the requests that are ready on this connection.
+
+        A kept-alive connection goes back to the server afterwards, which
+        waits for its next request without holding a pool worker. Pipelined
+        requests already read into rfile would never wake the server's
+        selector, so they are served here first.
+        """
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection and self._has_pending_input():
+            self.handle_one_request()
+
+    def _has_pending_input(self) -> bool:
+        """Check, without blocking, whether another request has started to arrive."""
+        self.connection.settimeout(0)
+        try:
+            return bool(self.rfile.peek())
+        except OSError:
+            return False
+        finally:
+            self.connection.settimeout(self.timeout)
+
+    @classmethod
+    def bind(
+        cls, message_handler: Callable[[JSONRPCRequest], JSONRPCResponse]
+    ) -> "Type[LeagueHTTPHandler]":
+        """Create a handler subclass with message_handler set as a class attribute.
+
+        The server instantiates the subclass directly for each connection,
+        so no factory closure or keyword argument is involved per request.
 
         Args:
             message_handler: Function to handle validated requests
+
+        Returns:
+            Handler class to pass to the HTTP server
         """
-        self.message_handler = message_handler
-        super().__init__(*args, **kwargs)
+        return type(
+            "BoundLeagueHTTPHandler", (cls,), {"message_handler": staticmethod(message_handler)}
+        )
 
     def do_POST(self):
-        """Handle POST requests to /mcp endpoint."""
-        if self.path != "/mcp":
+        """Handle POST requests by dispatching on the request path."""
+        route = self._POST_ROUTES.get(self.path)
+        if route is None:
             self.send_error(404, "Not Found")
-            return
+        else:
+            route(self)
 
+    def _handle_mcp(self):
+        """Handle POST requests to /mcp endpoint."""
         try:
-            # Read request body
             content_length = int(self.headers.get("Content-Length", 0))
-            body = self.rfile.read(content_length)
-
-            # Parse JSON
+            # The keep-alive timeout covers the wait for a request, not its upload
+            self.connection.settimeout(REQUEST_BODY_TIMEOUT)
             try:
-                data = json.loads(body.decode("utf-8"))
-            except json.JSONDecodeError as e:
-                response = create_error_response(
-                    ErrorCode.INVALID_JSON_RPC, f"Invalid JSON: {str(e)}", request_id=None
-                )
-                self._send_json_response(response.to_dict())
-                return
-
-            # Validate JSON-RPC structure
-            try:
-                request = JSONRPCRequest.from_dict(data)
-            except (ProtocolError, LeagueError) as e:
-                response = create_error_response(
-                    int(e.code) if hasattr(e, "code") else ErrorCode.INVALID_JSON_RPC,
-                    str(e),
-                    error_data=e.details if hasattr(e, "details") else {},
-                    request_id=data.get("id"),
-                )
-                self._send_json_response(response.to_dict())
-                return
-
-            # Delegate to message handler
-            if self.message_handler:
-                try:
-                    response = self.message_handler(request)
-                    self._send_json_response(response.to_dict())
-                except LeagueError as e:
-                    response = create_error_response(
-                        int(e.code), e.message, error_data=e.details, request_id=request.id
-                    )
-                    self._send_json_response(response.to_dict())
-                except (ValueError, KeyError, TypeError) as e:
-                    logger.error("Invalid request or response: %s", e)
-                    response = create_error_response(
-                        ErrorCode.INTERNAL_ERROR,
-                        f"Request handling error: {str(e)}",
-                        request_id=request.id,
-                    )
-                    self._send_json_response(response.to_dict())
-                except Exception as e:  # pylint: disable=broad-exception-caught
-                    logger.exception("Unexpected error handling request")
-                    response = create_error_response(
-                        ErrorCode.INTERNAL_ERROR, f"Internal error: {str(e)}", request_id=request.id
-                    )
-                    self._send_json_response(response.to_dict())
-            else:
-                response = create_error_response(
-                    ErrorCode.INTERNAL_ERROR, "No message handler configured", request_id=request.id
-                )
-                self._send_json_response(response.to_dict())
-
+                body = self.rfile.read(content_length)
+            finally:
+                self.connection.settimeout(self.timeout)
+            self._send_json_body(self._dispatch(body).to_json_bytes())
         except (OSError, ValueError) as e:
             logger.error("Error processing request: %s", e)
             self.send_error(500, str(e))
@@ -112,22 +134,70 @@ class LeagueHTTPHandler(BaseHTTPRequestHandler):
             logger.exception("Unexpected error processing request")
             self.send_error(500, str(e))
 
+    def _dispatch(self, body: bytes) -> JSONRPCResponse:
+        """Parse, validate and handle one JSON-RPC request body.
+
+        Every failure is turned into a JSON-RPC error response here, so the
+        caller has a single write path.
+
+        Args:
+            body: Raw request body
+
+        Returns:
+            JSON-RPC response
+        """
+        try:
+            data = loads(body)
+        except json.JSONDecodeError as e:
+            return create_error_response(ErrorCode.INVALID_JSON_RPC, f"Invalid JSON: {str(e)}")
+        if not isinstance(data, dict):
+            return create_error_response(
+                ErrorCode.INVALID_JSON_RPC, "Request must be a JSON object"
+            )
+
+        request_id = data.get("id")
+        try:
+            request = JSONRPCRequest.from_dict(data)
+            if self.message_handler is None:
+                return create_error_response(
+                    ErrorCode.INTERNAL_ERROR, "No message handler configured", request_id=request_id
+                )
+            return self.message_handler(request)
+        except LeagueError as e:
+            return create_error_response(
+                e.int_code, e.message, error_data=e.details, request_id=request_id
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            logger.error("Invalid request or response: %s", e)
+            return create_error_response(
+                ErrorCode.INTERNAL_ERROR, f"Request handling error: {str(e)}", request_id=request_id
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.exception("Unexpected error handling request")
+            return create_error_response(
+                ErrorCode.INTERNAL_ERROR, f"Internal error: {str(e)}", request_id=request_id
+            )
+
     def do_GET(self):
+        """Handle GET requests by dispatching on the request path."""
+        route = self._GET_ROUTES.get(self.path)
+        if route is None:
+            self.send_error(404, "Not Found")
+        else:
+            route(self)
+
+    def _handle_health(self):
         """Handle GET requests for health checks."""
-        if self.path == "/health":
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.end_headers()
-            self.wfile.write(json.dumps({"status": "ok"}).encode("utf-8"))
-        elif self.path == "/status":
-            # Status endpoint - handler should set this via server attribute
-            status = getattr(self.server, "status_provider", lambda: {"status": "unknown"})()
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.end_headers()
-            self.wfile.write(json.dumps(status).encode("utf-8"))
+        self._send_json_body(_HEALTH_BODY)
+
+    def _handle_status(self):
+        """Handle GET requests for server status."""
+        # Status endpoint - LeagueHTTPServer sets this on the server
+        status_provider = self.server.status_provider
+        if status_provider is None:
+            self._send_json_response({"status": "unknown"})
         else:
-            self.send_error(404, "Not Found")
+            self._send_json_response(status_provider())
 
     def _send_json_response(self, data: Dict[str, Any]):
         """Send JSON response.
@@ -135,12 +205,19 @@ class LeagueHTTPHandler(BaseHTTPRequestHandler):
         Args:
             data: Dictionary to send as JSON
         """
-        response_body = json.dumps(data, indent=2).encode("utf-8")
+        self._send_json_body(dumps_bytes(data))
+
+    def _send_json_body(self, body: bytes):
+        """Send an already-encoded JSON response.
+
+        Args:
+            body: UTF-8 encoded JSON
+        """
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(response_body)))
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(response_body)
+        self.wfile.write(body)
 
     def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
         """Override to use standard logging.
@@ -151,6 +228,146 @@ class LeagueHTTPHandler(BaseHTTPRequestHandler):
         """
         logger.info(format, *args)
 
+    # Path -> handler method; looked up once per request
+    _GET_ROUTES: Dict[str, Callable[["LeagueHTTPHandler"], None]] = {
+        "/health": _handle_health,
+        "/status": _handle_status,
+    }
+    _POST_ROUTES: Dict[str, Callable[["LeagueHTTPHandler"], None]] = {"/mcp": _handle_mcp}
+
+
+class _PooledHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer that runs handlers on a bounded thread pool.
+
+    Connections beyond the pool size wait in the executor queue instead of
+    each getting a new thread. A worker serves one request at a time; idle
+    keep-alive connections are parked on a selector thread and only go
+    back to the pool once their next request arrives, so they never tie up
+    a worker while the client is quiet.
+    """
+
+    daemon_threads = True
+    status_provider: Optional[Callable[[], Dict[str, Any]]] = None
+
+    def __init__(self, server_address, handler_class, max_workers: int):
+        super().__init__(server_address, handler_class)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="league-http"
+        )
+        self._open_lock = threading.Lock()
+        self._open_requests: set = set()
+
+        # Connections handed to the idle thread, which alone touches the selector
+        self._closing = False
+        self._to_park: List[Tuple[socket.socket, Any, float]] = []
+        self._wakeup_recv, self._wakeup_send = socket.socketpair()
+        self._wakeup_recv.setblocking(False)
+        self._idle_thread = threading.Thread(
+            target=self._watch_idle, name="league-http-idle", daemon=True
+        )
+        self._idle_thread.start()
+
+    def process_request(self, request, client_address):
+        """Hand the connection to the worker pool."""
+        with self._open_lock:
+            self._open_requests.add(request)
+        self._executor.submit(self.process_request_thread, request, client_address)
+
+    def process_request_thread(self, request, client_address):
+        """Serve one request, then park the connection if it stays open."""
+        try:
+            handler = self.RequestHandlerClass(request, client_address, self)
+        except Exception:  # pylint: disable=broad-exception-caught
+            self.handle_error(request, client_address)
+            self.shutdown_request(request)
+            return
+        if handler.close_connection:
+            self.shutdown_request(request)
+            return
+        deadline = time.monotonic() + self.RequestHandlerClass.timeout
+        with self._open_lock:
+            closing = self._closing
+            if not closing:
+                self._to_park.append((request, client_address, deadline))
+        if closing:
+            self.shutdown_request(request)
+        else:
+            self._wake_idle_thread()
+
+    def _wake_idle_thread(self):
+        """Interrupt the idle thread's select() call."""
+        try:
+            self._wakeup_send.send(b"\0")
+        except OSError:
+            pass
+
+    def _watch_idle(self):
+        """Wait on parked connections and resubmit those with a new request."""
+        selector = selectors.DefaultSelector()
+        selector.register(self._wakeup_recv, selectors.EVENT_READ)
+        try:
+            while True:
+                with self._open_lock:
+                    if self._closing:
+                        break
+                    to_park, self._to_park = self._to_park, []
+                for request, client_address, deadline in to_park:
+                    selector.register(request, selectors.EVENT_READ, (client_address, deadline))
+
+                for key, _ in selector.select(timeout=_IDLE_SWEEP_INTERVAL):
+                    if key.data is None:
+                        try:
+                            self._wakeup_recv.recv(4096)
+                        except OSError:
+                            pass
+                        continue
+                    # Readable: the next request, or the client hanging up
+                    selector.unregister(key.fileobj)
+                    self._executor.submit(self.process_request_thread, key.fileobj, key.data[0])
+
+                now = time.monotonic()
+                for key in list(selector.get_map().values()):
+                    if key.data is not None and key.data[1] <= now:
+                        selector.unregister(key.fileobj)
+                        self.shutdown_request(key.fileobj)
+        finally:
+            for key in list(selector.get_map().values()):
+                if key.data is not None:
+                    self.shutdown_request(key.fileobj)
+            selector.close()
+
+    def shutdown_request(self, request):
+        """Forget a finished connection, then close it."""
+        with self._open_lock:
+            self._open_requests.discard(request)
+        super().shutdown_request(request)
+
+    def server_close(self):
+        """Close the listening socket and wait for in-flight requests.
+
+        Parked idle connections are closed. Connections still with a worker
+        are shut down for reading, so a worker blocked reading a request
+        returns at once while a response being written still goes out.
+        """
+        super().server_close()
+        with self._open_lock:
+            self._closing = True
+            to_park, self._to_park = self._to_park, []
+        self._wake_idle_thread()
+        self._idle_thread.join()
+        for request, _, _ in to_park:
+            self.shutdown_request(request)
+        with self._open_lock:
+            open_requests = list(self._open_requests)
+        for request in open_requests:
+            try:
+                request.shutdown(socket.SHUT_RD)
+            except OSError:
+                pass
+        self._executor.shutdown(wait=True)
+        self._wakeup_recv.close()
+        self._wakeup_send.close()
+
 
 class LeagueHTTPServer:
     """HTTP server for league agents.
@@ -165,27 +382,28 @@ class LeagueHTTPServer:
         port: int,
         message_handler: Callable[[JSONRPCRequest], JSONRPCResponse],
         status_provider: Optional[Callable[[], Dict[str, Any]]] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ):
         """Initialize the HTTP server.
 
+        Requests are handled concurrently, so message_handler and
+        status_provider must be thread-safe.
+
         Args:
             host: Host to bind to
             port: Port to bind to
             message_handler: Function to handle validated requests
             status_provider: Optional function to provide status info
+            max_workers: Maximum number of requests handled at once
         """
         self.host = host
         self.port = port
         self.message_handler = message_handler
         self.status_provider = status_provider
 
-        # Create handler factory
-        def handler_factory(*args, **kwargs):
-            return LeagueHTTPHandler(*args, message_handler=message_handler, **kwargs)
-
-        self.server = HTTPServer((host, port), handler_factory)
-        if status_provider:
-            self.server.status_provider = status_provider
+        handler_class = LeagueHTTPHandler.bind(message_handler)
+        self.server = _PooledHTTPServer((host, port), handler_class, max_workers)
+        self.server.status_provider = status_provider
         self.thread = None
 
     def start(self):
@@ -200,11 +418,16 @@ class LeagueHTTPServer:
             self.server.shutdown()
             if self.thread:
                 self.thread.join()
+            self.server.server_close()
             logger.info("HTTP server stopped on %s:%s", self.host, self.port)
 
 
 class LeagueHTTPClient:
-    """HTTP client for sending JSON-RPC requests to other league agents."""
+    """HTTP client for sending JSON-RPC requests to other league agents.
+
+    Connections are kept alive and reused per (host, port); the client is
+    safe to share between threads.
+    """
 
     def __init__(self, timeout: int = 30):
         """Initialize the HTTP client.
@@ -213,6 +436,73 @@ class LeagueHTTPClient:
             timeout: Request timeout in seconds
         """
         self.timeout = timeout
+        self._pool: Dict[Tuple[str, int], List[http.client.HTTPConnection]] = {}
+        self._pool_lock = threading.Lock()
+
+    def _checkout(self, key: Tuple[str, int]) -> Optional[http.client.HTTPConnection]:
+        """Take an idle connection for key from the pool, if any."""
+        with self._pool_lock:
+            idle = self._pool.get(key)
+            return idle.pop() if idle else None
+
+    def _checkin(self, key: Tuple[str, int], conn: http.client.HTTPConnection):
+        """Return a connection to the pool, closing it if the pool is full."""
+        with self._pool_lock:
+            idle = self._pool.setdefault(key, [])
+            if len(idle) < _MAX_IDLE_PER_HOST:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _post(self, host: str, port: int, path: str, body: bytes) -> bytes:
+        """POST body over a pooled connection and return the response body.
+
+        A reused connection the server has dropped is retried once on a fresh
+        connection, but only if the request was never fully written or the
+        server closed without sending any response bytes. Any other failure
+        is raised, since the request may already have been handled and
+        league messages are not idempotent.
+        """
+        headers = {
+            "Content-Type": "application/json",
+            "Content-Length": str(len(body)),
+            "Connection": "keep-alive",
+        }
+        key = (host, port)
+        conn = self._checkout(key)
+        reused = conn is not None
+        if conn is None:
+            conn = http.client.HTTPConnection(host, port, timeout=self.timeout)
+        try:
+            sent = False
+            try:
+                conn.request("POST", path, body, headers)
+                sent = True
+                response = conn.getresponse()
+            except ConnectionError as e:
+                if not reused or (sent and not isinstance(e, http.client.RemoteDisconnected)):
+                    raise
+                conn.close()
+                conn = http.client.HTTPConnection(host, port, timeout=self.timeout)
+                conn.request("POST", path, body, headers)
+                response = conn.getresponse()
+            data = response.read()
+        except BaseException:
+            conn.close()
+            raise
+        if response.will_close:
+            conn.close()
+        else:
+            self._checkin(key, conn)
+        return data
+
+    def close(self):
+        """Close all idle pooled connections."""
+        with self._pool_lock:
+            pools, self._pool = self._pool, {}
+        for idle in pools.values():
+            for conn in idle:
+                conn.close()
 
     def send_request(
         self,
@@ -252,35 +542,27 @@ class LeagueHTTPClient:
         port = parsed.port or 80
 
         try:
-            # Create connection
-            conn = http.client.HTTPConnection(host, port, timeout=self.timeout)
-
-            # Send request
-            body = json.dumps(request.to_dict()).encode("utf-8")
-            headers = {"Content-Type": "application/json", "Content-Length": str(len(body))}
-            conn.request("POST", parsed.path or "/mcp", body, headers)
-
-            # Get response
-            response = conn.getresponse()
-            response_body = response.read().decode("utf-8")
+            # Send request over a pooled connection
+            body = request.to_json_bytes()
+            response_body = self._post(host, port, parsed.path or "/mcp", body)
 
-            # Parse response
-            response_data = json.loads(response_body)
+            # Parse response (straight from bytes; no intermediate str)
+            response_data = loads(response_body)
 
             # Check for JSON-RPC error
-            if "error" in response_data:
-                error = response_data["error"]
+            error = response_data.get("error")
+            if error is not None:
                 raise ProtocolError(
-                    ErrorCode(error.get("code", ErrorCode.INTERNAL_ERROR)),
+                    lookup_error_code(error.get("code")),
                     error.get("message", "Unknown error"),
                     error.get("data", {}),
                 )
 
-            # Extract result
-            if "result" not in response_data:
+            # Extract result (a null result is still a result)
+            result = response_data.get("result", _MISSING)
+            if result is _MISSING:
                 raise ProtocolError(ErrorCode.INVALID_JSON_RPC, "Response missing 'result' field")
-
-            return response_data["result"]
+            return result
 
         except (ConnectionRefusedError, ConnectionError, OSError) as e:
             raise ProtocolError(ErrorCode.COMMUNICATION_ERROR, f"Connection error: {str(e)}") from e
@@ -290,9 +572,39 @@ class LeagueHTTPClient:
             raise ProtocolError(
                 ErrorCode.INVALID_JSON_RPC, f"Invalid JSON response: {str(e)}"
             ) from e
-        finally:
-            if "conn" in locals():
-                conn.close()
+
+    def send_requests_batch(
+        self,
+        requests: Sequence[Tuple[str, Envelope, Dict[str, Any]]],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> List[Any]:
+        """Send several JSON-RPC requests concurrently.
+
+        Requests run on a short-lived thread pool over the shared connection
+        pool, so their round trips overlap instead of adding up.
+
+        Args:
+            requests: (url, envelope, payload) for each request
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            One entry per request, in order: the response payload, or the
+            exception that request raised
+        """
+
+        def send_one(request: Tuple[str, Envelope, Dict[str, Any]]) -> Any:
+            url, envelope, payload = request
+            try:
+                return self.send_request(url, envelope, payload)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                return e
+
+        if len(requests) <= 1:
+            return [send_one(request) for request in requests]
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(requests)), thread_name_prefix="league-http-batch"
+        ) as executor:
+            return list(executor.map(send_one, requests))
 
     def send_request_no_response(
         self, url: str, envelope: Envelope, payload: Dict[str, Any]
@@ -65,7 +65,6 @@ def main():
     def cleanup():
         """Clean up resources on shutdown."""
         server.stop()
-        audit_logger.close()
         database.close()
 
     # Run server loop
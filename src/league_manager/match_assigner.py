@@ -3,8 +3,10 @@
 This module handles assigning pending matches to available referees.
 """
 
+import itertools
 import logging
-from typing import Any, Dict, List
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from ..common.errors import ErrorCode, OperationalError
 from ..common.persistence import LeagueDatabase
@@ -13,6 +15,9 @@ from ..common.transport import LeagueHTTPClient
 
 logger = logging.getLogger(__name__)
 
+# Pending matches claimed, prefetched and sent together
+ASSIGN_BATCH_SIZE = 100
+
 
 class MatchAssigner:
     """Assigns matches to available referees."""
@@ -26,7 +31,67 @@ class MatchAssigner:
         """
         self.database = database
         self.http_client = http_client
-        self._referee_availability = {}  # referee_id -> is_idle
+
+        # Busy referees as one bit per referee; slots are handed out on first use
+        self._availability_lock = threading.Lock()
+        self._referee_slots: Dict[str, int] = {}
+        self._busy_bits = 0
+
+        # Referee rows for one league, kept current by invalidate_referee()
+        self._referee_lock = threading.Lock()
+        self._referee_league_id: Optional[str] = None
+        self._referee_cache: Dict[str, Dict[str, Any]] = {}
+        self._active_referee_ids: List[str] = []
+
+    def refresh_referees(self, league_id: str):
+        """Reload the cached referee rows for a league from the database.
+
+        Args:
+            league_id: League identifier
+        """
+        referees = self.database.get_all_referees(league_id)
+        with self._referee_lock:
+            self._referee_league_id = league_id
+            self._referee_cache = {r["referee_id"]: r for r in referees}
+            self._update_active_referees()
+
+    def invalidate_referee(self, referee_id: str):
+        """Re-read one referee after it registers or changes status.
+
+        Args:
+            referee_id: Referee identifier
+        """
+        with self._referee_lock:
+            if self._referee_league_id is None:
+                return
+            referee = self.database.get_referee(referee_id)
+            if referee is None or referee["league_id"] != self._referee_league_id:
+                self._referee_cache.pop(referee_id, None)
+            else:
+                self._referee_cache[referee_id] = referee
+            self._update_active_referees()
+
+    def _update_active_referees(self):
+        """Recompute the active referee ids; caller holds _referee_lock."""
+        self._active_referee_ids = [
+            referee_id
+            for referee_id, referee in self._referee_cache.items()
+            if referee["status"] == "ACTIVE"
+        ]
+
+    def _get_active_referees(self, league_id: str) -> List[Dict[str, Any]]:
+        """Return the active referees of a league from the cache.
+
+        Args:
+            league_id: League identifier
+
+        Returns:
+            Referee rows with status ACTIVE, in registration order
+        """
+        if self._referee_league_id != league_id:
+            self.refresh_referees(league_id)
+        with self._referee_lock:
+            return [self._referee_cache[referee_id] for referee_id in self._active_referee_ids]
 
     def assign_pending_matches(self, league_id: str) -> List[Dict[str, Any]]:
         """Assign all pending matches to available referees.
@@ -37,35 +102,72 @@ class MatchAssigner:
         Returns:
             List of assignment information
         """
-        # Get pending matches
-        pending_matches = self.database.get_pending_matches(league_id)
-        if not pending_matches:
+        # Get pending matches, a batch at a time
+        batches = self.database.iter_pending_matches(league_id, ASSIGN_BATCH_SIZE)
+        first_batch = next(batches, None)
+        if first_batch is None:
             logger.debug("No pending matches to assign")
             return []
 
         # Get active referees
-        referees = self.database.get_all_referees(league_id)
-        active_referees = [r for r in referees if r["status"] == "ACTIVE"]
+        active_referees = self._get_active_referees(league_id)
 
         if not active_referees:
             logger.warning("No active referees available for match assignment")
             return []
 
+        # Only referees idle at this moment take part in this pass
+        with self._availability_lock:
+            active_referees = [r for r in active_referees if self._is_idle(r["referee_id"])]
+        if not active_referees:
+            logger.warning("All active referees are busy; no matches assigned")
+            return []
+
+        # Match i goes to referee i mod R across all batches
+        referee_cycle = itertools.cycle(active_referees)
         assignments = []
-        referee_idx = 0
+        for batch in itertools.chain([first_batch], batches):
+            assignments.extend(self._assign_batch(batch, referee_cycle))
+
+        logger.info("Assigned %s matches to referees", len(assignments))
+        return assignments
+
+    def _assign_batch(
+        self, matches: List[Dict[str, Any]], referee_cycle: Iterator[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Claim, prefetch and send one batch of pending matches.
+
+        Args:
+            matches: Pending match rows
+            referee_cycle: Endless round-robin over the referees of this pass
+
+        Returns:
+            Assignment information for the matches that were sent
+        """
+        # Look up every player endpoint up front instead of once per seat
+        players_by_id = self.database.get_players(
+            player_id for match in matches for player_id in match["players"]
+        )
+
+        # Claim matches and build every assignment message before sending any
+        prepared = []
 
-        for match in pending_matches:
-            # Find next available referee (round-robin with wraparound)
-            referee = active_referees[referee_idx % len(active_referees)]
+        # A match that fails keeps its referee slot empty rather than shifting
+        # the rotation, and stays pending for the next pass unless it was
+        # already claimed
+        for match, referee in zip(matches, referee_cycle):
             referee_id = referee["referee_id"]
 
-            # Assign match
             try:
-                assignment_info = self.assign_match(
-                    match["match_id"], referee_id, match["game_type"], match["players"]
+                prepared.append(
+                    self._prepare_assignment(
+                        match["match_id"],
+                        referee,
+                        match["game_type"],
+                        match["players"],
+                        players_by_id,
+                    )
                 )
-                assignments.append(assignment_info)
-                referee_idx += 1
             except OperationalError as e:
                 logger.error(
                     "Failed to assign match %s to referee %s: %s", match["match_id"], referee_id, e
@@ -77,9 +179,48 @@ class MatchAssigner:
                     referee_id,
                 )
 
-        logger.info("Assigned %s matches to referees", len(assignments))
+        # Send the batch concurrently
+        results = self.http_client.send_requests_batch(
+            [(url, envelope, payload) for _, url, envelope, payload in prepared]
+        )
+
+        assignments = []
+        unsent = []
+        for (assignment_info, referee_url, _, _), result in zip(prepared, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Failed to send match assignment %s to referee %s: %s",
+                    assignment_info["match_id"],
+                    assignment_info["referee_id"],
+                    result,
+                )
+                unsent.append((assignment_info["match_id"], assignment_info["referee_id"]))
+                continue
+            logger.info(
+                "Sent match assignment %s to referee %s at %s",
+                assignment_info["match_id"],
+                assignment_info["referee_id"],
+                referee_url,
+            )
+            assignments.append(assignment_info)
+
+        # The referee never got these; put them back for the next pass
+        if unsent:
+            self._release_matches(unsent)
         return assignments
 
+    def _release_matches(self, matches: List[Tuple[str, str]]):
+        """Return claimed but unsent matches to PENDING.
+
+        Args:
+            matches: (match_id, referee_id) pairs
+        """
+        try:
+            released = self.database.unassign_matches(matches)
+            logger.info("Returned %s unsent matches to pending", released)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Failed to return unsent matches to pending")
+
     def assign_match(
         self, match_id: str, referee_id: str, game_type: str, players: List[str]
     ) -> Dict[str, Any]:
@@ -97,23 +238,74 @@ class MatchAssigner:
         Raises:
             OperationalError: If assignment fails
         """
-        # Update database
-        self.database.assign_match(match_id, referee_id, utc_now())
+        with self._referee_lock:
+            referee = self._referee_cache.get(referee_id)
+        if referee is None:
+            referee = self.database.get_referee(referee_id)
+        if not referee:
+            raise OperationalError(
+                ErrorCode.INVALID_REFEREE_ID,
+                f"Referee {referee_id} not found or has no endpoint URL",
+            )
+        assignment_info, referee_url, envelope, payload = self._prepare_assignment(
+            match_id, referee, game_type, players, self.database.get_players(players)
+        )
 
-        # Get match details
-        match = self.database.get_match(match_id)
-        if not match:
-            raise OperationalError(ErrorCode.INVALID_MATCH_ID, f"Match not found: {match_id}")
+        # Send to referee
+        try:
+            self.http_client.send_request(referee_url, envelope, payload)
+            logger.info(
+                "Sent match assignment %s to referee %s at %s", match_id, referee_id, referee_url
+            )
+        except Exception as e:
+            logger.error("Failed to send match assignment to referee %s: %s", referee_id, e)
+            self._release_matches([(match_id, referee_id)])
+            raise OperationalError(
+                ErrorCode.COMMUNICATION_ERROR, f"Failed to send assignment to referee: {str(e)}"
+            ) from e
+
+        return assignment_info
+
+    def _prepare_assignment(
+        self,
+        match_id: str,
+        referee: Dict[str, Any],
+        game_type: str,
+        players: List[str],
+        players_by_id: Dict[str, Dict[str, Any]],
+    ) -> Tuple[Dict[str, Any], str, Envelope, Dict[str, Any]]:
+        """Record a match assignment and build the message for the referee.
+
+        Only the assignment itself touches the database; referee and player
+        rows are passed in by the caller.
+
+        Args:
+            match_id: Match identifier
+            referee: Referee row
+            game_type: Game type
+            players: List of player IDs
+            players_by_id: Player rows keyed by player_id
+
+        Returns:
+            (assignment information, referee URL, envelope, payload)
 
-        # Send assignment to referee
-        referee = self.database.get_referee(referee_id)
-        if not referee or not referee.get("endpoint_url"):
+        Raises:
+            OperationalError: If the match cannot be assigned
+        """
+        referee_id = referee["referee_id"]
+        referee_url = referee.get("endpoint_url")
+        if not referee_url:
             raise OperationalError(
                 ErrorCode.INVALID_REFEREE_ID,
                 f"Referee {referee_id} not found or has no endpoint URL",
             )
 
-        referee_url = referee["endpoint_url"]
+        # Update database; only a still-pending match is assigned
+        match = self.database.assign_match(match_id, referee_id, utc_now())
+        if not match:
+            raise OperationalError(
+                ErrorCode.INVALID_MATCH_ID, f"Match not found or not pending: {match_id}"
+            )
 
         # Create MATCH_ASSIGNMENT envelope
         envelope = Envelope(
@@ -130,7 +322,7 @@ class MatchAssigner:
         # Get player endpoint URLs
         player_endpoints = {}
         for player_id in players:
-            player = self.database.get_player(player_id)
+            player = players_by_id.get(player_id)
             if player and player.get("endpoint_url"):
                 player_endpoints[player_id] = player["endpoint_url"]
             else:
@@ -144,19 +336,7 @@ class MatchAssigner:
             "player_endpoints": player_endpoints,
         }
 
-        # Send to referee
-        try:
-            self.http_client.send_request(referee_url, envelope, payload)
-            logger.info(
-                "Sent match assignment %s to referee %s at %s", match_id, referee_id, referee_url
-            )
-        except Exception as e:
-            logger.error("Failed to send match assignment to referee %s: %s", referee_id, e)
-            raise OperationalError(
-                ErrorCode.COMMUNICATION_ERROR, f"Failed to send assignment to referee: {str(e)}"
-            ) from e
-
-        return {
+        assignment_info = {
             "match_id": match_id,
             "referee_id": referee_id,
             "round_id": match["round_id"],
@@ -164,6 +344,17 @@ class MatchAssigner:
             "players": players,
             "assigned_at": match.get("assigned_at", utc_now()),
         }
+        return assignment_info, referee_url, envelope, payload
+
+    def _referee_slot(self, referee_id: str) -> int:
+        """Return the bit position of a referee, assigning one on first use.
+
+        Caller holds _availability_lock.
+        """
+        slot = self._referee_slots.get(referee_id)
+        if slot is None:
+            slot = self._referee_slots.setdefault(referee_id, len(self._referee_slots))
+        return slot
 
     def mark_referee_busy(self, referee_id: str):
         """Mark a referee as busy (executing a match).
@@ -171,7 +362,8 @@ class MatchAssigner:
         Args:
             referee_id: Referee identifier
         """
-        self._referee_availability[referee_id] = False
+        with self._availability_lock:
+            self._busy_bits |= 1 << self._referee_slot(referee_id)
         logger.debug("Referee %s marked as busy", referee_id)
 
     def mark_referee_idle(self, referee_id: str):
@@ -180,7 +372,8 @@ class MatchAssigner:
         Args:
             referee_id: Referee identifier
         """
-        self._referee_availability[referee_id] = True
+        with self._availability_lock:
+            self._busy_bits &= ~(1 << self._referee_slot(referee_id))
         logger.debug("Referee %s marked as idle", referee_id)
 
     def is_referee_available(self, referee_id: str) -> bool:
@@ -192,4 +385,10 @@ class MatchAssigner:
         Returns:
             True if referee is idle and available
         """
-        return self._referee_availability.get(referee_id, True)
+        with self._availability_lock:
+            return self._is_idle(referee_id)
+
+    def _is_idle(self, referee_id: str) -> bool:
+        """Check the busy bit of a referee; caller holds _availability_lock."""
+        slot = self._referee_slots.get(referee_id)
+        return slot is None or not (self._busy_bits >> slot) & 1
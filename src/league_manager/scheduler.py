@@ -4,12 +4,11 @@ This module implements deterministic round-robin scheduling as specified
 in ADR-002, ensuring each player plays every other player exactly once.
 """
 
-import itertools
 import logging
-import uuid
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..common.persistence import LeagueDatabase
+from ..common.protocol import generate_uuid4_batch
 
 logger = logging.getLogger(__name__)
 
@@ -52,81 +51,82 @@ class RoundRobinScheduler:
             logger.warning("Need at least 2 players for scheduling")
             return {"rounds": [], "total_matches": 0, "total_rounds": 0}
 
-        # Generate all unique pairs
-        all_matches = list(itertools.combinations(sorted_players, 2))
-        total_matches = len(all_matches)
+        total_matches = n * (n - 1) // 2
 
         logger.info("Generating schedule for %s players: %s total matches", n, total_matches)
 
-        # Group matches into rounds using round-robin algorithm
-        rounds = self._group_into_rounds(sorted_players, all_matches)
+        # Pair players round by round using the circle method
+        rounds = self._circle_rounds(sorted_players)
 
         # Store rounds and matches in database
         schedule_info = {"rounds": [], "total_matches": total_matches, "total_rounds": len(rounds)}
+        round_rows = []
+        match_rows = []
 
-        for round_number, round_matches in enumerate(rounds, 1):
-            round_id = f"round-{uuid.uuid4()}"
+        # Random bytes for every round and match id come from one read
+        ids = iter(generate_uuid4_batch(len(rounds) + total_matches))
 
-            # Create round in database
-            self.database.create_round(round_id, league_id, round_number, status="PENDING")
+        for round_number, round_matches in enumerate(rounds, 1):
+            round_id = f"round-{next(ids)}"
+            round_rows.append((round_id, league_id, round_number, "PENDING"))
 
-            # Create matches
+            # Collect matches
             match_infos = []
             for player_a, player_b in round_matches:
-                match_id = f"match-{uuid.uuid4()}"
-
-                self.database.create_match(
-                    match_id, round_id, game_type, players=[player_a, player_b], status="PENDING"
-                )
+                match_id = f"match-{next(ids)}"
 
+                match_rows.append((match_id, round_id, game_type, [player_a, player_b], "PENDING"))
                 match_infos.append({"match_id": match_id, "players": [player_a, player_b]})
 
             schedule_info["rounds"].append(
                 {"round_id": round_id, "round_number": round_number, "matches": match_infos}
             )
 
+        # Only a very large schedule is worth dropping and rebuilding the indexes for
+        # Rounds and matches commit together, so a failed insert leaves no empty rounds
+        with self.database.bulk_load(len(round_rows) + len(match_rows)):
+            with self.database.transaction():
+                self.database.create_rounds(round_rows)
+                self.database.create_matches(match_rows)
+
         logger.info("Created schedule with %s rounds and %s matches", len(rounds), total_matches)
         return schedule_info
 
-    def _group_into_rounds(
-        self, _players: List[str], matches: List[Tuple[str, str]]
-    ) -> List[List[Tuple[str, str]]]:
-        """Group matches into rounds where no player appears twice.
+    def _circle_rounds(self, players: List[str]) -> List[List[Tuple[str, str]]]:
+        """Build rounds with the circle method (see ADR-002).
 
-        This uses a greedy algorithm to create rounds with maximum
-        concurrent matches.
+        The first player stays fixed while the others rotate one position
+        per round; each round pairs the i-th player with the i-th from the
+        end. With an odd player count a bye slot is added and its pairings
+        are skipped.
 
         Args:
-            _players: List of player IDs (unused, inferred from matches)
-            matches: List of match pairs
+            players: Sorted list of player IDs
 
         Returns:
             List of rounds, where each round is a list of match pairs
+            ordered as in the sorted player list
         """
-        rounds = []
-        remaining_matches = matches.copy()
+        slots: List[Optional[str]] = list(players)
+        if len(slots) % 2:
+            slots.append(None)
+        m = len(slots)
 
-        while remaining_matches:
-            # Create a new round
+        rounds = []
+        for _ in range(m - 1):
             current_round = []
-            players_in_round = set()
-
-            # Greedy selection: add matches that don't conflict
-            matches_to_remove = []
-            for match in remaining_matches:
-                player_a, player_b = match
-                if player_a not in players_in_round and player_b not in players_in_round:
-                    current_round.append(match)
-                    players_in_round.add(player_a)
-                    players_in_round.add(player_b)
-                    matches_to_remove.append(match)
-
-            # Remove assigned matches
-            for match in matches_to_remove:
-                remaining_matches.remove(match)
-
+            for i in range(m // 2):
+                player_a, player_b = slots[i], slots[m - 1 - i]
+                if player_a is None or player_b is None:
+                    continue
+                if player_a > player_b:
+                    player_a, player_b = player_b, player_a
+                current_round.append((player_a, player_b))
             rounds.append(current_round)
 
+            # Keep the first slot fixed and rotate the rest by one
+            slots = [slots[0], slots[-1]] + slots[1:-1]
+
         return rounds
 
     def get_schedule(self, _league_id: str) -> Dict[str, Any]:
@@ -20,6 +20,7 @@ from ..common.protocol import (
     JSONRPCResponse,
     MessageType,
     create_success_response,
+    lookup_message_type,
     utc_now,
 )
 from ..common.request_handlers import (
@@ -106,6 +107,8 @@ class LeagueManagerServer:
     def stop(self):
         """Stop the League Manager server."""
         self.http_server.stop()
+        self.http_client.close()
+        self.audit_logger.close()
         self.database.close()
         logger.info("League Manager stopped")
 
@@ -127,7 +130,7 @@ class LeagueManagerServer:
             self.audit_logger.log_request(request, envelope.sender, "league_manager")
 
             # Validate authentication (except for registration and admin requests)
-            message_type = MessageType(envelope.message_type)
+            message_type = lookup_message_type(envelope.message_type)
             exempt_from_auth = [
                 MessageType.REGISTER_REFEREE_REQUEST,
                 MessageType.REGISTER_PLAYER_REQUEST,
@@ -185,7 +188,9 @@ class LeagueManagerServer:
             raise ValidationError("Missing referee_id", field="referee_id")
 
         endpoint_url = payload.get("endpoint_url")
-        return self.registration_handler.register_referee(referee_id, envelope, endpoint_url)
+        response = self.registration_handler.register_referee(referee_id, envelope, endpoint_url)
+        self.match_assigner.invalidate_referee(referee_id)
+        return response
 
     def _handle_register_player(
         self, envelope: Envelope, payload: Dict[str, Any]
@@ -242,12 +247,7 @@ class LeagueManagerServer:
         pending_matches = self.database.get_pending_matches(self.league_state.league_id)
         if not pending_matches:
             # Check if any matches are still in progress
-            all_matches = self.database.conn.execute(
-                """SELECT COUNT(*) FROM matches m
-                   JOIN rounds r ON m.round_id = r.round_id
-                   WHERE r.league_id = ? AND m.status != 'COMPLETED' """,
-                (self.league_state.league_id,),
-            ).fetchone()[0]
+            all_matches = self.database.count_unfinished_matches(self.league_state.league_id)
 
             if all_matches == 0:
                 # All matches complete - transition to COMPLETED
@@ -292,6 +292,7 @@ class LeagueManagerServer:
 
             # Update status to ACTIVE
             self.database.update_referee_status(agent_id, "ACTIVE")
+            self.match_assigner.invalidate_referee(agent_id)
             logger.info("Referee %s is now ACTIVE", agent_id)
 
         elif agent_type == "player":
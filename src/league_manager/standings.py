@@ -137,27 +137,29 @@ class StandingsEngine:
         # Compute standings
         standings = self.compute_standings(league_id, round_id)
 
-        # Create snapshot
+        # Snapshot and rankings in a single transaction
         snapshot_id = f"snapshot-{uuid.uuid4()}"
-        self.database.create_standings_snapshot(
-            snapshot_id, league_id, round_id, standings["updated_at"]
+        self.database.write_snapshot(
+            snapshot_id,
+            league_id,
+            round_id,
+            standings["updated_at"],
+            [
+                (
+                    ranking["player_id"],
+                    PlayerRanking(
+                        rank=ranking["rank"],
+                        points=ranking["points"],
+                        wins=ranking["wins"],
+                        draws=ranking["draws"],
+                        losses=ranking["losses"],
+                        matches_played=ranking["matches_played"],
+                    ),
+                )
+                for ranking in standings["standings"]
+            ],
         )
 
-        # Store rankings
-        for ranking in standings["standings"]:
-            self.database.store_player_ranking(
-                snapshot_id,
-                ranking["player_id"],
-                PlayerRanking(
-                    rank=ranking["rank"],
-                    points=ranking["points"],
-                    wins=ranking["wins"],
-                    draws=ranking["draws"],
-                    losses=ranking["losses"],
-                    matches_played=ranking["matches_played"],
-                ),
-            )
-
         logger.info("Published standings snapshot %s", snapshot_id)
         return snapshot_id
 
@@ -5,6 +5,7 @@ centralized access to league configuration and status.
 """
 
 import logging
+import threading
 from enum import Enum
 from typing import Any, Dict
 
@@ -49,6 +50,8 @@ class LeagueState:
         self.database = database
         self.config = config
         self._status = LeagueStatus.INIT
+        # Request handlers run concurrently; transitions must check-and-set atomically
+        self._transition_lock = threading.Lock()
 
     def initialize(self):
         """Initialize the league in the database."""
@@ -89,14 +92,15 @@ class LeagueState:
             LeagueStatus.COMPLETED: [],
         }
 
-        if new_status not in valid_transitions.get(self._status, []):
-            logger.error("Invalid transition from %s to %s", self._status, new_status)
-            return False
+        with self._transition_lock:
+            if new_status not in valid_transitions.get(self._status, []):
+                logger.error("Invalid transition from %s to %s", self._status, new_status)
+                return False
 
-        # Update database
-        self.database.update_league_status(self.league_id, new_status.value)
-        old_status = self._status
-        self._status = new_status
+            # Update database
+            self.database.update_league_status(self.league_id, new_status.value)
+            old_status = self._status
+            self._status = new_status
         logger.info("League %s transitioned from %s to %s", self.league_id, old_status, new_status)
         return True
 
@@ -16,6 +16,7 @@ from ..common.protocol import (
     JSONRPCResponse,
     MessageType,
     create_success_response,
+    lookup_message_type,
 )
 from ..common.request_handlers import handle_request_errors
 from .strategies import get_strategy
@@ -73,6 +74,7 @@ class PlayerServer(AgentServerBase):
     def stop(self):
         """Stop the player server."""
         self.http_server.stop()
+        self.http_client.close()
         logger.info("Player %s stopped", self.player_id)
 
     def register(self) -> bool:
@@ -107,7 +109,7 @@ class PlayerServer(AgentServerBase):
         payload = request.params.get("payload", {})
 
         # Dispatch based on message type
-        message_type = MessageType(envelope.message_type)
+        message_type = lookup_message_type(envelope.message_type)
 
         if message_type == MessageType.GAME_INVITATION:
             response_payload = self._handle_game_invitation(envelope, payload)
@@ -9,7 +9,7 @@ import random
 from typing import Any, Dict, Optional, Tuple
 
 from ...common.strategy_interface import StrategyInterface
-from ...common.tic_tac_toe_utils import get_available_moves, would_win
+from ...common.tic_tac_toe_utils import board_to_bits, get_available_moves, would_win_bits
 
 logger = logging.getLogger(__name__)
 
@@ -83,11 +83,12 @@ class TicTacToeSmartStrategy(StrategyInterface):
         Returns:
             Winning move or None
         """
+        mask = board_to_bits(board, my_mark)
         for row in range(3):
             for col in range(3):
                 if board[row][col] == "":
                     # Try this move using shared utility
-                    if would_win(board, row, col, my_mark):
+                    if would_win_bits(mask, row * 3 + col):
                         return (row, col)
         return None
 
@@ -102,10 +103,11 @@ class TicTacToeSmartStrategy(StrategyInterface):
             Blocking move or None
         """
         opponent_mark = "O" if my_mark == "X" else "X"
+        mask = board_to_bits(board, opponent_mark)
         for row in range(3):
             for col in range(3):
                 if board[row][col] == "":
                     # Check if opponent would win here using shared utility
-                    if would_win(board, row, col, opponent_mark):
+                    if would_win_bits(mask, row * 3 + col):
                         return (row, col)
         return None
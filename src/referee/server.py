@@ -11,12 +11,14 @@ from typing import Any, Dict
 from ..common.agent_base import AgentServerBase
 from ..common.errors import ErrorCode, LeagueError, OperationalError
 from ..common.protocol import (
+    PROTOCOL_VERSION,
     Envelope,
     JSONRPCRequest,
     JSONRPCResponse,
     MessageType,
     create_success_response,
     generate_conversation_id,
+    lookup_message_type,
     utc_now,
 )
 from ..common.request_handlers import handle_request_errors
@@ -56,6 +58,7 @@ class RefereeServer(AgentServerBase):
     def stop(self):
         """Stop the referee server."""
         self.http_server.stop()
+        self.http_client.close()
         logger.info("Referee %s stopped", self.referee_id)
 
     def register(self) -> bool:
@@ -90,7 +93,7 @@ class RefereeServer(AgentServerBase):
         payload = request.params.get("payload", {})
 
         # Dispatch based on message type
-        message_type = MessageType(envelope.message_type)
+        message_type = lookup_message_type(envelope.message_type)
 
         if message_type == MessageType.MATCH_ASSIGNMENT:
             response_payload = self._handle_match_assignment(envelope, payload)
@@ -101,11 +104,12 @@ class RefereeServer(AgentServerBase):
 
         # Create response envelope
         response_envelope = self._create_response_envelope(
-            MessageType.MATCH_ASSIGNMENT_ACK.value, envelope.conversation_id, envelope.match_id
+            MessageType.MATCH_ASSIGNMENT_ACK.value,
+            envelope.conversation_id,
+            envelope.match_id,
+            auth_token=self.auth_token,
+            league_id=self.league_id,
         )
-        # Add auth_token and league_id to response envelope
-        response_envelope.auth_token = self.auth_token
-        response_envelope.league_id = self.league_id
 
         return create_success_response(response_envelope, response_payload, request.id)
 
@@ -165,9 +169,9 @@ class RefereeServer(AgentServerBase):
             result: Match result dictionary
         """
         envelope = Envelope(
-            protocol="league.v2",
+            protocol=PROTOCOL_VERSION,
             message_type=MessageType.MATCH_RESULT_REPORT.value,
-            sender=f"referee:{self.referee_id}",
+            sender=self._sender,
             timestamp=utc_now(),
             conversation_id=generate_conversation_id(),
             auth_token=self.auth_token,
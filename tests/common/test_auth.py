@@ -33,8 +33,19 @@ class TestAuthManager:
 
         result = auth_manager.validate_token(token)
 
-        assert result["agent_id"] == "referee-1"
-        assert result["agent_type"] == AgentType.REFEREE.value
+        assert result.agent_id == "referee-1"
+        assert result.agent_type == AgentType.REFEREE.value
+
+    def test_validate_token_returns_immutable_info(self, auth_manager):
+        """Test that the returned info is an immutable (agent_id, agent_type) tuple."""
+        token = auth_manager.issue_token("referee-1", AgentType.REFEREE)
+
+        info = auth_manager.validate_token(token)
+        agent_id, agent_type = info
+
+        assert (agent_id, agent_type) == ("referee-1", AgentType.REFEREE.value)
+        with pytest.raises(AttributeError):
+            info.agent_id = "tampered"
 
     def test_validate_token_invalid(self, auth_manager):
         """Test validating an invalid token."""
@@ -137,9 +148,9 @@ class TestAuthManager:
         assert token2 != token3
 
         # All should validate correctly
-        assert auth_manager.validate_token(token1)["agent_id"] == "player-1"
-        assert auth_manager.validate_token(token2)["agent_id"] == "player-2"
-        assert auth_manager.validate_token(token3)["agent_id"] == "ref-1"
+        assert auth_manager.validate_token(token1).agent_id == "player-1"
+        assert auth_manager.validate_token(token2).agent_id == "player-2"
+        assert auth_manager.validate_token(token3).agent_id == "ref-1"
 
     def test_thread_safety(self, auth_manager):
         """Test that auth manager is thread-safe."""
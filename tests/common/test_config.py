@@ -0,0 +1,193 @@
+"""Tests for configuration loading.
+
+This module tests YAML configuration parsing and the parse cache.
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from src.common.config import ConfigManager
+from src.common.errors import ConfigurationError
+
+LEAGUE_YAML = """
+league:
+  league_id: "cache-league"
+  name: "Cache League"
+registration:
+  min_players: 4
+"""
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """Create a config directory with a league file."""
+    (tmp_path / "league.yaml").write_text(LEAGUE_YAML, encoding="utf-8")
+    return tmp_path
+
+
+class TestConfigManager:
+    """Tests for ConfigManager class."""
+
+    def test_load_league_config(self, config_dir):
+        """Test loading league settings with defaults filled in."""
+        manager = ConfigManager(str(config_dir))
+        manager.load_league_config()
+
+        assert manager.league.league_id == "cache-league"
+        assert manager.league.min_players == 4
+        assert manager.league.max_players == 100
+        assert manager.database.path == "./data/league.db"
+
+    def test_empty_sections_use_defaults(self, tmp_path):
+        """Test that empty or unknown sections fall back to defaults."""
+        (tmp_path / "league.yaml").write_text(
+            "league:\ntimeouts:\n  move_response_ms: 500\n  unknown_ms: 1\n", encoding="utf-8"
+        )
+        manager = ConfigManager(str(tmp_path))
+        manager.load_league_config()
+
+        assert manager.league.league_id == "default-league"
+        assert manager.timeouts.move_response_ms == 500
+        assert manager.timeouts.match_join_ack_ms == 10000
+        assert manager.scheduling.algorithm == "round_robin"
+
+    def test_missing_league_config(self, tmp_path):
+        """Test that a missing league file raises ConfigurationError."""
+        with pytest.raises(ConfigurationError):
+            ConfigManager(str(tmp_path)).load_league_config()
+
+    def test_default_game_registry(self, tmp_path):
+        """Test that a missing game registry falls back to tic-tac-toe."""
+        manager = ConfigManager(str(tmp_path))
+        manager.load_game_registry()
+
+        scoring = manager.get_scoring("tic_tac_toe")
+        assert (scoring.win, scoring.draw, scoring.loss) == (3, 1, 0)
+        assert scoring.as_dict() == {"win": 3, "draw": 1, "loss": 0}
+
+    def test_scoring_cache_cleared_on_reload(self, tmp_path):
+        """Test that reloading the game registry drops cached scoring."""
+        manager = ConfigManager(str(tmp_path))
+        manager.load_game_registry()
+        assert manager.get_scoring("tic_tac_toe").win == 3
+
+        (tmp_path / "game_registry.yaml").write_text(
+            "games:\n"
+            "  - game_type: tic_tac_toe\n"
+            "    name: Tic Tac Toe\n"
+            "    referee_implementation: x.Y\n"
+            "    scoring: {win: 2, draw: 1, loss: 0}\n"
+        )
+        manager.load_game_registry()
+        assert manager.get_scoring("tic_tac_toe").win == 2
+
+
+class TestLoadAll:
+    """Tests for single-pass loading of both configuration files."""
+
+    REGISTRY_YAML = """\
+games:
+  - game_type: chess
+    name: Chess
+    referee_implementation: x.Y
+"""
+
+    def test_load_all_single_pass(self, config_dir):
+        """Test that both files are parsed with one load_all call."""
+        (config_dir / "game_registry.yaml").write_text(self.REGISTRY_YAML, encoding="utf-8")
+
+        manager = ConfigManager(str(config_dir))
+        with patch.object(yaml, "load_all", wraps=yaml.load_all) as load_all:
+            manager.load_all()
+
+        assert load_all.call_count == 1
+        assert manager.league.name == "Cache League"
+        assert manager.get_game_config("chess").name == "Chess"
+
+    def test_load_all_with_document_markers(self, config_dir):
+        """Test that files with explicit '---' markers fall back to per-file parsing."""
+        (config_dir / "game_registry.yaml").write_text(
+            "---\n" + self.REGISTRY_YAML, encoding="utf-8"
+        )
+
+        manager = ConfigManager(str(config_dir), use_cache=True)
+        manager.load_all()
+
+        assert manager.league.league_id == "cache-league"
+        assert manager.get_game_config("chess") is not None
+        assert (config_dir / ".game_registry.yaml.cache.json").exists()
+
+    def test_load_all_reports_invalid_file(self, config_dir):
+        """Test that a YAML error is attributed to the file that caused it."""
+        (config_dir / "game_registry.yaml").write_text("games: [", encoding="utf-8")
+
+        with pytest.raises(ConfigurationError) as exc_info:
+            ConfigManager(str(config_dir)).load_all()
+
+        assert exc_info.value.details["path"].endswith("game_registry.yaml")
+
+    def test_load_all_wraps_read_errors(self, config_dir):
+        """Test that an unreadable file raises ConfigurationError naming it."""
+        (config_dir / "game_registry.yaml").write_text(self.REGISTRY_YAML, encoding="utf-8")
+        league_path = str(config_dir / "league.yaml")
+
+        with patch.object(
+            Path, "read_bytes", side_effect=PermissionError(13, "Permission denied", league_path)
+        ):
+            with pytest.raises(ConfigurationError) as exc_info:
+                ConfigManager(str(config_dir)).load_all()
+
+        assert exc_info.value.details["path"] == league_path
+
+
+class TestParseCache:
+    """Tests for the on-disk YAML parse cache."""
+
+    def test_cache_written_and_reused(self, config_dir):
+        """Test that a second load reads the sidecar instead of the YAML."""
+        ConfigManager(str(config_dir), use_cache=True).load_league_config()
+        cache_file = config_dir / ".league.yaml.cache.json"
+        assert cache_file.exists()
+
+        # Tamper with the cached data; an unchanged YAML file means it is trusted
+        cache_file.write_text(
+            cache_file.read_text(encoding="utf-8").replace("Cache League", "Cached"),
+            encoding="utf-8",
+        )
+        manager = ConfigManager(str(config_dir), use_cache=True)
+        manager.load_league_config()
+
+        assert manager.league.name == "Cached"
+
+    def test_cache_invalidated_on_change(self, config_dir):
+        """Test that modifying the YAML file bypasses a stale sidecar."""
+        ConfigManager(str(config_dir), use_cache=True).load_league_config()
+
+        league_file = config_dir / "league.yaml"
+        league_file.write_text(LEAGUE_YAML.replace("Cache League", "Renamed"), encoding="utf-8")
+        stat = league_file.stat()
+        os.utime(league_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        manager = ConfigManager(str(config_dir), use_cache=True)
+        manager.load_league_config()
+
+        assert manager.league.name == "Renamed"
+
+    def test_corrupt_cache_falls_back_to_yaml(self, config_dir):
+        """Test that an unreadable sidecar is ignored."""
+        (config_dir / ".league.yaml.cache.json").write_text("not json", encoding="utf-8")
+
+        manager = ConfigManager(str(config_dir), use_cache=True)
+        manager.load_league_config()
+
+        assert manager.league.name == "Cache League"
+
+    def test_cache_off_by_default(self, config_dir):
+        """Test that no sidecar is written unless the cache is enabled."""
+        ConfigManager(str(config_dir)).load_all()
+
+        assert not (config_dir / ".league.yaml.cache.json").exists()
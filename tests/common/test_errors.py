@@ -0,0 +1,75 @@
+"""Tests for league error types.
+
+This module tests error codes and JSON-RPC error serialization.
+"""
+
+import json
+
+from src.common.errors import (
+    AuthenticationError,
+    ErrorCode,
+    LeagueError,
+    RegistrationClosedError,
+    ValidationError,
+    lookup_error_code,
+)
+
+
+class TestLeagueError:
+    """Tests for LeagueError serialization."""
+
+    def test_message_includes_code_name(self):
+        """Test that the exception text is prefixed with the code name."""
+        error = LeagueError(ErrorCode.DATABASE_ERROR, "disk full")
+
+        assert str(error) == "[DATABASE_ERROR] disk full"
+
+    def test_to_dict_with_details(self):
+        """Test serializing an error that carries details."""
+        error = ValidationError("bad sender", field="sender")
+
+        assert error.to_dict() == {
+            "code": 4018,
+            "message": "bad sender",
+            "data": {"error_code": "VALIDATION_ERROR", "details": {"field": "sender"}},
+        }
+
+    def test_to_dict_keeps_empty_details(self):
+        """Test that errors without details still carry an empty details object."""
+        error = RegistrationClosedError()
+
+        assert error.to_dict() == {
+            "code": int(ErrorCode.REGISTRATION_CLOSED),
+            "message": "Registration window is closed",
+            "data": {"error_code": "REGISTRATION_CLOSED", "details": {}},
+        }
+
+    def test_details_default_to_empty_dict(self):
+        """Test that details is always a dict for callers."""
+        assert AuthenticationError().details == {}
+
+    def test_to_json_bytes_matches_to_dict(self):
+        """Test that JSON bytes round-trip to the dictionary form."""
+        for error in (RegistrationClosedError(), ValidationError("bad", field="x")):
+            assert json.loads(error.to_json_bytes()) == error.to_dict()
+
+    def test_to_json_bytes_cached_without_details(self):
+        """Test that detail-free errors reuse the cached bytes."""
+        assert (
+            RegistrationClosedError().to_json_bytes() is RegistrationClosedError().to_json_bytes()
+        )
+
+
+class TestLookupErrorCode:
+    """Tests for decoding wire error codes."""
+
+    def test_known_code(self):
+        """Test a known integer maps to its ErrorCode member."""
+        assert lookup_error_code(4009) is ErrorCode.AUTHENTICATION_FAILED
+
+    def test_unknown_code_uses_default(self):
+        """Test unknown or malformed codes fall back to the default."""
+        assert lookup_error_code(-32600) is ErrorCode.INTERNAL_ERROR
+        assert lookup_error_code(None) is ErrorCode.INTERNAL_ERROR
+        assert lookup_error_code([1]) is ErrorCode.INTERNAL_ERROR
+        assert lookup_error_code("x", ErrorCode.INVALID_JSON_RPC) is ErrorCode.INVALID_JSON_RPC
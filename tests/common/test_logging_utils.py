@@ -0,0 +1,177 @@
+"""Tests for audit logging.
+
+This module tests AuditLogger entry format and write batching.
+"""
+
+import json
+import subprocess
+import sys
+import time
+
+import pytest
+
+from src.common.logging_utils import (
+    AuditLogger,
+    setup_application_logging,
+    stop_application_logging,
+)
+from src.common.protocol import (
+    Envelope,
+    JSONRPCRequest,
+    create_success_response,
+    validate_timestamp,
+)
+
+
+@pytest.fixture
+def request_message(sample_envelope_data):
+    """Build a JSON-RPC request carrying the sample envelope."""
+    return JSONRPCRequest(
+        jsonrpc="2.0",
+        method="league.handle",
+        params={"envelope": sample_envelope_data, "payload": {}},
+        id="req-1",
+    )
+
+
+def read_entries(path):
+    """Read all JSON Lines entries from an audit log."""
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestAuditLogger:
+    """Tests for AuditLogger class."""
+
+    def test_request_entry_format(self, tmp_path, request_message, sample_envelope_data):
+        """Test that request entries carry routing metadata and the message."""
+        log_path = tmp_path / "audit.jsonl"
+        with AuditLogger(str(log_path)) as audit:
+            audit.log_request(request_message, "player:alice", "league_manager")
+
+        (entry,) = read_entries(log_path)
+        assert entry["direction"] == "request"
+        assert entry["source"] == "player:alice"
+        assert entry["conversation_id"] == sample_envelope_data["conversation_id"]
+        assert entry["message"]["id"] == "req-1"
+        assert entry["timestamp"].endswith("Z")
+        validate_timestamp(entry["timestamp"])
+
+    def test_response_entry_extracts_conversation_id(self, tmp_path, sample_envelope_data):
+        """Test that the conversation ID is taken from the response envelope."""
+        envelope = Envelope.from_dict(sample_envelope_data)
+        response = create_success_response(envelope, {}, "req-1")
+        log_path = tmp_path / "audit.jsonl"
+        with AuditLogger(str(log_path)) as audit:
+            audit.log_response(response, "league_manager", "player:alice")
+
+        (entry,) = read_entries(log_path)
+        assert entry["direction"] == "response"
+        assert entry["conversation_id"] == sample_envelope_data["conversation_id"]
+
+    def test_entries_buffered_until_batch_full(self, tmp_path, request_message):
+        """Test that entries are written once the batch size is reached."""
+        log_path = tmp_path / "audit.jsonl"
+        audit = AuditLogger(str(log_path), batch_size=3, flush_interval=60)
+        audit.open()
+        try:
+            audit.log_request(request_message, "player:alice", "league_manager")
+            audit.log_request(request_message, "player:alice", "league_manager")
+            assert log_path.read_text(encoding="utf-8") == ""
+
+            audit.log_request(request_message, "player:alice", "league_manager")
+            assert len(read_entries(log_path)) == 3
+        finally:
+            audit.close()
+
+    def test_sync_write_flushes_immediately(self, tmp_path, request_message):
+        """Test that sync=True writes the entry before returning."""
+        log_path = tmp_path / "audit.jsonl"
+        audit = AuditLogger(str(log_path), batch_size=100, flush_interval=60)
+        try:
+            audit.log_request(request_message, "player:alice", "league_manager", sync=True)
+            assert len(read_entries(log_path)) == 1
+        finally:
+            audit.close()
+
+    def test_close_flushes_pending(self, tmp_path, request_message):
+        """Test that closing the logger writes buffered entries."""
+        log_path = tmp_path / "audit.jsonl"
+        audit = AuditLogger(str(log_path), batch_size=100, flush_interval=60)
+        audit.open()
+        for _ in range(5):
+            audit.log_request(request_message, "player:alice", "league_manager")
+        audit.close()
+
+        assert len(read_entries(log_path)) == 5
+
+    def test_pending_entries_written_at_exit(self, tmp_path):
+        """Test entries still buffered when the process exits reach the file."""
+        log_path = tmp_path / "audit.jsonl"
+        script = (
+            "from src.common.logging_utils import AuditLogger\n"
+            "from src.common.protocol import JSONRPCRequest\n"
+            f"audit = AuditLogger({str(log_path)!r}, batch_size=100, flush_interval=60)\n"
+            "request = JSONRPCRequest(jsonrpc='2.0', method='league.handle', params={}, id='r')\n"
+            "for _ in range(3):\n"
+            "    audit.log_request(request, 'player:alice', 'league_manager')\n"
+        )
+        subprocess.run([sys.executable, "-c", script], check=True, timeout=30)
+
+        assert len(read_entries(log_path)) == 3
+
+    def test_log_ids_unique(self, tmp_path, request_message):
+        """Test that every entry receives a distinct log ID."""
+        log_path = tmp_path / "audit.jsonl"
+        with AuditLogger(str(log_path)) as audit:
+            for _ in range(10):
+                audit.log_request(request_message, "player:alice", "league_manager")
+
+        log_ids = [entry["log_id"] for entry in read_entries(log_path)]
+        assert len(set(log_ids)) == 10
+
+
+class TestApplicationLogging:
+    """Tests for setup_application_logging."""
+
+    def test_records_written_after_stop(self, tmp_path):
+        """Test that queued records reach the file once the listener is stopped."""
+        log_path = tmp_path / "app.log"
+        logger = setup_application_logging(str(log_path), "INFO", "test.app_logging")
+        logger.info("hello %s", "world")
+        logger.debug("not written")
+        stop_application_logging("test.app_logging")
+
+        content = log_path.read_text(encoding="utf-8")
+        assert "test.app_logging - INFO - hello world" in content
+        assert "not written" not in content
+
+    def test_file_writes_buffered_until_error(self, tmp_path):
+        """Test that INFO records are batched and an ERROR forces a flush."""
+        log_path = tmp_path / "app.log"
+        logger = setup_application_logging(str(log_path), "INFO", "test.buffered")
+        try:
+            logger.info("buffered")
+            time.sleep(0.2)
+            assert "buffered" not in log_path.read_text(encoding="utf-8")
+
+            logger.error("failure")
+            deadline = time.monotonic() + 2
+            while "failure" not in log_path.read_text(encoding="utf-8"):
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+            assert "buffered" in log_path.read_text(encoding="utf-8")
+        finally:
+            stop_application_logging("test.buffered")
+
+    def test_info_flushed_within_interval(self, tmp_path):
+        """Test a lone INFO record reaches the file without waiting for an ERROR."""
+        log_path = tmp_path / "app.log"
+        logger = setup_application_logging(str(log_path), "INFO", "test.timed")
+        try:
+            logger.info("quiet")
+            deadline = time.monotonic() + 2
+            while "quiet" not in log_path.read_text(encoding="utf-8"):
+                assert time.monotonic() < deadline
+                time.sleep(0.05)
+        finally:
+            stop_application_logging("test.timed")
@@ -3,7 +3,15 @@
 This module tests all database operations for the league system.
 """
 
-from src.common.persistence import PlayerRanking
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from src.common.errors import DatabaseError
+from src.common.persistence import LeagueDatabase, PlayerRanking
 from src.common.protocol import utc_now
 
 
@@ -30,6 +38,64 @@ class TestLeagueDatabase:
         for table in expected_tables:
             assert table in tables
 
+    def test_secondary_indexes_created(self, temp_db):
+        """Test that league and round lookups have supporting indexes."""
+        cursor = temp_db.conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        indexes = {row[0] for row in cursor.fetchall()}
+
+        assert {
+            "idx_rounds_league",
+            "idx_matches_round_status",
+            "idx_players_league",
+            "idx_referees_league",
+        } <= indexes
+
+    def test_bulk_load_restores_indexes(self, temp_db, sample_league_id):
+        """Test that secondary indexes are dropped during a bulk load and rebuilt."""
+
+        def index_names():
+            cursor = temp_db.conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+            return {row[0] for row in cursor.fetchall()}
+
+        with temp_db.bulk_load():
+            assert "idx_matches_round_status" not in index_names()
+            temp_db.create_round("round-1", sample_league_id, 1)
+
+        assert "idx_matches_round_status" in index_names()
+
+    def test_small_bulk_load_keeps_indexes(self, temp_db, sample_league_id):
+        """Test a load below the row threshold leaves the indexes in place."""
+        with patch.object(temp_db, "_write_transaction", wraps=temp_db._write_transaction) as tx:
+            with temp_db.bulk_load(expected_rows=10):
+                cursor = temp_db.conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+                assert "idx_matches_round_status" in {row[0] for row in cursor.fetchall()}
+
+        tx.assert_not_called()
+
+    def test_connection_uses_wal(self, temp_db):
+        """Test that connections use WAL with relaxed synchronous mode."""
+        assert temp_db.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # 1 == NORMAL
+        assert temp_db.conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+    def test_read_connections_are_read_only(self, temp_db):
+        """Test that pooled readers reject writes."""
+        with temp_db.read_conn() as conn:
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute(
+                    "INSERT INTO leagues (league_id, status, created_at, config) "
+                    "VALUES ('l', 'INIT', 'now', '{}')"
+                )
+
+    def test_reads_from_other_threads(self, temp_db):
+        """Test that committed writes are visible to readers on other threads."""
+        temp_db.create_league("league-1", "REGISTRATION", utc_now(), {})
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            leagues = list(pool.map(temp_db.get_league, ["league-1"] * 32))
+
+        assert all(league["status"] == "REGISTRATION" for league in leagues)
+
 
 class TestLeagueOperations:
     """Tests for league CRUD operations."""
@@ -57,6 +123,45 @@ class TestLeagueOperations:
         league = temp_db.get_league("nonexistent")
         assert league is None
 
+    def test_get_league_served_from_cache(self, temp_db):
+        """Test repeated lookups hit SQLite once and return independent copies."""
+        temp_db.create_league("league-1", "REGISTRATION", utc_now(), {})
+        temp_db.get_league("league-1")["status"] = "MUTATED"
+
+        with patch.object(temp_db, "_fetchone", wraps=temp_db._fetchone) as fetchone:
+            league = temp_db.get_league("league-1")
+            temp_db.get_league("league-1")
+
+        assert fetchone.call_count == 0
+        assert league["status"] == "REGISTRATION"
+
+    def test_update_league_status_invalidates_cache(self, temp_db):
+        """Test a status update is visible after the row was cached."""
+        temp_db.create_league("league-1", "REGISTRATION", utc_now(), {})
+        temp_db.get_league("league-1")
+
+        temp_db.update_league_status("league-1", "ACTIVE")
+
+        assert temp_db.get_league("league-1")["status"] == "ACTIVE"
+
+    def test_transaction_write_invalidates_cache(self, temp_db):
+        """Test a write made through transaction() is visible after the row was cached."""
+        temp_db.create_league("league-1", "REGISTRATION", utc_now(), {})
+        temp_db.get_league("league-1")
+
+        with temp_db.transaction() as conn:
+            conn.execute("UPDATE leagues SET status = 'ACTIVE' WHERE league_id = 'league-1'")
+
+        assert temp_db.get_league("league-1")["status"] == "ACTIVE"
+
+    def test_missing_league_not_cached(self, temp_db):
+        """Test a lookup miss does not hide a league created afterwards."""
+        assert temp_db.get_league("league-1") is None
+
+        temp_db.create_league("league-1", "REGISTRATION", utc_now(), {})
+
+        assert temp_db.get_league("league-1") is not None
+
 
 class TestRefereeOperations:
     """Tests for referee CRUD operations."""
@@ -95,6 +200,7 @@ class TestRefereeOperations:
         temp_db.register_referee(
             "ref-1", sample_league_id, auth_token="token-1", registered_at=utc_now()
         )
+        temp_db.get_referee("ref-1")
 
         temp_db.update_referee_status("ref-1", "ACTIVE")
 
@@ -136,6 +242,36 @@ class TestPlayerOperations:
         assert len(players) == 3
         assert {p["player_id"] for p in players} == {"alice", "bob", "charlie"}
 
+    def test_register_players_batch_is_atomic(self, temp_db, sample_league_id):
+        """Test that a batch with a duplicate token registers nobody."""
+        temp_db.create_league(sample_league_id, "REGISTRATION", utc_now(), {})
+        now = utc_now()
+
+        with pytest.raises(DatabaseError):
+            temp_db.register_players(
+                [
+                    ("alice", sample_league_id, "token-1", now, None),
+                    ("bob", sample_league_id, "token-1", now, None),
+                ]
+            )
+
+        assert temp_db.get_all_players(sample_league_id) == []
+
+    def test_get_players_bulk(self, temp_db, sample_league_id):
+        """Test fetching several players by id in one call."""
+        temp_db.create_league(sample_league_id, "REGISTRATION", utc_now(), {})
+        now = utc_now()
+        temp_db.register_players(
+            [(f"player-{i}", sample_league_id, f"token-{i}", now, None) for i in range(600)]
+        )
+
+        players = temp_db.get_players(["player-0", "player-599", "player-0", "missing"])
+        assert set(players) == {"player-0", "player-599"}
+        assert players["player-599"]["auth_token"] == "token-599"
+
+        # More ids than fit in one IN (...) query
+        assert len(temp_db.get_players(f"player-{i}" for i in range(600))) == 600
+
     def test_update_player_status(self, temp_db, sample_league_id):
         """Test updating player status."""
         temp_db.create_league(sample_league_id, "REGISTRATION", utc_now(), {})
@@ -143,6 +279,8 @@ class TestPlayerOperations:
             "alice", sample_league_id, auth_token="token-1", registered_at=utc_now()
         )
 
+        temp_db.get_player("alice")
+
         temp_db.update_player_status("alice", "SUSPENDED")
 
         player = temp_db.get_player("alice")
@@ -194,6 +332,58 @@ class TestMatchOperations:
         assert match["players"] == ["alice", "bob"]
         assert match["game_type"] == "tic_tac_toe"
 
+    def test_create_matches_batch(self, temp_db, sample_league_id):
+        """Test creating several matches in one call."""
+        temp_db.create_league(sample_league_id, "ACTIVE", utc_now(), {})
+        temp_db.create_round("round-1", sample_league_id, 1)
+
+        temp_db.create_matches(
+            [
+                ("match-1", "round-1", "tic_tac_toe", ["alice", "bob"], "PENDING"),
+                ("match-2", "round-1", "tic_tac_toe", ["carol", "dave"], "PENDING"),
+            ]
+        )
+
+        pending = temp_db.get_pending_matches(sample_league_id)
+        assert {m["match_id"] for m in pending} == {"match-1", "match-2"}
+        assert temp_db.get_match("match-2")["players"] == ["carol", "dave"]
+
+    def test_create_rounds_batch(self, temp_db, sample_league_id):
+        """Test creating several rounds in one call."""
+        temp_db.create_league(sample_league_id, "ACTIVE", utc_now(), {})
+
+        temp_db.create_rounds(
+            [
+                ("round-1", sample_league_id, 1, "PENDING"),
+                ("round-2", sample_league_id, 2, "PENDING"),
+            ]
+        )
+
+        rows = temp_db.conn.execute(
+            "SELECT round_id, round_number FROM rounds WHERE league_id = ? ORDER BY round_number",
+            (sample_league_id,),
+        ).fetchall()
+        assert [tuple(row) for row in rows] == [("round-1", 1), ("round-2", 2)]
+
+    def test_iter_pending_matches_batches(self, temp_db, sample_league_id):
+        """Test pending matches come in creation order, unaffected by claims in between."""
+        temp_db.create_league(sample_league_id, "ACTIVE", utc_now(), {})
+        temp_db.create_round("round-1", sample_league_id, 1)
+        temp_db.create_matches(
+            [
+                (f"match-{i}", "round-1", "tic_tac_toe", ["alice", "bob"], "PENDING")
+                for i in range(5)
+            ]
+        )
+
+        seen = []
+        for batch in temp_db.iter_pending_matches(sample_league_id, 2):
+            seen.append([m["match_id"] for m in batch])
+            assert "row_order" not in batch[0]
+            temp_db.assign_match(batch[0]["match_id"], "ref-1", utc_now())
+
+        assert seen == [["match-0", "match-1"], ["match-2", "match-3"], ["match-4"]]
+
     def test_assign_match(self, temp_db, sample_league_id):
         """Test assigning a match to a referee."""
         temp_db.create_league(sample_league_id, "ACTIVE", utc_now(), {})
@@ -203,12 +393,47 @@ class TestMatchOperations:
         temp_db.create_round("round-1", sample_league_id, 1)
         temp_db.create_match("match-1", "round-1", "tic_tac_toe", players=["alice", "bob"])
 
-        temp_db.assign_match("match-1", "ref-1", utc_now())
+        assigned = temp_db.assign_match("match-1", "ref-1", utc_now())
 
+        assert assigned == {"match_id": "match-1", "round_id": "round-1", "status": "ASSIGNED"}
         match = temp_db.get_match("match-1")
         assert match["referee_id"] == "ref-1"
         assert match["status"] == "ASSIGNED"
 
+    def test_unassign_matches(self, temp_db, sample_league_id):
+        """Test an assignment is undone only while it is still ours and unstarted."""
+        temp_db.create_league(sample_league_id, "ACTIVE", utc_now(), {})
+        temp_db.create_round("round-1", sample_league_id, 1)
+        for match_id in ("match-1", "match-2", "match-3"):
+            temp_db.create_match(match_id, "round-1", "tic_tac_toe", players=["alice", "bob"])
+            temp_db.assign_match(match_id, "ref-1", utc_now())
+        temp_db.update_match_status("match-2", "IN_PROGRESS")
+
+        released = temp_db.unassign_matches(
+            [("match-1", "ref-1"), ("match-2", "ref-1"), ("match-3", "ref-2")]
+        )
+
+        assert released == 1
+        match = temp_db.get_match("match-1")
+        assert (match["status"], match["referee_id"], match["assigned_at"]) == (
+            "PENDING",
+            None,
+            None,
+        )
+        assert temp_db.get_match("match-2")["status"] == "IN_PROGRESS"
+        assert temp_db.get_match("match-3")["status"] == "ASSIGNED"
+
+    def test_assign_match_only_when_pending(self, temp_db, sample_league_id):
+        """Test a second assignment of the same match is a no-op."""
+        temp_db.create_league(sample_league_id, "ACTIVE", utc_now(), {})
+        temp_db.create_round("round-1", sample_league_id, 1)
+        temp_db.create_match("match-1", "round-1", "tic_tac_toe", players=["alice", "bob"])
+        temp_db.assign_match("match-1", "ref-1", utc_now())
+
+        assert temp_db.assign_match("match-1", "ref-2", utc_now()) is None
+        assert temp_db.assign_match("missing", "ref-2", utc_now()) is None
+        assert temp_db.get_match("match-1")["referee_id"] == "ref-1"
+
     def test_update_match_status(self, temp_db, sample_league_id):
         """Test updating match status."""
         temp_db.create_league(sample_league_id, "ACTIVE", utc_now(), {})
@@ -359,6 +584,55 @@ class TestStandingsOperations:
         assert standings["rankings"][0]["player_id"] == "alice"
         assert standings["rankings"][1]["player_id"] == "bob"
 
+    def test_write_snapshot(self, temp_db, sample_league_id):
+        """Test storing a snapshot with its rankings in one call."""
+        temp_db.create_league(sample_league_id, "ACTIVE", utc_now(), {})
+
+        temp_db.write_snapshot(
+            "snapshot-1",
+            sample_league_id,
+            None,
+            utc_now(),
+            [
+                (
+                    "bob",
+                    PlayerRanking(rank=2, points=1, wins=0, draws=1, losses=0, matches_played=1),
+                ),
+                (
+                    "alice",
+                    PlayerRanking(rank=1, points=3, wins=1, draws=0, losses=0, matches_played=1),
+                ),
+            ],
+        )
+
+        standings = temp_db.get_standings(sample_league_id)
+        assert standings["snapshot_id"] == "snapshot-1"
+        assert [r["player_id"] for r in standings["rankings"]] == ["alice", "bob"]
+
+    def test_get_standings_latest_snapshot_for_round(self, temp_db, sample_league_id):
+        """Test round filtering and that an empty snapshot is still returned."""
+        temp_db.create_league(sample_league_id, "ACTIVE", utc_now(), {})
+        temp_db.create_standings_snapshot(
+            "snapshot-1", sample_league_id, "round-1", "2024-01-01T00:00:00Z"
+        )
+        temp_db.store_player_ranking(
+            "snapshot-1",
+            "alice",
+            PlayerRanking(rank=1, points=3, wins=1, draws=0, losses=0, matches_played=1),
+        )
+        temp_db.create_standings_snapshot(
+            "snapshot-2", sample_league_id, "round-2", "2024-01-02T00:00:00Z"
+        )
+
+        round_one = temp_db.get_standings(sample_league_id, "round-1")
+        assert round_one["snapshot_id"] == "snapshot-1"
+        assert round_one["rankings"][0]["points"] == 3
+
+        latest = temp_db.get_standings(sample_league_id)
+        assert latest["snapshot_id"] == "snapshot-2"
+        assert latest["rankings"] == []
+        assert temp_db.get_standings("other-league") is None
+
 
 class TestTransactions:
     """Tests for database transactions."""
@@ -393,3 +667,115 @@ class TestTransactions:
         # Verify data was NOT committed
         league = temp_db.get_league(sample_league_id)
         assert league is None
+
+
+class TestBackgroundWriter:
+    """Tests for status updates committed by the background writer."""
+
+    def test_update_without_waiting(self, temp_db, sample_league_id):
+        """Test wait=False returns a future that resolves once committed."""
+        temp_db.create_league(sample_league_id, "REGISTRATION", utc_now(), {})
+
+        future = temp_db.update_league_status(sample_league_id, "ACTIVE", wait=False)
+
+        assert future.result(timeout=5) is None
+        assert temp_db.get_league(sample_league_id)["status"] == "ACTIVE"
+
+    def test_failed_update_only_fails_its_caller(self, temp_db, sample_league_id):
+        """Test a bad statement queued with good ones does not roll them back."""
+        temp_db.create_league(sample_league_id, "ACTIVE", utc_now(), {})
+        temp_db.register_players(
+            [
+                ("alice", sample_league_id, "token-1", utc_now(), None),
+                ("bob", sample_league_id, "token-2", utc_now(), None),
+            ]
+        )
+
+        # Hold the writer back so the updates queue up together
+        with temp_db._write_lock:
+            first = temp_db.update_player_status("alice", "ACTIVE", wait=False)
+            bad = temp_db.update_player_status("bob", "NOT_A_STATUS", wait=False)
+            last = temp_db.update_player_status("bob", "SUSPENDED", wait=False)
+
+        first.result(timeout=5)
+        last.result(timeout=5)
+        with pytest.raises(DatabaseError):
+            bad.result(timeout=5)
+        assert temp_db.get_player("alice")["status"] == "ACTIVE"
+        assert temp_db.get_player("bob")["status"] == "SUSPENDED"
+
+    def test_update_inside_transaction_runs_inline(self, temp_db, sample_league_id):
+        """Test a status update from within transaction() does not deadlock."""
+        temp_db.create_league(sample_league_id, "REGISTRATION", utc_now(), {})
+
+        with temp_db.transaction():
+            temp_db.update_league_status(sample_league_id, "ACTIVE")
+
+        assert temp_db.get_league(sample_league_id)["status"] == "ACTIVE"
+
+    def test_update_inside_transaction_rolls_back_with_it(self, temp_db, sample_league_id):
+        """Test an inline update is not committed ahead of its outer transaction."""
+        temp_db.create_league(sample_league_id, "REGISTRATION", utc_now(), {})
+        assert temp_db.get_league(sample_league_id)["status"] == "REGISTRATION"
+
+        with pytest.raises(DatabaseError):
+            with temp_db.transaction() as conn:
+                conn.execute(
+                    "INSERT INTO leagues (league_id, status, created_at, config) VALUES (?, ?, ?, ?)",
+                    ("other-league", "INIT", utc_now(), "{}"),
+                )
+                temp_db.update_league_status(sample_league_id, "ACTIVE")
+                raise ValueError("Test error")
+
+        assert temp_db.get_league("other-league") is None
+        assert temp_db.get_league(sample_league_id)["status"] == "REGISTRATION"
+
+    def test_failed_inline_update_keeps_outer_transaction(self, temp_db, sample_league_id):
+        """Test a failing inline update does not undo the outer transaction's statements."""
+        with temp_db.transaction() as conn:
+            conn.execute(
+                "INSERT INTO leagues (league_id, status, created_at, config) VALUES (?, ?, ?, ?)",
+                (sample_league_id, "INIT", utc_now(), "{}"),
+            )
+            with pytest.raises(DatabaseError):
+                temp_db.update_league_status(sample_league_id, "NOT_A_STATUS")
+
+        assert temp_db.get_league(sample_league_id)["status"] == "INIT"
+
+    def test_update_inside_bulk_load_runs_inline(self, tmp_path, sample_league_id):
+        """Test a status update from within bulk_load() does not deadlock."""
+        db = LeagueDatabase(str(tmp_path / "league.db"))
+        db.initialize_schema()
+        db.create_league(sample_league_id, "REGISTRATION", utc_now(), {})
+
+        def load():
+            with db.bulk_load():
+                db.update_league_status(sample_league_id, "ACTIVE")
+
+        # Run in a daemon thread so a regression fails instead of hanging;
+        # a deadlocked database is left open, as close() would block too
+        loader = threading.Thread(target=load, daemon=True)
+        loader.start()
+        loader.join(timeout=5)
+        assert not loader.is_alive()
+
+        assert db.get_league(sample_league_id)["status"] == "ACTIVE"
+        db.close()
+
+    def test_close_flushes_queued_updates(self, tmp_path, sample_league_id):
+        """Test close() commits updates that were still queued."""
+        path = str(tmp_path / "league.db")
+        db = LeagueDatabase(path)
+        db.initialize_schema()
+        db.create_league(sample_league_id, "REGISTRATION", utc_now(), {})
+        future = db.update_league_status(sample_league_id, "ACTIVE", wait=False)
+        db.close()
+
+        assert future.done()
+        reopened = LeagueDatabase(path)
+        try:
+            assert reopened.get_league(sample_league_id)["status"] == "ACTIVE"
+            with pytest.raises(DatabaseError):
+                db.update_league_status(sample_league_id, "COMPLETED")
+        finally:
+            reopened.close()
@@ -4,7 +4,10 @@ This module tests the protocol layer including envelope validation,
 message types, and JSON-RPC structures.
 """
 
+import dataclasses
+import json
 import uuid
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
@@ -21,6 +24,8 @@ from src.common.protocol import (
     create_success_response,
     generate_conversation_id,
     generate_message_id,
+    generate_uuid4_batch,
+    lookup_message_type,
     utc_now,
     validate_sender_format,
     validate_timestamp,
@@ -52,6 +57,13 @@ class TestEnvelope:
         assert "timestamp" in result
         assert "conversation_id" in result
 
+    def test_envelope_is_immutable(self, sample_envelope_data):
+        """Test that envelope fields cannot be reassigned."""
+        envelope = Envelope.from_dict(sample_envelope_data)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            envelope.sender = "player:bob"
+
     def test_envelope_excludes_none_values(self):
         """Test that envelope dictionary excludes None values."""
         envelope = Envelope(
@@ -146,6 +158,16 @@ class TestMessageType:
         with pytest.raises(ValueError):
             MessageType("NOT_A_REAL_MESSAGE")
 
+    def test_lookup_message_type(self):
+        """Test looking up members by value without constructing the enum."""
+        for msg_type in MessageType:
+            assert lookup_message_type(msg_type.value) is msg_type
+
+        for bad in ("NOT_A_REAL_MESSAGE", ["GAME_OVER"]):
+            with pytest.raises(ProtocolError) as exc_info:
+                lookup_message_type(bad)
+            assert exc_info.value.code == ErrorCode.INVALID_MESSAGE_TYPE
+
 
 class TestValidationFunctions:
     """Tests for validation helper functions."""
@@ -194,6 +216,7 @@ class TestValidationFunctions:
             "2025-12-21T10:30:00Z",
             "2025-12-21T10:30:00+00:00",
             "2025-01-01T00:00:00Z",
+            "2024-02-29T23:59:59.123456Z",  # Leap day takes the full parse
         ]
 
         for ts in valid_timestamps:
@@ -206,6 +229,9 @@ class TestValidationFunctions:
             "not-a-timestamp",
             "2025-12-21T10:30:00",  # Missing timezone
             "2025-12-21T10:30:00-05:00",  # Not UTC
+            "2025-13-21T10:30:00Z",  # Canonical shape, invalid month
+            "2025-02-30T10:30:00Z",  # Canonical shape, invalid day
+            "2025-12-21T24:00:00Z",  # Canonical shape, invalid hour
         ]
 
         for ts in invalid_timestamps:
@@ -247,6 +273,12 @@ class TestJSONRPCRequest:
         assert result["method"] == "league.handle"
         assert "params" in result
 
+    def test_jsonrpc_request_to_json_bytes(self, sample_jsonrpc_request):
+        """Test direct serialization matches to_dict()."""
+        request = JSONRPCRequest.from_dict(sample_jsonrpc_request)
+
+        assert json.loads(request.to_json_bytes()) == request.to_dict()
+
     def test_jsonrpc_request_invalid_version(self, sample_jsonrpc_request):
         """Test that invalid JSON-RPC version raises error."""
         sample_jsonrpc_request["jsonrpc"] = "1.0"
@@ -309,6 +341,19 @@ class TestJSONRPCResponse:
         assert result["id"] == "test-id"
         assert "result" not in result
 
+    @pytest.mark.parametrize(
+        "response",
+        [
+            JSONRPCResponse(jsonrpc="2.0", result={"status": "ok"}, id="test-id"),
+            JSONRPCResponse(jsonrpc="2.0", error={"code": 4000}, id=None),
+            JSONRPCResponse(jsonrpc="2.0", result={}, error={"code": 4000}, id="test-id"),
+            JSONRPCResponse(jsonrpc="2.0", id="test-id"),
+        ],
+    )
+    def test_jsonrpc_response_to_json_bytes(self, response):
+        """Test direct serialization matches to_dict() for every response shape."""
+        assert json.loads(response.to_json_bytes()) == response.to_dict()
+
 
 class TestHelperFunctions:
     """Tests for helper functions."""
@@ -372,11 +417,39 @@ class TestHelperFunctions:
         # Should be valid timestamp
         validate_timestamp(timestamp)
 
+    def test_utc_now_matches_clock(self):
+        """Test that the cached prefix tracks the current UTC time."""
+        before = datetime.now(timezone.utc)
+        parsed = datetime.fromisoformat(utc_now().replace("Z", "+00:00"))
+        after = datetime.now(timezone.utc)
+
+        assert before - timedelta(seconds=1) <= parsed <= after + timedelta(seconds=1)
+
     def test_generated_ids_are_unique(self):
         """Test that generated IDs are unique."""
         ids = [generate_conversation_id() for _ in range(100)]
         assert len(ids) == len(set(ids))
 
+    def test_generated_ids_are_uuid4_across_pool_refills(self):
+        """Test that pooled IDs stay canonical UUID v4 strings past a pool refill."""
+        for _ in range(200):
+            conv_id = generate_conversation_id()
+            parsed = uuid.UUID(conv_id)
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+            assert str(parsed) == conv_id
+
+    def test_generate_uuid4_batch(self):
+        """Test batch-generated IDs are distinct canonical UUID v4 strings."""
+        ids = generate_uuid4_batch(50)
+
+        assert len(ids) == len(set(ids)) == 50
+        for value in ids:
+            parsed = uuid.UUID(value)
+            assert parsed.version == 4
+            assert str(parsed) == value
+        assert generate_uuid4_batch(0) == []
+
 
 class TestConstants:
     """Tests for protocol constants."""
@@ -0,0 +1,106 @@
+"""Tests for the strategy and game registries."""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from src.common.registry import GameRegistry, Registry, StrategyRegistry
+from src.player.strategies.tic_tac_toe_random import TicTacToeRandomStrategy
+
+
+class TestRegistry:
+    """Tests for Registry lookups."""
+
+    def test_getitem_and_contains(self):
+        """Test mapping-style access to registered classes."""
+        registry = Registry("Test")
+        registry.register("random", TicTacToeRandomStrategy)
+
+        assert "random" in registry
+        assert "smart" not in registry
+        assert registry["random"] is TicTacToeRandomStrategy
+        with pytest.raises(KeyError):
+            registry["smart"]
+
+    def test_keys_are_interned(self):
+        """Test runtime-built keys are stored interned and still found."""
+        registry = Registry("Test")
+        key = "".join(["ran", "dom"])
+        registry.register(key, TicTacToeRandomStrategy)
+
+        assert registry.list_keys()[0] is sys.intern("random")
+        assert registry.get("".join(["ran", "dom"])) is TicTacToeRandomStrategy
+
+    def test_mapping_access_interns_keys(self):
+        """Test [] and `in` look keys up through sys.intern like get() does."""
+        registry = Registry("Test")
+        registry.register("random", TicTacToeRandomStrategy)
+        key = "".join(["ran", "dom"])
+
+        with patch("src.common.registry.sys.intern", wraps=sys.intern) as intern:
+            assert registry[key] is TicTacToeRandomStrategy
+            assert key in registry
+            assert 1 not in registry
+
+        assert [c.args for c in intern.call_args_list] == [(key,), (key,)]
+
+    def test_get_or_raise_lists_available_keys(self):
+        """Test a missing key raises ValueError naming the registered keys."""
+        registry = Registry("Test")
+        registry.register("random", TicTacToeRandomStrategy)
+
+        with pytest.raises(ValueError, match="Available: \\['random'\\]"):
+            registry.get_or_raise("smart")
+
+    def test_register_as_decorator(self):
+        """Test the decorator registers the class and returns it unchanged."""
+        registry = Registry("Test")
+
+        @registry.register_as("dummy")
+        class Dummy:
+            pass
+
+        assert registry.get("dummy") is Dummy
+
+    def test_seal_keeps_lookups_and_blocks_changes(self):
+        """Test a sealed registry still resolves keys but rejects mutation."""
+        registry = Registry("Test")
+        registry.register("random", TicTacToeRandomStrategy)
+        registry.seal()
+
+        assert registry.sealed
+        assert registry.get_or_raise("random") is TicTacToeRandomStrategy
+        assert registry.list_keys() == ["random"]
+        with pytest.raises(RuntimeError, match="sealed"):
+            registry.register("smart", TicTacToeRandomStrategy)
+        with pytest.raises(RuntimeError, match="sealed"):
+            registry.clear()
+
+
+class TestStrategyRegistry:
+    """Tests for StrategyRegistry."""
+
+    def test_create_strategy(self):
+        """Test creating a registered strategy."""
+        registry = StrategyRegistry()
+        registry.register_strategy("random", TicTacToeRandomStrategy)
+
+        strategy = registry.create_strategy("random", "alice")
+
+        assert isinstance(strategy, TicTacToeRandomStrategy)
+        assert strategy.player_id == "alice"
+
+    def test_create_unknown_strategy(self):
+        """Test creating an unregistered strategy raises ValueError."""
+        with pytest.raises(ValueError, match="StrategyRegistry"):
+            StrategyRegistry().create_strategy("smart", "alice")
+
+
+class TestGameRegistry:
+    """Tests for GameRegistry."""
+
+    def test_create_unknown_game(self):
+        """Test creating an unregistered game raises ValueError."""
+        with pytest.raises(ValueError, match="GameRegistry"):
+            GameRegistry().create_game("chess", ["alice", "bob"])
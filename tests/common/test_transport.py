@@ -4,10 +4,12 @@ This module tests the HTTP server and client implementations
 for JSON-RPC communication.
 """
 
+import http.client
 import json
+import socket
 import threading
 import time
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -21,7 +23,30 @@ from src.common.protocol import (
     generate_conversation_id,
     utc_now,
 )
-from src.common.transport import LeagueHTTPClient, LeagueHTTPServer
+from src.common.transport import LeagueHTTPClient, LeagueHTTPHandler, LeagueHTTPServer
+
+
+def _query_envelope() -> Envelope:
+    """Build a standings query envelope."""
+    return Envelope(
+        protocol="league.v2",
+        message_type=MessageType.QUERY_STANDINGS.value,
+        sender="player:alice",
+        timestamp=utc_now(),
+        conversation_id=generate_conversation_id(),
+    )
+
+
+def _echo_handler(request: JSONRPCRequest) -> JSONRPCResponse:
+    """Answer every request with an empty success response."""
+    envelope = Envelope(
+        protocol="league.v2",
+        message_type=MessageType.STANDINGS_RESPONSE.value,
+        sender="league_manager",
+        timestamp=utc_now(),
+        conversation_id=generate_conversation_id(),
+    )
+    return create_success_response(envelope, {}, request.id)
 
 
 class TestLeagueHTTPServer:
@@ -102,6 +127,23 @@ class TestLeagueHTTPServer:
         finally:
             server.stop()
 
+    def test_server_status_without_provider(self):
+        """Test that status reports unknown when no provider is configured."""
+        server = LeagueHTTPServer("localhost", 9983, Mock())
+        server.start()
+        time.sleep(0.1)
+
+        try:
+            conn = http.client.HTTPConnection("localhost", 9983)
+            conn.request("GET", "/status")
+            response = conn.getresponse()
+            body = json.loads(response.read())
+
+            assert response.status == 200
+            assert body == {"status": "unknown"}
+        finally:
+            server.stop()
+
 
 class TestLeagueHTTPClient:
     """Tests for LeagueHTTPClient."""
@@ -151,6 +193,113 @@ class TestLeagueHTTPClient:
         finally:
             server.stop()
 
+    def test_client_reuses_connection(self):
+        """Test consecutive requests to one host share a kept-alive connection."""
+        server = LeagueHTTPServer("localhost", 9987, _echo_handler)
+        server.start()
+        time.sleep(0.1)
+
+        client = LeagueHTTPClient()
+        try:
+            with patch(
+                "src.common.transport.http.client.HTTPConnection",
+                wraps=http.client.HTTPConnection,
+            ) as connection_cls:
+                for _ in range(3):
+                    client.send_request("http://localhost:9987/mcp", _query_envelope(), {})
+
+            assert connection_cls.call_count == 1
+        finally:
+            client.close()
+            server.stop()
+
+    def test_client_send_requests_batch(self):
+        """Test a batch overlaps its requests and reports failures per entry."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def message_handler(request: JSONRPCRequest) -> JSONRPCResponse:
+            """Only return once all three batch requests are in flight."""
+            barrier.wait()
+            return _echo_handler(request)
+
+        server = LeagueHTTPServer("localhost", 9982, message_handler)
+        server.start()
+        time.sleep(0.1)
+
+        client = LeagueHTTPClient(timeout=10)
+        try:
+            results = client.send_requests_batch(
+                [("http://localhost:9982/mcp", _query_envelope(), {}) for _ in range(3)]
+                + [("http://localhost:9981/mcp", _query_envelope(), {})]
+            )
+
+            assert len(results) == 4
+            assert all("payload" in result for result in results[:3])
+            assert isinstance(results[3], ProtocolError)
+            assert results[3].code == ErrorCode.COMMUNICATION_ERROR
+            assert not barrier.broken
+        finally:
+            client.close()
+            server.stop()
+
+    def test_idle_connections_do_not_hold_workers(self):
+        """Test clients beyond max_workers are served while others keep idle connections."""
+        server = LeagueHTTPServer("localhost", 9980, _echo_handler, max_workers=2)
+        server.start()
+        time.sleep(0.1)
+
+        clients = [LeagueHTTPClient(timeout=10) for _ in range(4)]
+        try:
+            for client in clients:
+                started = time.monotonic()
+                client.send_request("http://localhost:9980/mcp", _query_envelope(), {})
+                assert time.monotonic() - started < 1
+
+            # Every client kept its connection and can reuse it
+            for client in clients:
+                assert client.send_request("http://localhost:9980/mcp", _query_envelope(), {})
+        finally:
+            for client in clients:
+                client.close()
+            server.stop()
+
+    def test_client_retries_connection_closed_by_server(self):
+        """Test a pooled connection dropped by the server is replaced transparently."""
+        client = LeagueHTTPClient()
+        server = LeagueHTTPServer("localhost", 9986, _echo_handler)
+        server.start()
+        time.sleep(0.1)
+        try:
+            client.send_request("http://localhost:9986/mcp", _query_envelope(), {})
+        finally:
+            server.stop()
+
+        # Same port, new server: the pooled connection is now dead
+        server = LeagueHTTPServer("localhost", 9986, _echo_handler)
+        server.start()
+        time.sleep(0.1)
+        try:
+            result = client.send_request("http://localhost:9986/mcp", _query_envelope(), {})
+            assert "payload" in result
+        finally:
+            client.close()
+            server.stop()
+
+    def test_client_does_not_resend_after_reset(self):
+        """Test a reused connection reset mid-request is not retried."""
+        client = LeagueHTTPClient()
+        stale = Mock()
+        stale.getresponse.side_effect = ConnectionResetError("reset by peer")
+        client._checkin(("localhost", 9999), stale)
+
+        with patch("src.common.transport.http.client.HTTPConnection") as connection_class:
+            with pytest.raises(ProtocolError) as exc_info:
+                client.send_request("http://localhost:9999/mcp", _query_envelope(), {})
+
+        assert exc_info.value.code == ErrorCode.COMMUNICATION_ERROR
+        stale.request.assert_called_once()
+        connection_class.assert_not_called()
+
     def test_client_send_request_with_error_response(self):
         """Test handling error response from server."""
 
@@ -266,6 +415,101 @@ class TestLeagueHTTPHandler:
         finally:
             server.stop()
 
+    def test_handler_returns_404_for_unknown_post_path(self):
+        """Test that POSTs outside /mcp return 404 without reaching the handler."""
+        handler = Mock()
+        server = LeagueHTTPServer("localhost", 9984, handler)
+        server.start()
+        time.sleep(0.1)
+
+        try:
+            conn = http.client.HTTPConnection("localhost", 9984)
+            conn.request("POST", "/health", b"{}", {"Content-Type": "application/json"})
+            response = conn.getresponse()
+
+            assert response.status == 404
+            handler.assert_not_called()
+        finally:
+            server.stop()
+
+    def test_handler_rejects_malformed_bodies(self):
+        """Test invalid JSON and non-object bodies get JSON-RPC errors, not HTTP 500."""
+        handler = Mock()
+        server = LeagueHTTPServer("localhost", 9985, handler)
+        server.start()
+        time.sleep(0.1)
+
+        try:
+            for body in (b"{not json", b"[1, 2]"):
+                conn = http.client.HTTPConnection("localhost", 9985)
+                conn.request("POST", "/mcp", body, {"Content-Type": "application/json"})
+                response = conn.getresponse()
+                data = json.loads(response.read())
+                conn.close()
+
+                assert response.status == 200
+                assert data["error"]["code"] == ErrorCode.INVALID_JSON_RPC
+                assert data["id"] is None
+            handler.assert_not_called()
+        finally:
+            server.stop()
+
+    def test_handler_serves_pipelined_requests(self):
+        """Test requests sent back to back on one connection all get a response."""
+        server = LeagueHTTPServer("localhost", 9979, _echo_handler)
+        server.start()
+        time.sleep(0.1)
+
+        body = JSONRPCRequest(
+            jsonrpc="2.0",
+            method="league.handle",
+            params={"envelope": _query_envelope().to_dict(), "payload": {}},
+            id="req-1",
+        ).to_json_bytes()
+        request = (
+            b"POST /mcp HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+            b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+        )
+        try:
+            with socket.create_connection(("localhost", 9979), timeout=5) as sock:
+                sock.sendall(request * 2)
+                reader = sock.makefile("rb")
+                for _ in range(2):
+                    assert reader.readline().startswith(b"HTTP/1.1 200")
+                    headers = http.client.parse_headers(reader)
+                    data = json.loads(reader.read(int(headers["Content-Length"])))
+                    assert data["id"] == "req-1"
+        finally:
+            server.stop()
+
+    def test_handler_waits_for_slow_body(self):
+        """Test a body arriving after the keep-alive timeout is still read."""
+        server = LeagueHTTPServer("localhost", 9978, _echo_handler)
+        server.start()
+        time.sleep(0.1)
+
+        body = JSONRPCRequest(
+            jsonrpc="2.0",
+            method="league.handle",
+            params={"envelope": _query_envelope().to_dict(), "payload": {}},
+            id="req-1",
+        ).to_json_bytes()
+        try:
+            with patch.object(LeagueHTTPHandler, "timeout", 0.2):
+                conn = http.client.HTTPConnection("localhost", 9978, timeout=5)
+                conn.putrequest("POST", "/mcp")
+                conn.putheader("Content-Length", str(len(body)))
+                conn.endheaders()
+                time.sleep(0.5)
+                conn.send(body)
+                response = conn.getresponse()
+
+                assert response.status == 200
+                assert json.loads(response.read())["id"] == "req-1"
+                conn.close()
+        finally:
+            server.stop()
+
     def test_handler_rejects_non_post_to_mcp(self):
         """Test that GET requests to /mcp are rejected."""
         handler = Mock()
@@ -393,3 +637,49 @@ class TestEndToEndCommunication:
             assert request_count["count"] == 5
         finally:
             server.stop()
+
+    def test_requests_handled_in_parallel(self):
+        """Test that a slow handler does not block other requests."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def message_handler(request: JSONRPCRequest) -> JSONRPCResponse:
+            """Only return once a second request is in flight."""
+            barrier.wait()
+            envelope = Envelope(
+                protocol="league.v2",
+                message_type=MessageType.STANDINGS_RESPONSE.value,
+                sender="league_manager",
+                timestamp=utc_now(),
+                conversation_id=generate_conversation_id(),
+            )
+            return create_success_response(envelope, {}, request.id)
+
+        server = LeagueHTTPServer("localhost", 9988, message_handler, max_workers=2)
+        server.start()
+        time.sleep(0.1)
+
+        results = []
+
+        def send_request():
+            envelope = Envelope(
+                protocol="league.v2",
+                message_type=MessageType.QUERY_STANDINGS.value,
+                sender="player:alice",
+                timestamp=utc_now(),
+                conversation_id=generate_conversation_id(),
+            )
+            results.append(
+                LeagueHTTPClient(timeout=10).send_request("http://localhost:9988/mcp", envelope, {})
+            )
+
+        try:
+            threads = [threading.Thread(target=send_request) for _ in range(2)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            assert len(results) == 2
+            assert not barrier.broken
+        finally:
+            server.stop()
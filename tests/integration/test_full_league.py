@@ -322,12 +322,12 @@ class TestFullLeagueWorkflow:
 
         # Verify tokens work
         ref_info = auth_manager.validate_token(ref_token)
-        assert ref_info["agent_id"] == "ref-1"
-        assert ref_info["agent_type"] == AgentType.REFEREE.value
+        assert ref_info.agent_id == "ref-1"
+        assert ref_info.agent_type == AgentType.REFEREE.value
 
         player_info = auth_manager.validate_token(player_token)
-        assert player_info["agent_id"] == "alice"
-        assert player_info["agent_type"] == AgentType.PLAYER.value
+        assert player_info.agent_id == "alice"
+        assert player_info.agent_type == AgentType.PLAYER.value
 
         # Verify sender verification works
         auth_manager.verify_sender(ref_token, "referee:ref-1")
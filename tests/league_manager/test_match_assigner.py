@@ -0,0 +1,193 @@
+"""Tests for match assignment.
+
+This module tests handing pending matches to active referees.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.common.errors import ErrorCode, OperationalError, ProtocolError
+from src.common.protocol import MessageType, utc_now
+from src.league_manager.match_assigner import MatchAssigner
+from src.league_manager.scheduler import RoundRobinScheduler
+
+
+class TestMatchAssigner:
+    """Tests for MatchAssigner class."""
+
+    @pytest.fixture
+    def league_id(self, temp_db, sample_league_id, sample_player_ids):
+        """Create an active league with two referees and a full schedule."""
+        temp_db.create_league(sample_league_id, "ACTIVE", utc_now(), {})
+        for referee_id in ("ref-1", "ref-2"):
+            temp_db.register_referee(
+                referee_id,
+                sample_league_id,
+                auth_token=f"token-{referee_id}",
+                registered_at=utc_now(),
+                endpoint_url=f"http://{referee_id}/mcp",
+            )
+            temp_db.update_referee_status(referee_id, "ACTIVE")
+        for player_id in sample_player_ids:
+            temp_db.register_player(
+                player_id,
+                sample_league_id,
+                auth_token=f"token-{player_id}",
+                registered_at=utc_now(),
+                endpoint_url=f"http://{player_id}/mcp",
+            )
+        RoundRobinScheduler(temp_db).generate_schedule(
+            sample_league_id, sample_player_ids, "tic_tac_toe"
+        )
+        return sample_league_id
+
+    @pytest.fixture
+    def http_client(self):
+        """Create an HTTP client whose batch sends all succeed."""
+        client = Mock()
+        client.send_requests_batch.side_effect = lambda requests: [{} for _ in requests]
+        return client
+
+    def test_assign_pending_matches_sends_one_batch(self, temp_db, league_id, http_client):
+        """Test every pending match is assigned and sent in a single batch."""
+        assigner = MatchAssigner(temp_db, http_client)
+
+        assignments = assigner.assign_pending_matches(league_id)
+
+        assert len(assignments) == 6
+        assert temp_db.get_pending_matches(league_id) == []
+        http_client.send_requests_batch.assert_called_once()
+        http_client.send_request.assert_not_called()
+
+        (requests,) = http_client.send_requests_batch.call_args.args
+        url, envelope, payload = requests[0]
+        assert url == f"http://{assignments[0]['referee_id']}/mcp"
+        assert envelope.message_type == MessageType.MATCH_ASSIGNMENT.value
+        assert payload["player_endpoints"] == {p: f"http://{p}/mcp" for p in payload["players"]}
+
+    def test_assign_pending_matches_prefetches_players(self, temp_db, league_id, http_client):
+        """Test player endpoints come from one bulk lookup, not one query per seat."""
+        with patch.object(temp_db, "get_player") as get_player, patch.object(
+            temp_db, "get_referee"
+        ) as get_referee:
+            assignments = MatchAssigner(temp_db, http_client).assign_pending_matches(league_id)
+
+        assert len(assignments) == 6
+        get_player.assert_not_called()
+        get_referee.assert_not_called()
+
+    def test_assign_pending_matches_alternates_referees(self, temp_db, league_id, http_client):
+        """Test matches are spread round-robin over the active referees."""
+        assignments = MatchAssigner(temp_db, http_client).assign_pending_matches(league_id)
+
+        referee_ids = [a["referee_id"] for a in assignments]
+        assert referee_ids.count("ref-1") == referee_ids.count("ref-2") == 3
+
+    def test_failed_send_is_left_out(self, temp_db, league_id, http_client):
+        """Test a failed send is left out of the result and the match is pending again."""
+        error = ProtocolError(ErrorCode.COMMUNICATION_ERROR, "down")
+        failed = []
+
+        def send_requests_batch(requests):
+            failed.append(requests[0][2]["match_id"])
+            return [error] + [{} for _ in requests[1:]]
+
+        http_client.send_requests_batch.side_effect = send_requests_batch
+
+        assignments = MatchAssigner(temp_db, http_client).assign_pending_matches(league_id)
+
+        assert len(assignments) == 5
+        assert failed[0] not in {a["match_id"] for a in assignments}
+        pending = temp_db.get_pending_matches(league_id)
+        assert [m["match_id"] for m in pending] == failed
+        assert pending[0]["referee_id"] is None
+        assert pending[0]["assigned_at"] is None
+
+    def test_failed_single_send_returns_match_to_pending(self, temp_db, league_id, http_client):
+        """Test assign_match puts the match back when the referee cannot be reached."""
+        http_client.send_request.side_effect = ProtocolError(ErrorCode.COMMUNICATION_ERROR, "down")
+        match = temp_db.get_pending_matches(league_id)[0]
+
+        with pytest.raises(OperationalError):
+            MatchAssigner(temp_db, http_client).assign_match(
+                match["match_id"], "ref-1", match["game_type"], match["players"]
+            )
+
+        assert temp_db.get_match(match["match_id"])["status"] == "PENDING"
+
+    def test_no_active_referees(self, temp_db, league_id, http_client):
+        """Test nothing is assigned while no referee is active."""
+        for referee_id in ("ref-1", "ref-2"):
+            temp_db.update_referee_status(referee_id, "REGISTERED")
+
+        assert MatchAssigner(temp_db, http_client).assign_pending_matches(league_id) == []
+        http_client.send_requests_batch.assert_not_called()
+
+    def test_referee_cache_follows_invalidation(self, temp_db, league_id, http_client):
+        """Test active referees are cached per league and refreshed per referee."""
+        assigner = MatchAssigner(temp_db, http_client)
+        assigner.refresh_referees(league_id)
+
+        temp_db.update_referee_status("ref-2", "SUSPENDED")
+        assigner.invalidate_referee("ref-2")
+
+        with patch.object(temp_db, "get_all_referees") as get_all_referees:
+            assignments = assigner.assign_pending_matches(league_id)
+
+        get_all_referees.assert_not_called()
+        assert {a["referee_id"] for a in assignments} == {"ref-1"}
+
+    def test_failed_match_keeps_rotation(self, temp_db, league_id, http_client):
+        """Test a match that cannot be claimed does not shift later referees."""
+        assigner = MatchAssigner(temp_db, http_client)
+        pending = temp_db.get_pending_matches(league_id)
+        temp_db.assign_match(pending[0]["match_id"], "ref-1", utc_now())
+
+        with patch.object(temp_db, "iter_pending_matches", return_value=iter([pending])):
+            assignments = assigner.assign_pending_matches(league_id)
+
+        assert [a["match_id"] for a in assignments] == [m["match_id"] for m in pending[1:]]
+        assert [a["referee_id"] for a in assignments] == [
+            "ref-2",
+            "ref-1",
+            "ref-2",
+            "ref-1",
+            "ref-2",
+        ]
+
+    def test_referee_availability(self, temp_db, http_client):
+        """Test busy/idle marks per referee, with unknown referees available."""
+        assigner = MatchAssigner(temp_db, http_client)
+
+        assert assigner.is_referee_available("ref-1")
+
+        assigner.mark_referee_busy("ref-1")
+        assigner.mark_referee_busy("ref-2")
+        assigner.mark_referee_idle("ref-1")
+
+        assert assigner.is_referee_available("ref-1")
+        assert not assigner.is_referee_available("ref-2")
+        assert assigner.is_referee_available("ref-3")
+
+    def test_busy_referees_are_skipped(self, temp_db, league_id, http_client):
+        """Test a pass only hands matches to referees that are idle."""
+        assigner = MatchAssigner(temp_db, http_client)
+        assigner.mark_referee_busy("ref-1")
+
+        assignments = assigner.assign_pending_matches(league_id)
+
+        assert len(assignments) == 6
+        assert {a["referee_id"] for a in assignments} == {"ref-2"}
+
+        assigner.mark_referee_busy("ref-2")
+        assert assigner.assign_pending_matches(league_id) == []
+
+    def test_matches_sent_in_batches(self, temp_db, league_id, http_client):
+        """Test each batch is prefetched and sent separately, keeping the rotation."""
+        with patch("src.league_manager.match_assigner.ASSIGN_BATCH_SIZE", 4):
+            assignments = MatchAssigner(temp_db, http_client).assign_pending_matches(league_id)
+
+        batch_sizes = [len(c.args[0]) for c in http_client.send_requests_batch.call_args_list]
+        assert batch_sizes == [4, 2]
+        assert [a["referee_id"] for a in assignments] == ["ref-1", "ref-2"] * 3
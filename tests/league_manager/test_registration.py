@@ -156,8 +156,8 @@ class TestRegistrationHandler:
 
         # Verify token
         ref_info = auth_manager.validate_token(ref_token)
-        assert ref_info["agent_id"] == "ref-1"
-        assert ref_info["agent_type"] == AgentType.REFEREE.value
+        assert ref_info.agent_id == "ref-1"
+        assert ref_info.agent_type == AgentType.REFEREE.value
 
         # Register player
         player_result = registration_handler.register_player("alice", sample_player_envelope)
@@ -165,5 +165,5 @@ class TestRegistrationHandler:
 
         # Verify token
         player_info = auth_manager.validate_token(player_token)
-        assert player_info["agent_id"] == "alice"
-        assert player_info["agent_type"] == AgentType.PLAYER.value
+        assert player_info.agent_id == "alice"
+        assert player_info.agent_type == AgentType.PLAYER.value
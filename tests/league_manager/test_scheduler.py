@@ -3,8 +3,11 @@
 This module tests deterministic round-robin scheduling.
 """
 
+from unittest.mock import patch
+
 import pytest
 
+from src.common.errors import DatabaseError
 from src.common.protocol import utc_now
 from src.league_manager.scheduler import RoundRobinScheduler
 
@@ -138,6 +141,16 @@ class TestRoundRobinScheduler:
                 assert match_data["game_type"] == "tic_tac_toe"
                 assert set(match_data["players"]) == set(match["players"])
 
+    def test_failed_match_insert_leaves_no_rounds(self, scheduler, league_with_players, temp_db):
+        """Test rounds and matches are stored in one transaction."""
+        players = ["alice", "bob", "charlie", "dave"]
+
+        with patch.object(temp_db, "create_matches", side_effect=RuntimeError("disk full")):
+            with pytest.raises(DatabaseError):
+                scheduler.generate_schedule(league_with_players, players, "tic_tac_toe")
+
+        assert temp_db.conn.execute("SELECT COUNT(*) FROM rounds").fetchone()[0] == 0
+
     def test_schedule_large_group(self, scheduler, league_with_players):
         """Test scheduling with larger group of players."""
         players = [f"player-{i}" for i in range(10)]
@@ -155,6 +168,18 @@ class TestRoundRobinScheduler:
 
         assert len(all_pairs) == 45
 
+    @pytest.mark.parametrize("n, expected_rounds", [(2, 1), (3, 3), (4, 3), (7, 7), (10, 9)])
+    def test_schedule_uses_minimum_rounds(self, scheduler, league_with_players, n, expected_rounds):
+        """Test the circle method needs n-1 rounds for even n and n for odd n."""
+        players = [f"player-{i}" for i in range(n)]
+        schedule = scheduler.generate_schedule(league_with_players, players, "tic_tac_toe")
+
+        assert schedule["total_rounds"] == expected_rounds
+        assert all(len(r["matches"]) == n // 2 for r in schedule["rounds"])
+        for round_info in schedule["rounds"]:
+            for match in round_info["matches"]:
+                assert match["players"] == sorted(match["players"])
+
     def test_schedule_round_numbers_sequential(self, scheduler, league_with_players):
         """Test that round numbers are sequential starting from 1."""
         players = ["alice", "bob", "charlie", "dave"]
@@ -5,7 +5,12 @@ This module tests player move computation strategies.
 
 import pytest
 
-from src.common.tic_tac_toe_utils import would_win
+from src.common.tic_tac_toe_utils import (
+    board_to_bits,
+    get_available_moves,
+    would_win,
+    would_win_bits,
+)
 from src.player.strategies.tic_tac_toe_random import TicTacToeRandomStrategy
 from src.player.strategies.tic_tac_toe_smart import TicTacToeSmartStrategy
 
@@ -169,6 +174,40 @@ class TestTicTacToeStrategy:
 
         assert would_win(board, 2, 0, "X")
 
+    def test_would_win_ignores_opponent_marks(self):
+        """Test a line mixing marks is not a win."""
+        board = [["X", "O", ""], ["", "", ""], ["", "", ""]]
+
+        assert not would_win(board, 0, 2, "X")
+
+    def test_would_win_leaves_board_unchanged(self):
+        """Test the probed cell is restored after the check."""
+        board = [["X", "X", ""], ["", "", ""], ["", "", ""]]
+
+        assert would_win(board, 0, 2, "X")
+        assert board == [["X", "X", ""], ["", "", ""], ["", "", ""]]
+
+    def test_get_available_moves(self):
+        """Test empty cells are listed in row-major order."""
+        board = [["X", "", "O"], ["", "X", ""], ["O", "", "X"]]
+
+        assert get_available_moves(board) == ((0, 1), (1, 0), (1, 2), (2, 1))
+        assert get_available_moves([["X"] * 3] * 3) == ()
+
+    def test_board_to_bits(self):
+        """Test bitboard encoding uses bit row * 3 + col."""
+        board = [["X", "", ""], ["", "O", ""], ["", "", "X"]]
+
+        assert board_to_bits(board, "X") == 0b100000001
+        assert board_to_bits(board, "O") == 0b000010000
+
+    def test_would_win_bits(self):
+        """Test bitboard win detection for a completing and a non-completing move."""
+        mask = 0b000000011  # X at (0, 0) and (0, 1)
+
+        assert would_win_bits(mask, 2)
+        assert not would_win_bits(mask, 4)
+
     def test_different_players_get_different_marks(self):
         """Test that strategy works for both X and O."""
         strategy_x = TicTacToeStrategy("alice")